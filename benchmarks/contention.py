@@ -0,0 +1,126 @@
+# benchmarks/contention.py
+"""
+Бенчмарк конкуренции за мост.
+
+Все машины подъезжают одновременно, симуляция идет на виртуальных часах,
+поэтому измеряется только стоимость синхронизации. Сравнивается передача
+моста эстафетой (Bridge) с прежней схемой, где после каждого проезда
+вызывался notify_all и все ожидающие потоки заново проверяли can_cross,
+и с пропуском колоннами (Bridge с platoon_size).
+
+С --crossing-time машины едут на реальных часах с заданным временем
+проезда, а накладные расходы на машину — это время прогона сверх
+суммарного времени проезда: задержка передачи моста между машинами.
+
+Запуск: python -m benchmarks.contention --cars 100 500 1000
+        python -m benchmarks.contention --cars 500 --crossing-time 0.002
+"""
+import argparse
+import logging
+import threading
+import time
+from functools import partial
+from typing import Dict, List, Optional, Tuple
+from src.models.bridge import Bridge
+from src.models.direction import Direction
+from src.simulation.scheduler import CarScheduler
+from src.utils.clock import RealClock, VirtualClock
+
+
+class BroadcastBridge(Bridge):
+    """Прежняя схема: после каждого проезда будятся все ожидающие машины"""
+
+    def __init__(self, priority_direction: Optional[Direction] = None, clock=None):
+        super().__init__(priority_direction, clock=clock)
+        self.condition = threading.Condition(self.lock)
+
+    def cross(self, car_id: int, direction: Direction, arrival_time: Optional[float] = None,
+              crossing_time: Optional[float] = None) -> Tuple[float, float]:
+        if arrival_time is None:
+            arrival_time = self.clock.now()
+
+        with self.lock:
+            self.enqueue(car_id, direction, arrival_time)
+            ready = self.can_cross(car_id, direction)
+            while not ready:
+                self.clock.wait(self.condition)
+                ready = self.can_cross(car_id, direction)
+                self.sync_stats.record_wakeup(not ready)
+            wait_time = self.admit(car_id, direction, arrival_time, self.clock.now())
+
+        if crossing_time is None:
+            crossing_time = self.crossing_time
+        self.clock.sleep(crossing_time)
+
+        with self.lock:
+            self.release(direction, crossing_time)
+            self.clock.notify_all(self.condition)
+
+        return crossing_time, wait_time
+
+
+BRIDGES = {
+    'handoff': Bridge,
+    'notify_all': BroadcastBridge,
+    'platoon': partial(Bridge, platoon_size=3),
+}
+
+
+def run_case(bridge_cls, num_cars: int, crossing_time: Optional[float] = None) -> Dict:
+    """
+    Прогоняет num_cars одновременно подъехавших машин.
+    crossing_time: время проезда на реальных часах; None — виртуальные часы
+    """
+    cars_data = [
+        (0.0, i, Direction.LEFT_TO_RIGHT if i % 2 == 0 else Direction.RIGHT_TO_LEFT)
+        for i in range(num_cars)
+    ]
+    bridge = bridge_cls(clock=VirtualClock() if crossing_time is None else RealClock())
+    if crossing_time is not None:
+        bridge.crossing_time = crossing_time
+    scheduler = CarScheduler(cars_data, bridge)
+
+    start = time.perf_counter()
+    scheduler.run()
+    scheduler.wait_completion(timeout=600.0)
+    elapsed = time.perf_counter() - start
+
+    stats = bridge.get_statistics()
+    crossed = stats['total_crossed']
+    sync = stats['synchronization']
+    overhead = elapsed - crossed * (crossing_time or 0.0)
+    return {
+        'cars': num_cars,
+        'seconds': elapsed,
+        'crossings_per_second': crossed / elapsed if elapsed else 0.0,
+        'overhead_us': overhead / crossed * 1e6 if crossed else 0.0,
+        'locks_per_crossing': sync['lock_acquisitions'] / crossed if crossed else 0.0,
+        'can_cross_per_crossing': sync['can_cross_per_crossing'],
+        'spurious_wakeups': sync['spurious_wakeups'],
+        'avg_lock_wait_us': sync['avg_lock_wait_us'],
+    }
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description='Bridge lock contention benchmark')
+    parser.add_argument('--cars', type=int, nargs='+', default=[100, 250, 500, 1000],
+                        help='Numbers of simultaneously arriving cars')
+    parser.add_argument('--crossing-time', type=float,
+                        help='Run on the real clock with this crossing time in seconds')
+    args = parser.parse_args(argv)
+
+    logging.disable(logging.INFO)
+
+    print(f"{'mode':<12}{'cars':>8}{'seconds':>10}{'cross/s':>12}{'overhead us':>13}{'locks/cross':>13}"
+          f"{'can_cross/cross':>18}{'spurious':>10}{'lock us':>10}")
+    for num_cars in args.cars:
+        for mode, bridge_cls in BRIDGES.items():
+            result = run_case(bridge_cls, num_cars, args.crossing_time)
+            print(f"{mode:<12}{result['cars']:>8}{result['seconds']:>10.3f}"
+                  f"{result['crossings_per_second']:>12.0f}{result['overhead_us']:>13.1f}"
+                  f"{result['locks_per_crossing']:>13.2f}{result['can_cross_per_crossing']:>18.2f}"
+                  f"{result['spurious_wakeups']:>10}{result['avg_lock_wait_us']:>10.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,295 @@
+# benchmarks/run.py
+"""
+Набор бенчмарков производительности симуляторов.
+
+Измеряет скорость самих симуляторов, а не качество расписания:
+машин в секунду, стоимость одного проезда (передачи моста) в
+многопоточной реализации и пиковое потребление памяти (RSS). Каждый
+случай запускается в отдельном процессе, чтобы пиковый RSS относился
+только к нему. Входные данные генерируются с фиксированным зерном.
+
+Результаты пишутся в JSON (по умолчанию во временный каталог) и сравниваются с сохраненной базой
+(benchmarks/baseline.json). Если метрика ухудшилась больше порога,
+команда завершается с ненулевым кодом.
+
+Запуск:
+    python -m benchmarks.run                      # быстрый профиль, сравнение с базой
+    python -m benchmarks.run --profile full       # до 1e6 машин
+    python -m benchmarks.run --update-baseline    # перезаписать базу
+"""
+import argparse
+import atexit
+import json
+import logging
+import os
+import platform
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+from src.models.bridge import Bridge
+from src.models.direction import Direction
+from src.simulation.event_driven import EventDrivenBridge
+from src.simulation.scheduler import CarScheduler
+from src.simulation.single_threaded import SingleThreadedBridge
+from src.utils.clock import VirtualClock
+from src.utils.input_reader import InputReader
+from src.utils.statistics import CrossingStatistics
+
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+# Результаты прогона — временный файл, в дереве репозитория хранится только база
+OUTPUT = os.path.join(tempfile.gettempdir(), 'benchmark_results.json')
+SEED = 12345
+MIN_TOTAL_SECONDS = 0.3
+
+# Средний интервал между машинами чуть больше времени проезда,
+# поэтому очереди то растут, то рассасываются
+MEAN_INTERARRIVAL = 1.1
+
+# Метрика -> True, если больше — лучше
+METRICS = {
+    'cars_per_second': True,
+    'handoff_us': False,
+    'peak_rss_mb': False,
+}
+
+# Случаи по профилям: бенчмарк -> размеры
+PROFILES = {
+    'quick': {
+        'single': [100, 10_000],
+        'event': [100, 10_000],
+        'threaded': [100, 1_000],
+        'input_reader': [100, 10_000],
+        'statistics': [100, 10_000],
+    },
+    'full': {
+        'single': [100, 10_000, 1_000_000],
+        'event': [100, 10_000, 1_000_000],
+        'threaded': [100, 1_000, 10_000],
+        'input_reader': [100, 10_000, 1_000_000],
+        'statistics': [100, 10_000, 1_000_000],
+    },
+}
+
+
+def generate_cars(num_cars: int, seed: int = SEED) -> List[Tuple[float, int, Direction]]:
+    """Пуассоновский поток машин в случайных направлениях"""
+    rng = random.Random(seed)
+    arrival_time = 0.0
+    cars_data = []
+    for car_id in range(num_cars):
+        arrival_time += rng.expovariate(1 / MEAN_INTERARRIVAL)
+        cars_data.append((arrival_time, car_id, rng.choice((Direction.LEFT_TO_RIGHT, Direction.RIGHT_TO_LEFT))))
+    return cars_data
+
+
+# Бенчмарк готовит данные и возвращает функцию прогона и, если есть,
+# функцию расчета стоимости одного проезда по времени прогона
+Benchmark = Tuple[Callable[[], None], Optional[Callable[[float], float]]]
+
+
+def bench_single(num_cars: int) -> Benchmark:
+    cars_data = generate_cars(num_cars)
+    return lambda: SingleThreadedBridge().simulate(cars_data), None
+
+
+def bench_event(num_cars: int) -> Benchmark:
+    cars_data = generate_cars(num_cars)
+    return lambda: EventDrivenBridge().simulate(cars_data), None
+
+
+def bench_threaded(num_cars: int) -> Benchmark:
+    """Bridge + CarScheduler на виртуальных часах: измеряется только синхронизация"""
+    cars_data = generate_cars(num_cars)
+    bridges = []
+
+    def run():
+        bridge = Bridge(clock=VirtualClock())
+        scheduler = CarScheduler(cars_data, bridge)
+        scheduler.run()
+        scheduler.wait_completion(timeout=600.0)
+        bridges.append(bridge)
+
+    def handoff_us(seconds: float) -> float:
+        crossed = bridges[-1].get_statistics()['total_crossed']
+        return seconds / crossed * 1e6 if crossed else 0.0
+
+    return run, handoff_us
+
+
+def bench_input_reader(num_cars: int) -> Benchmark:
+    handle, path = tempfile.mkstemp(suffix='.csv')
+    with os.fdopen(handle, 'w') as file:
+        file.write('arrival_time,car_id,direction\n')
+        for arrival_time, car_id, direction in generate_cars(num_cars):
+            file.write(f'{arrival_time:.3f},{car_id},{direction.value}\n')
+
+    # Случай выполняется в своем процессе, файл удаляется при его завершении
+    atexit.register(os.unlink, path)
+
+    def run():
+        for _ in InputReader.iter_cars_data(path):
+            pass
+
+    return run, None
+
+
+def bench_statistics(num_cars: int) -> Benchmark:
+    rng = random.Random(SEED)
+    records = [(rng.choice((Direction.LEFT_TO_RIGHT, Direction.RIGHT_TO_LEFT)), rng.expovariate(0.5))
+               for _ in range(num_cars)]
+
+    def run():
+        statistics = CrossingStatistics()
+        for direction, wait_time in records:
+            statistics.record_wait(direction, wait_time)
+            statistics.record_crossing(direction, 1.0)
+        statistics.get_statistics()
+
+    return run, None
+
+
+BENCHMARKS = {
+    'single': bench_single,
+    'event': bench_event,
+    'threaded': bench_threaded,
+    'input_reader': bench_input_reader,
+    'statistics': bench_statistics,
+}
+
+
+def measure(name: str, num_cars: int, repeat: int) -> Dict:
+    """Выполняет случай в текущем процессе (лучший из нескольких запусков)"""
+    run, handoff = BENCHMARKS[name](num_cars)
+
+    # Маленькие случаи повторяются, пока не наберется MIN_TOTAL_SECONDS,
+    # иначе шум таймера и планировщика ОС больше самого измерения
+    best = float('inf')
+    attempts, total = 0, 0.0
+    while attempts < repeat or total < MIN_TOTAL_SECONDS:
+        start = time.perf_counter()
+        run()
+        elapsed = time.perf_counter() - start
+        best = min(best, elapsed)
+        attempts += 1
+        total += elapsed
+
+    result = {
+        'cars': num_cars,
+        'seconds': best,
+        'cars_per_second': num_cars / best if best else 0.0,
+        # ru_maxrss на Linux в килобайтах
+        'peak_rss_mb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    }
+    if handoff:
+        result['handoff_us'] = handoff(best)
+    return result
+
+
+def run_in_subprocess(name: str, num_cars: int, repeat: int) -> Dict:
+    """Запускает случай в отдельном процессе, чтобы пиковый RSS был только его"""
+    output = subprocess.run(
+        [sys.executable, '-m', 'benchmarks.run', '--child', name, str(num_cars), '--repeat', str(repeat)],
+        check=True, capture_output=True, text=True,
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def compare(results: Dict, baseline: Dict, threshold: float) -> List[str]:
+    """Список регрессий относительно базы"""
+    regressions = []
+    for case, metrics in results.items():
+        base = baseline.get(case)
+        if base is None:
+            continue
+        for metric, higher_is_better in METRICS.items():
+            if metric not in metrics or metric not in base or not base[metric]:
+                continue
+            ratio = metrics[metric] / base[metric]
+            if (ratio < 1 - threshold) if higher_is_better else (ratio > 1 + threshold):
+                regressions.append(
+                    f"{case} {metric}: {metrics[metric]:.4g} vs baseline {base[metric]:.4g} ({ratio - 1:+.0%})"
+                )
+    return regressions
+
+
+def print_results(results: Dict, baseline: Dict):
+    print(f"{'case':<24}{'cars/s':>14}{'handoff us':>12}{'peak MB':>10}{'vs base':>10}")
+    for case, metrics in results.items():
+        base = baseline.get(case, {})
+        change = ''
+        if base.get('cars_per_second'):
+            change = f"{metrics['cars_per_second'] / base['cars_per_second'] - 1:+.0%}"
+        handoff = f"{metrics['handoff_us']:.1f}" if 'handoff_us' in metrics else '-'
+        print(f"{case:<24}{metrics['cars_per_second']:>14.0f}{handoff:>12}"
+              f"{metrics['peak_rss_mb']:>10.1f}{change:>10}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='Simulator performance benchmarks')
+    parser.add_argument('--profile', choices=sorted(PROFILES), default='quick',
+                        help='Set of benchmark sizes')
+    parser.add_argument('--only', nargs='+', choices=sorted(BENCHMARKS),
+                        help='Run only these benchmarks')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='Minimum runs per case, the best one is reported')
+    parser.add_argument('--output', type=str, default=OUTPUT,
+                        help='JSON file for the results (default: %(default)s)')
+    parser.add_argument('--baseline', type=str, default=BASELINE,
+                        help='Baseline JSON to compare against')
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help='Allowed relative regression before failing')
+    parser.add_argument('--update-baseline', action='store_true',
+                        help='Store the results as the new baseline')
+    parser.add_argument('--child', nargs=2, metavar=('BENCHMARK', 'CARS'), help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        name, num_cars = args.child
+        logging.disable(logging.INFO)
+        print(json.dumps(measure(name, int(num_cars), args.repeat)))
+        return 0
+
+    results = {}
+    for name, sizes in PROFILES[args.profile].items():
+        if args.only and name not in args.only:
+            continue
+        for num_cars in sizes:
+            results[f'{name}:{num_cars}'] = run_in_subprocess(name, num_cars, args.repeat)
+
+    report = {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'profile': args.profile,
+        'results': results,
+    }
+    with open(args.output, 'w') as file:
+        json.dump(report, file, indent=2)
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as file:
+            baseline = json.load(file)['results']
+    print_results(results, baseline)
+
+    if args.update_baseline:
+        with open(args.baseline, 'w') as file:
+            json.dump(report, file, indent=2)
+        print(f"Baseline updated: {args.baseline}")
+        return 0
+
+    regressions = compare(results, baseline, args.threshold)
+    if regressions:
+        print(f"\nRegressions beyond {args.threshold:.0%}:")
+        for regression in regressions:
+            print(f"  {regression}")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,25 @@
+import argparse
+from src.utils.arrival_format import convert_csv
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Convert a CSV arrival file to the binary columnar format')
+    parser.add_argument('input_file', type=str, help='CSV file with car arrival times')
+    parser.add_argument('output_file', type=str, help='Binary arrival file to create')
+    parser.add_argument(
+        '--chunk-size',
+        type=int,
+        default=1_000_000,
+        help='Number of CSV rows parsed at once'
+    )
+    return parser.parse_args()
+
+def main():
+    args = parse_args()
+    count = convert_csv(args.input_file, args.output_file, args.chunk_size)
+    logger.info(f"Converted {count} cars to {args.output_file}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+import argparse
+import time
+from src.utils.workload import DEFAULT_CHUNK_SIZE, WorkloadGenerator, parse_process, write_binary, write_csv
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Generate a synthetic sorted arrival file')
+    parser.add_argument('output_file', type=str, help='Arrival file to create')
+    parser.add_argument(
+        '--cars',
+        type=int,
+        default=1_000_000,
+        help='Number of cars'
+    )
+    parser.add_argument(
+        '--process',
+        type=str,
+        default='poisson:1.0',
+        help='Arrival process: poisson:<rate>, rush:<base>,<peak>[,<period>], '
+             'nhpp:<bin_width>,<rate>,... or mmpp:<quiet_rate>,<burst_rate>,<quiet_mean>,<burst_mean>'
+    )
+    parser.add_argument(
+        '--left-share',
+        type=float,
+        default=0.5,
+        help='Share of cars travelling left to right'
+    )
+    parser.add_argument(
+        '--seed',
+        type=int,
+        default=0,
+        help='Seed of the random generators'
+    )
+    parser.add_argument(
+        '--format',
+        choices=['csv', 'binary'],
+        default='csv',
+        help='Output format: CSV or the binary columnar arrival format'
+    )
+    parser.add_argument(
+        '--chunk-size',
+        type=int,
+        default=DEFAULT_CHUNK_SIZE,
+        help='Number of cars generated and written at once'
+    )
+    return parser.parse_args()
+
+def main():
+    args = parse_args()
+    generator = WorkloadGenerator(parse_process(args.process), args.left_share, args.seed, args.chunk_size)
+    write = write_binary if args.format == 'binary' else write_csv
+
+    start_time = time.time()
+    count = write(args.output_file, generator.chunks(args.cars))
+    logger.info(f"Generated {count} cars to {args.output_file} in {time.time() - start_time:.2f} seconds")
+
+if __name__ == "__main__":
+    main()
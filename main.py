@@ -1,14 +1,31 @@
 import argparse
+import asyncio
+import itertools
+import logging
 import time
+from typing import Iterator, Optional, Tuple
 from src.models.direction import Direction
 from src.models.bridge import Bridge
+from src.models.async_bridge import AsyncBridge
+from src.models.policy import POLICIES, SchedulingPolicy, get_policy
 from src.simulation.scheduler import CarScheduler
+from src.simulation.pool_scheduler import PooledCarScheduler
+from src.simulation.async_scheduler import AsyncCarScheduler
 from src.simulation.single_threaded import SingleThreadedBridge
+from src.simulation.event_driven import EventDrivenBridge
+from src.utils.clock import RealClock, VirtualClock, VirtualEventLoop
+from src.utils.crossing_time import CrossingTimeSampler, assign_crossing_times, parse_distribution
 from src.utils.input_reader import InputReader
-from src.utils.logger import get_logger
+from src.utils.logger import configure_logging, get_logger
+from src.utils.performance import profiler
+from src.utils.result_cache import ResultCache, cache_key, default_cache_dir, hash_file
+from src.utils.trace import TraceRecorder
 
 logger = get_logger(__name__)
 
+# Сколько ждать проезда всех машин в многопоточном режиме и в пуле
+SIMULATION_TIMEOUT = 120.0
+
 def parse_args():
     parser = argparse.ArgumentParser(description='Bridge Crossing Simulation')
     parser.add_argument(
@@ -22,47 +39,241 @@ def parse_args():
         choices=['left_to_right', 'right_to_left'],
         help='Priority direction for crossing'
     )
+    parser.add_argument(
+        '--policy',
+        choices=list(POLICIES),
+        default='alternating',
+        help='Scheduling policy: alternate after MAX_CONSECUTIVE cars, first come first served, '
+             'strict priority or longest queue first'
+    )
     parser.add_argument(
         '--mode',
-        choices=['single', 'multi'],
+        choices=['single', 'multi', 'pool', 'async', 'event'],
         default='multi',
-        help='Simulation mode: single-threaded or multi-threaded'
+        help='Simulation mode: single-threaded, multi-threaded, worker pool, asyncio or discrete-event'
+    )
+    parser.add_argument(
+        '--clock',
+        choices=['real', 'virtual'],
+        default='real',
+        help='Clock for the multi-threaded, pool and asyncio modes: wall time or virtual time'
+    )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=8,
+        help='Number of worker threads in the pool mode'
+    )
+    parser.add_argument(
+        '--capacity',
+        type=int,
+        default=1,
+        help='Maximum number of same-direction cars on the bridge at once (all modes except async)'
+    )
+    parser.add_argument(
+        '--headway',
+        type=float,
+        default=0.0,
+        help='Minimum time in seconds between two same-direction cars entering the bridge'
+    )
+    parser.add_argument(
+        '--platoon-size',
+        type=int,
+        help='Multi-threaded and pool modes: admit up to N same-direction cars as one convoy'
+    )
+    parser.add_argument(
+        '--crossing-time-dist',
+        type=str,
+        help='Crossing time distribution for cars without a crossing_time column: '
+             'deterministic:1.0, exponential:1.0, lognormal:1.0,0.5 or empirical:<file>'
+    )
+    parser.add_argument(
+        '--seed',
+        type=int,
+        default=0,
+        help='Seed for sampling crossing times'
+    )
+    parser.add_argument(
+        '--trace',
+        type=str,
+        help='Record a binary trace of bridge events to this file (replay it with replay.py)'
+    )
+    parser.add_argument(
+        '--log-queue',
+        action='store_true',
+        help='Write log records from a background thread in batches instead of synchronously'
+    )
+    parser.add_argument(
+        '--car-log-level',
+        choices=['debug', 'info', 'warning'],
+        default='info',
+        help='Level of per-car messages (warning silences them)'
+    )
+    parser.add_argument(
+        '--car-log-sample',
+        type=int,
+        default=1,
+        help='Log per-car messages only for every N-th car'
+    )
+    parser.add_argument(
+        '--profile',
+        action='store_true',
+        help='Profile the simulation and print a call tree of timed spans'
     )
-    return parser.parse_args()
+    parser.add_argument(
+        '--profile-sample',
+        type=int,
+        default=1,
+        help='Profile only every N-th top-level span (e.g. every N-th car crossing)'
+    )
+    parser.add_argument(
+        '--profile-output',
+        type=str,
+        help='Write the profile to this file: *.json for speedscope, otherwise folded stacks for flamegraph.pl'
+    )
+    parser.add_argument(
+        '--cache-dir',
+        type=str,
+        default=default_cache_dir(),
+        help='Directory of the simulation result cache'
+    )
+    parser.add_argument(
+        '--cache-size-mb',
+        type=float,
+        default=256,
+        help='Maximum size of the result cache; least recently used results are evicted'
+    )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Always run the simulation instead of reusing a cached result'
+    )
+    args = parser.parse_args()
+    if args.mode == 'async' and (args.capacity != 1 or args.headway):
+        parser.error('--capacity and --headway are not supported in the async mode')
+    return args
+
+def read_arrivals(input_file: str, crossing_times: Optional[CrossingTimeSampler] = None
+                  ) -> Optional[Iterator[Tuple[float, int, Direction]]]:
+    """
+    Лениво читает машины из входного файла; None, если машин нет.
+    crossing_times: генератор времени проезда для машин без колонки crossing_time
+    """
+    cars_data = InputReader.iter_cars_data(input_file)
+    first = next(cars_data, None)
+    if first is None:
+        logger.error("No cars data found in input file")
+        return None
+    cars_data = itertools.chain([first], cars_data)
+    if crossing_times is not None:
+        cars_data = assign_crossing_times(cars_data, crossing_times)
+    return cars_data
 
-def simulate_traffic_single(input_file: str, priority_direction: Direction = None):
+def simulate_traffic_single(input_file: str, priority_direction: Direction = None,
+                            crossing_times: Optional[CrossingTimeSampler] = None,
+                            policy: Optional[SchedulingPolicy] = None,
+                            trace: Optional[TraceRecorder] = None,
+                            capacity: int = 1, headway: float = 0.0):
     """Запуск однопоточной симуляции"""
     # Читаем данные о машинах
-    cars_data = InputReader.read_cars_data(input_file)
-    if not cars_data:
-        logger.error("No cars data found in input file")
+    cars_data = read_arrivals(input_file, crossing_times)
+    if cars_data is None:
         return None
         
     # Создаем мост и запускаем симуляцию
-    bridge = SingleThreadedBridge(priority_direction)
+    bridge = SingleThreadedBridge(priority_direction, policy=policy, trace=trace,
+                                  capacity=capacity, headway=headway)
     return bridge.simulate(cars_data)
 
-def simulate_traffic_multi(input_file: str, priority_direction: Direction = None):
+def simulate_traffic_event(input_file: str, priority_direction: Direction = None,
+                           crossing_times: Optional[CrossingTimeSampler] = None,
+                           policy: Optional[SchedulingPolicy] = None,
+                           trace: Optional[TraceRecorder] = None,
+                           capacity: int = 1, headway: float = 0.0):
+    """Запуск дискретно-событийной симуляции"""
+    cars_data = read_arrivals(input_file, crossing_times)
+    if cars_data is None:
+        return None
+
+    bridge = EventDrivenBridge(priority_direction, policy=policy, trace=trace,
+                               capacity=capacity, headway=headway)
+    return bridge.simulate(cars_data)
+
+def simulate_traffic_multi(input_file: str, priority_direction: Direction = None, virtual_clock: bool = False,
+                           crossing_times: Optional[CrossingTimeSampler] = None,
+                           policy: Optional[SchedulingPolicy] = None,
+                           trace: Optional[TraceRecorder] = None,
+                           platoon_size: Optional[int] = None,
+                           capacity: int = 1, headway: float = 0.0):
     """Запуск многопоточной симуляции"""
-    bridge = Bridge(priority_direction)
+    clock = VirtualClock() if virtual_clock else RealClock()
+    bridge = Bridge(priority_direction, clock=clock, policy=policy, trace=trace, platoon_size=platoon_size,
+                    capacity=capacity, headway=headway)
     
     # Читаем данные о машинах
-    cars_data = InputReader.read_cars_data(input_file)
-    if not cars_data:
-        logger.error("No cars data found in input file")
+    cars_data = read_arrivals(input_file, crossing_times)
+    if cars_data is None:
         return None
     
     # Создаем планировщик и запускаем симуляцию
     scheduler = CarScheduler(cars_data, bridge)
     scheduler.run()
     
-    if not scheduler.wait_completion(timeout=120.0):
+    if not scheduler.wait_completion(timeout=SIMULATION_TIMEOUT):
         logger.warning("Simulation timeout reached before all cars completed")
-    else:
-        logger.info("All cars have completed their crossing")
+        # Неполная статистика выводится, но не кэшируется
+        return dict(bridge.get_statistics(), timed_out=True)
+    logger.info("All cars have completed their crossing")
     
     return bridge.get_statistics()
 
+def simulate_traffic_pool(input_file: str, priority_direction: Direction = None,
+                          virtual_clock: bool = False, workers: int = 8,
+                          crossing_times: Optional[CrossingTimeSampler] = None,
+                          policy: Optional[SchedulingPolicy] = None,
+                          trace: Optional[TraceRecorder] = None,
+                          platoon_size: Optional[int] = None,
+                          capacity: int = 1, headway: float = 0.0):
+    """Запуск симуляции с пулом обработчиков вместо потока на машину"""
+    clock = VirtualClock() if virtual_clock else RealClock()
+    bridge = Bridge(priority_direction, clock=clock, policy=policy, trace=trace, platoon_size=platoon_size,
+                    capacity=capacity, headway=headway)
+
+    cars_data = read_arrivals(input_file, crossing_times)
+    if cars_data is None:
+        return None
+
+    scheduler = PooledCarScheduler(cars_data, bridge, max_workers=workers)
+    scheduler.run()
+
+    if not scheduler.wait_completion(timeout=SIMULATION_TIMEOUT):
+        logger.warning("Simulation timeout reached before all cars completed")
+        return dict(bridge.get_statistics(), timed_out=True)
+    logger.info("All cars have completed their crossing")
+
+    return bridge.get_statistics()
+
+def simulate_traffic_async(input_file: str, priority_direction: Direction = None, virtual_clock: bool = False,
+                           crossing_times: Optional[CrossingTimeSampler] = None,
+                           policy: Optional[SchedulingPolicy] = None,
+                           trace: Optional[TraceRecorder] = None):
+    """Запуск симуляции с машинами-корутинами"""
+    cars_data = read_arrivals(input_file, crossing_times)
+    if cars_data is None:
+        return None
+
+    bridge = AsyncBridge(priority_direction, policy, trace)
+    scheduler = AsyncCarScheduler(cars_data, bridge)
+
+    loop = VirtualEventLoop() if virtual_clock else asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(scheduler.run())
+    finally:
+        loop.close()
+
+    logger.info("All cars have completed their crossing")
+    return bridge.get_statistics()
+
 def print_statistics(stats: dict):
     """Вывод статистики симуляции"""
     logger.info("\nSimulation statistics:")
@@ -70,35 +281,133 @@ def print_statistics(stats: dict):
     logger.info(f"Average crossing time: {stats['avg_crossing_time']:.2f} seconds")
     logger.info(f"Average waiting time: {stats['avg_waiting_time']:.2f} seconds")
     logger.info(f"Maximum waiting time: {stats['max_waiting_time']:.2f} seconds")
+    logger.info(f"Waiting time p50/p95/p99: {stats['p50_waiting_time']:.2f} / "
+                f"{stats['p95_waiting_time']:.2f} / {stats['p99_waiting_time']:.2f} seconds")
     
     for direction, dir_stats in stats['direction_stats'].items():
         logger.info(f"\nDirection {direction}:")
         logger.info(f"Cars crossed: {dir_stats['total_crossed']}")
         logger.info(f"Average waiting time: {dir_stats['avg_waiting_time']:.2f} seconds")
+        logger.info(f"Waiting time p95: {dir_stats['p95_waiting_time']:.2f} seconds")
+
+    throughput = stats.get('throughput')
+    if throughput is not None:
+        logger.info(f"\nBridge capacity {throughput['capacity']} (headway {throughput['headway']:.2f}s): "
+                    f"{throughput['cars_per_second']:.3f} cars/s, "
+                    f"throughput gain vs capacity 1: {throughput['throughput_gain']:.2f}x")
+
+def cache_params(args) -> dict:
+    """Параметры прогона, от которых зависит результат (часть ключа кэша)"""
+    params = {
+        'mode': args.mode,
+        'policy': args.policy,
+        'priority_direction': args.priority_direction,
+        'max_consecutive': 3,
+        'crossing_time': 1.0,
+        'crossing_time_dist': args.crossing_time_dist,
+        'seed': args.seed if args.crossing_time_dist else None,
+        'capacity': args.capacity,
+        'headway': args.headway,
+    }
+    if args.crossing_time_dist and args.crossing_time_dist.startswith('empirical:'):
+        params['crossing_time_file'] = hash_file(args.crossing_time_dist.split(':', 1)[1])
+    if args.mode in ('multi', 'pool', 'async'):
+        params['clock'] = args.clock
+    if args.mode == 'pool':
+        params['workers'] = args.workers
+    if args.mode in ('multi', 'pool') and args.platoon_size:
+        params['platoon_size'] = args.platoon_size
+    return params
 
 def main():
     args = parse_args()
+    configure_logging(
+        use_queue=args.log_queue,
+        car_level=getattr(logging, args.car_log_level.upper()),
+        car_sample_every=args.car_log_sample
+    )
+
+    crossing_times = None
+    if args.crossing_time_dist:
+        crossing_times = CrossingTimeSampler(parse_distribution(args.crossing_time_dist), args.seed)
     
     priority_direction = None
     if args.priority_direction:
         priority_direction = Direction(args.priority_direction)
+    policy = get_policy(args.policy)
+
+    trace = None
+    if args.trace:
+        metadata = {
+            'mode': args.mode,
+            'policy': args.policy,
+            'priority_direction': args.priority_direction,
+            'max_consecutive': 3,
+            'capacity': args.capacity,
+            'headway': args.headway,
+        }
+        if args.mode in ('multi', 'pool') and args.platoon_size:
+            metadata['platoon_size'] = args.platoon_size
+        trace = TraceRecorder(args.trace, metadata=metadata)
     
+    if args.profile or args.profile_output:
+        profiler.enable(args.profile_sample)
+
+    # Трасса и профиль требуют настоящего прогона
+    cache = key = params = None
+    if not (args.no_cache or trace or profiler.enabled):
+        cache = ResultCache(args.cache_dir, int(args.cache_size_mb * 1024 * 1024))
+        params = cache_params(args)
+        key = cache_key(hash_file(args.input_file), params)
+        cached = cache.get(key)
+        if cached is not None:
+            logger.info(f"Using cached result {key[:12]} from {args.cache_dir}")
+            print_statistics(cached['stats'])
+            return
+
     logger.info("Running simulation...")
     start_time = time.time()
     
     if args.mode == 'single':
-        stats = simulate_traffic_single(args.input_file, priority_direction)
+        stats = simulate_traffic_single(args.input_file, priority_direction, crossing_times, policy, trace,
+                                        args.capacity, args.headway)
+    elif args.mode == 'pool':
+        stats = simulate_traffic_pool(args.input_file, priority_direction, args.clock == 'virtual',
+                                      args.workers, crossing_times, policy, trace, args.platoon_size,
+                                      args.capacity, args.headway)
+    elif args.mode == 'async':
+        stats = simulate_traffic_async(args.input_file, priority_direction, args.clock == 'virtual',
+                                       crossing_times, policy, trace)
+    elif args.mode == 'event':
+        stats = simulate_traffic_event(args.input_file, priority_direction, crossing_times, policy, trace,
+                                       args.capacity, args.headway)
     else:
-        stats = simulate_traffic_multi(args.input_file, priority_direction)
+        stats = simulate_traffic_multi(args.input_file, priority_direction, args.clock == 'virtual',
+                                       crossing_times, policy, trace, args.platoon_size,
+                                       args.capacity, args.headway)
+
+    if trace is not None:
+        trace.close()
+        logger.info(f"Trace of {trace.count} events written to {args.trace}")
         
     if not stats:
         logger.error("Simulation failed")
         return
     
     total_time = time.time() - start_time
+    if stats.get('timed_out'):
+        logger.warning("Statistics are incomplete and will not be cached")
+    elif cache is not None:
+        cache.put(key, stats, params=params)
     
     print_statistics(stats)
     logger.info(f"\nTotal simulation time: {total_time:.2f} seconds")
 
+    if profiler.enabled:
+        logger.info("\nProfile:\n" + profiler.report())
+        if args.profile_output:
+            profiler.export(args.profile_output)
+            logger.info(f"Profile written to {args.profile_output}")
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
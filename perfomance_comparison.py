@@ -1,55 +1,85 @@
-import random
-from typing import List, Tuple, Dict
+from typing import List, Optional, Tuple, Dict
 import matplotlib.pyplot as plt
 from src.models.direction import Direction
 from src.models.bridge import Bridge
 from src.simulation.scheduler import CarScheduler
 from src.simulation.single_threaded import SingleThreadedBridge
+from src.utils.arrival_format import ArrivalColumns
 from src.utils.logger import get_logger
+from src.utils.result_cache import ResultCache, cache_key, hash_arrivals
+from src.utils.workload import Poisson, WorkloadGenerator
 
 logger = get_logger(__name__)
 
-def generate_test_data(num_cars: int, time_span: float) -> List[Tuple[float, int, Direction]]:
+def generate_test_data(num_cars: int, time_span: float, seed: int = 0) -> ArrivalColumns:
     """
     Генерирует тестовые данные для симуляции
     
     Args:
         num_cars: Количество машин
-        time_span: Временной интервал в секундах
+        time_span: Временной интервал в секундах (машины приезжают в среднем за это время)
+        seed: Зерно генератора: одинаковые данные дают попадания в кэш результатов
     
     Returns:
-        List of (arrival_time, car_id, direction)
+        Отсортированные колонки (arrival_time, car_id, direction)
     """
-    cars_data = []
-    for i in range(num_cars):
-        arrival_time = random.uniform(0, time_span)
-        direction = random.choice([Direction.LEFT_TO_RIGHT, Direction.RIGHT_TO_LEFT])
-        cars_data.append((arrival_time, i, direction))
-    return sorted(cars_data)  # Сортируем по времени прибытия
+    return WorkloadGenerator(Poisson(num_cars / time_span), seed=seed).generate(num_cars)
 
-def run_comparison(cars_data: List[Tuple[float, int, Direction]]) -> Tuple[Dict, Dict]:
+def run_multi_threaded(cars_data: List[Tuple[float, int, Direction]]) -> Tuple[Dict, List]:
+    """Многопоточная реализация: статистика и результаты по машинам"""
+    bridge = Bridge()
+    scheduler = CarScheduler(cars_data, bridge)
+    scheduler.run()
+    completed = scheduler.wait_completion()
+    stats = bridge.get_statistics()
+    if not completed:
+        stats['timed_out'] = True
+    cars = [(car.car_id, car.direction.value, car.waiting_time, car.crossing_time) for car in scheduler.cars]
+    return stats, cars
+
+def run_single_threaded(cars_data: List[Tuple[float, int, Direction]]) -> Tuple[Dict, None]:
+    """Однопоточная реализация: только статистика"""
+    return SingleThreadedBridge().simulate(cars_data), None
+
+def cached_run(run, cars_data: List[Tuple[float, int, Direction]], params: Dict,
+               cache: Optional[ResultCache], data_hash: Optional[str]) -> Dict:
+    """Статистика прогона из кэша или, если ее там нет, после запуска run"""
+    if cache is None:
+        return run(cars_data)[0]
+    key = cache_key(data_hash, params)
+    cached = cache.get(key)
+    if cached is not None:
+        logger.info(f"Using cached {params['mode']} result {key[:12]}")
+        return cached['stats']
+    stats, cars = run(cars_data)
+    # Прогон, не уложившийся в таймаут, дал неполную статистику
+    if not stats.get('timed_out'):
+        cache.put(key, stats, cars=cars, params=params)
+    return stats
+
+def run_comparison(cars_data: List[Tuple[float, int, Direction]],
+                   cache: Optional[ResultCache] = None) -> Tuple[Dict, Dict]:
     """
-    Запускает обе реализации и возвращает их статистику
+    Запускает обе реализации и возвращает их статистику.
+    С cache результаты берутся из кэша, если эти данные уже считались.
     """
-    # Многопоточная реализация
-    multi_bridge = Bridge()
-    scheduler = CarScheduler(cars_data, multi_bridge)
-    scheduler.run()
-    scheduler.wait_completion()
-    multi_stats = multi_bridge.get_statistics()
-    
-    # Однопоточная реализация
-    single_bridge = SingleThreadedBridge()
-    single_stats = single_bridge.simulate(cars_data)
+    data_hash = hash_arrivals(cars_data) if cache is not None else None
+    params = {'max_consecutive': 3, 'crossing_time': 1.0, 'policy': 'alternating', 'priority_direction': None}
+
+    multi_stats = cached_run(run_multi_threaded, cars_data, {'mode': 'multi', 'clock': 'real', **params},
+                             cache, data_hash)
+    single_stats = cached_run(run_single_threaded, cars_data, {'mode': 'single', **params}, cache, data_hash)
     return single_stats, multi_stats
 
-def compare_implementations(test_cases: List[int], time_span: float = 10.0):
+def compare_implementations(test_cases: List[int], time_span: float = 10.0,
+                            cache: Optional[ResultCache] = None):
     """
     Сравнивает реализации для разных размеров входных данных
     
     Args:
         test_cases: Список количества машин для тестирования
         time_span: Временной интервал для генерации данных
+        cache: Кэш результатов (None — всегда запускать симуляцию)
     """
     results = {
         'single': {
@@ -71,7 +101,7 @@ def compare_implementations(test_cases: List[int], time_span: float = 10.0):
     for num_cars in test_cases:
         logger.info(f"\nTesting with {num_cars} cars...")
         cars_data = generate_test_data(num_cars, time_span)
-        single_stats, multi_stats = run_comparison(cars_data)
+        single_stats, multi_stats = run_comparison(cars_data, cache)
         
         # Собираем метрики для однопоточной реализации
         results['single']['avg_waiting'].append(single_stats['avg_waiting_time'])
@@ -149,7 +179,7 @@ def main():
     time_span = 10.0  # Временной интервал в секундах
     
     logger.info("Starting simulation comparison...")
-    results = compare_implementations(test_cases, time_span)
+    results = compare_implementations(test_cases, time_span, ResultCache())
     
     # Создаем графики результатов
     plot_results(test_cases, results)
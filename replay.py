@@ -0,0 +1,41 @@
+import argparse
+import logging
+import sys
+from src.simulation.replay import REPLAY_ENGINES, compare_decisions, replay, summarize
+from src.utils.logger import configure_logging, get_logger
+from src.utils.trace import load_trace
+
+logger = get_logger(__name__)
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Replay a binary bridge trace and check that the decisions match')
+    parser.add_argument('trace_file', type=str, help='Trace recorded with main.py --trace')
+    parser.add_argument(
+        '--engine',
+        choices=REPLAY_ENGINES,
+        default='single',
+        help='Engine to re-drive: single-threaded, discrete-event or threaded on a virtual clock'
+    )
+    return parser.parse_args()
+
+def main() -> int:
+    args = parse_args()
+    configure_logging(car_level=logging.WARNING)
+    trace = load_trace(args.trace_file)
+    counts = ', '.join(f"{count} {kind}" for kind, count in summarize(trace).items())
+    logger.info(f"Loaded {len(trace)} events ({counts}), metadata: {trace.metadata}")
+
+    try:
+        events = replay(trace, args.engine)
+    except ValueError as e:
+        logger.error(f"Cannot replay the trace: {e}")
+        return 2
+    mismatch = compare_decisions(trace.events, events)
+    if mismatch:
+        logger.error(f"Replay diverged: {mismatch}")
+        return 1
+    logger.info(f"Replay on the {args.engine} engine reproduced all decisions")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,108 @@
+# src/models/arrival_queue.py
+from array import array
+from typing import Iterator, Optional, Tuple
+
+# Элемент очереди: (время прибытия, номер машины, время проезда)
+QueueItem = Tuple[float, int, float]
+
+
+class ArrivalQueue:
+    """
+    Очередь машин одного направления — кольцевой буфер из трех
+    типизированных колонок array: время прибытия (double), номер машины
+    (int64) и время проезда (double). На машину приходится ITEM_SIZE байт
+    без объектов Python на элемент, поэтому память очереди равна
+    capacity * ITEM_SIZE. Заполненный буфер удваивается; если размер
+    очереди известен заранее, емкость задается при создании.
+    """
+    __slots__ = ('_times', '_ids', '_crossing', '_head', '_size', '_capacity')
+
+    ITEM_SIZE = 8 + 8 + 8
+    DEFAULT_CAPACITY = 16
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self._times = array('d', bytes(8 * capacity))
+        self._ids = array('q', bytes(8 * capacity))
+        self._crossing = array('d', bytes(8 * capacity))
+        self._head = 0
+        self._size = 0
+        self._capacity = capacity
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def nbytes(self) -> int:
+        """Память под колонки, байт"""
+        return self._capacity * self.ITEM_SIZE
+
+    def append(self, arrival_time: float, car_id: int, crossing_time: float):
+        """Ставит машину в конец очереди"""
+        if self._size == self._capacity:
+            self._grow()
+        index = self._head + self._size
+        if index >= self._capacity:
+            index -= self._capacity
+        self._times[index] = arrival_time
+        self._ids[index] = car_id
+        self._crossing[index] = crossing_time
+        self._size += 1
+
+    def popleft(self) -> QueueItem:
+        """Снимает машину из начала очереди"""
+        if not self._size:
+            raise IndexError("pop from an empty queue")
+        index = self._head
+        self._head = index + 1 if index + 1 < self._capacity else 0
+        self._size -= 1
+        return self._times[index], self._ids[index], self._crossing[index]
+
+    def peek(self) -> QueueItem:
+        """Первая машина очереди без снятия"""
+        if not self._size:
+            raise IndexError("peek at an empty queue")
+        index = self._head
+        return self._times[index], self._ids[index], self._crossing[index]
+
+    def head_arrival(self) -> Optional[float]:
+        """Время прибытия первой машины или None, если очередь пуста"""
+        return self._times[self._head] if self._size else None
+
+    def __iter__(self) -> Iterator[QueueItem]:
+        for offset in range(self._size):
+            index = (self._head + offset) % self._capacity
+            yield self._times[index], self._ids[index], self._crossing[index]
+
+    def _columns(self, extra: int):
+        """Колонки с элементами по порядку, начиная с нулевого индекса, и extra свободными местами"""
+        end = self._head + self._size
+        columns = []
+        for column in (self._times, self._ids, self._crossing):
+            if end <= self._capacity:
+                ordered = column[self._head:end]
+            else:
+                ordered = column[self._head:] + column[:end - self._capacity]
+            ordered.frombytes(bytes(ordered.itemsize * extra))
+            columns.append(ordered)
+        return columns
+
+    def _grow(self):
+        capacity = self._capacity * 2
+        self._times, self._ids, self._crossing = self._columns(capacity - self._size)
+        self._head = 0
+        self._capacity = capacity
+
+    def copy(self) -> 'ArrivalQueue':
+        """Независимая копия очереди с той же емкостью"""
+        queue = ArrivalQueue.__new__(ArrivalQueue)
+        queue._times, queue._ids, queue._crossing = self._columns(self._capacity - self._size)
+        queue._head = 0
+        queue._size = self._size
+        queue._capacity = self._capacity
+        return queue
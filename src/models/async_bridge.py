@@ -0,0 +1,95 @@
+# src/models/async_bridge.py
+import asyncio
+from typing import Optional, Tuple
+from .bridge import Bridge, Turn
+from .direction import Direction
+from .policy import SchedulingPolicy
+from ..utils.clock import LoopClock
+from ..utils.logger import get_logger
+from ..utils.trace import TraceRecorder
+
+logger = get_logger(__name__)
+
+class AsyncBridge(Bridge):
+    """
+    Асинхронный вариант моста: машины — корутины, а не потоки.
+
+    Правила проезда (политика выбора) и статистика
+    унаследованы от Bridge, как и передача моста "эстафетой". Синхронизация
+    построена на asyncio.Lock и asyncio.Condition: каждая ожидающая машина
+    ждет на своей условной переменной, а съезжающая машина будит только
+    ту, которой передан мост. Так стоимость освобождения моста не зависит
+    от числа ожидающих машин.
+
+    Как и у потокового моста, решение принимается после всех прибытий
+    и съездов текущего момента: если в цикле событий (VirtualEventLoop)
+    еще есть события этого момента, мост передает отдельная корутина,
+    когда они обработаны. Поэтому с виртуальным временем машины
+    проезжают в том же порядке, что и в остальных движках.
+    """
+    def __init__(self, priority_direction: Optional[Direction] = None,
+                 policy: Optional[SchedulingPolicy] = None, trace: Optional[TraceRecorder] = None,
+                 instrument: bool = True):
+        super().__init__(priority_direction, clock=LoopClock(), policy=policy, trace=trace, instrument=instrument)
+        # Корутины не конкурируют за блокировку так, как потоки, поэтому
+        # из счетчиков синхронизации время ее захвата не учитывается
+        self.lock = asyncio.Lock()
+        # Корутина, которая передаст мост после событий текущего момента
+        self._pass_on_task: Optional[asyncio.Task] = None
+
+    async def cross(self, car_id: int, direction: Direction, arrival_time: Optional[float] = None,
+                    crossing_time: Optional[float] = None) -> Tuple[float, float]:
+        """Корутина проезда автомобиля через мост"""
+        loop = asyncio.get_running_loop()
+        if arrival_time is None:
+            arrival_time = loop.time()
+        if crossing_time is None:
+            crossing_time = self.crossing_time
+
+        async with self.lock:
+            # Добавляем машину в очередь
+            self.enqueue(car_id, direction, arrival_time)
+
+            if self.can_cross(car_id, direction) and self.clock.settled():
+                wait_time = self.admit(car_id, direction, arrival_time, loop.time(), crossing_time)
+            else:
+                # Ждем, пока мост не передадут именно нам
+                turn = self.turns[car_id] = Turn(asyncio.Condition(self.lock), arrival_time, crossing_time)
+                if self.cars_on_bridge == 0:
+                    # В этот же момент могут подъехать другие машины
+                    self._defer_pass_on(loop)
+                while turn.wait_time is None:
+                    await turn.condition.wait()
+                    if self.sync_stats is not None:
+                        self.sync_stats.record_wakeup(turn.wait_time is None)
+                wait_time = turn.wait_time
+
+        # Симуляция проезда
+        await asyncio.sleep(crossing_time)
+
+        async with self.lock:
+            self.release(direction, crossing_time, car_id)
+            if self.clock.settled():
+                self._pass_on(loop.time())
+            else:
+                self._defer_pass_on(loop)
+
+        return crossing_time, wait_time
+
+    def _pass_on(self, now: float):
+        """Передает свободный мост и будит только машину, которой он достался (под блокировкой)"""
+        turn = self.hand_off(now)
+        if turn is not None:
+            turn.condition.notify()
+
+    def _defer_pass_on(self, loop: asyncio.AbstractEventLoop):
+        """Откладывает передачу моста до конца событий текущего момента (под блокировкой)"""
+        if self._pass_on_task is None:
+            self._pass_on_task = loop.create_task(self._settle_and_pass_on())
+
+    async def _settle_and_pass_on(self):
+        while not self.clock.settled():
+            await asyncio.sleep(0)
+        async with self.lock:
+            self._pass_on_task = None
+            self._pass_on(asyncio.get_running_loop().time())
@@ -2,152 +2,542 @@
 import threading
 import time
 from collections import deque
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 from .direction import Direction
+from .policy import AlternatingPolicy, SchedulingPolicy
+from ..utils.clock import Clock, RealClock
 from ..utils.logger import get_logger
+from ..utils.performance import profiled, span
+from ..utils.statistics import CrossingStatistics, OccupancyStatistics, SynchronizationStatistics
+from ..utils.trace import TraceEvent, TraceRecorder
 
 logger = get_logger(__name__)
 
+class Turn:
+    """
+    Ожидание машины в очереди: своя условная переменная, время прибытия,
+    время проезда и время ожидания, которое вместе с моментом въезда
+    заполняет передавшая мост машина. В режиме колонн еще момент съезда
+    с моста по расписанию колонны и признак последней машины колонны.
+    У машины без своего потока (Bridge.request) вместо условной
+    переменной — обработчик on_admit, который вызывается при передаче моста.
+    retry_at — момент, когда машина, которой мешает только headway,
+    должна сама повторить передачу моста.
+    """
+    __slots__ = ('condition', 'arrival_time', 'wait_time', 'crossing_time', 'admit_time', 'depart_time', 'last',
+                 'on_admit', 'retry_at')
+
+    def __init__(self, condition, arrival_time: float, crossing_time: Optional[float] = None,
+                 on_admit: Optional[Callable[['Turn'], None]] = None):
+        self.condition = condition
+        self.on_admit = on_admit
+        self.arrival_time = arrival_time
+        self.wait_time: Optional[float] = None
+        self.crossing_time = crossing_time
+        self.admit_time: Optional[float] = None
+        self.depart_time: Optional[float] = None
+        self.last = False
+        self.retry_at: Optional[float] = None
+
+class InstrumentedLock:
+    """
+    threading.Lock, который учитывает время ожидания захвата.
+    Условные переменные на такой блокировке тоже учитываются: после
+    wait() блокировка захватывается заново через acquire().
+    """
+    __slots__ = ('_lock', 'stats')
+
+    def __init__(self, stats: SynchronizationStatistics):
+        self._lock = threading.Lock()
+        self.stats = stats
+
+    def acquire(self, blocking: bool = True, timeout: float = -1) -> bool:
+        start = time.perf_counter_ns()
+        acquired = self._lock.acquire(blocking, timeout)
+        if acquired:
+            self.stats.record_lock_wait(time.perf_counter_ns() - start)
+        return acquired
+
+    def release(self):
+        self._lock.release()
+
+    def locked(self) -> bool:
+        return self._lock.locked()
+
+    def __enter__(self) -> bool:
+        return self.acquire()
+
+    def __exit__(self, exc_type, exc, traceback):
+        self.release()
+
 class Bridge:
     """
     Класс, представляющий мост с односторонним движением.
-    На мосту одновременно может находиться только одна машина.
+    На мосту одновременно может находиться до capacity машин одного
+    направления (по умолчанию одна); попутная машина въезжает не раньше
+    чем через headway после предыдущей, встречная ждет, пока мост опустеет.
+    Время берется из clock: по умолчанию реальное, с VirtualClock
+    симуляция идет быстрее реального времени.
+
+    Мост передается "эстафетой": съезжающая машина сама выбирает следующую
+    и будит только ее, а не всех ожидающих (при capacity > 1 — всех, кому
+    хватило места). Каждая ожидающая машина ждет на своей условной
+    переменной, поэтому освобождение моста стоит O(1) независимо от длины
+    очередей. Если попутной машине мешает только headway, ее будят
+    заранее: в момент въезда она сама снова передает мост, уже с учетом
+    машин, подъехавших к этому моменту. Решения принимаются после всех
+    прибытий и съездов текущего момента (Clock.settle), поэтому с
+    VirtualClock мост пропускает машины в том же порядке, что и
+    однопоточный и событийный движки.
+
+    Кому отдается свободный мост, решает policy (по умолчанию
+    AlternatingPolicy) — та же, что у однопоточных движков.
+    С trace мост записывает прибытия, въезды, съезды и смены направления.
+
+    С instrument=True (по умолчанию) мост считает ожидание блокировки,
+    пробуждения, проверки can_cross и длину очередей при въезде
+    (раздел 'synchronization' в get_statistics()). Счетчики обновляются
+    под блокировкой моста и стоят несколько вызовов perf_counter_ns на
+    проезд; с instrument=False их нет совсем.
+
+    С platoon_size мост пропускает машины колоннами: получив мост,
+    направление сразу пускает до platoon_size первых машин своей очереди
+    одним решением. Каждой машине колонны назначается момент въезда сразу
+    за предыдущей, она просыпается один раз и едет по расписанию без
+    блокировки, а освобождает мост и выбирает следующую колонну только
+    последняя машина. Смена направления рассматривается лишь на границе
+    колонн, поэтому встречная машина, подъехавшая во время колонны,
+    ждет ее конца. Колонны едут по одной машине, с capacity > 1 их
+    совмещать нельзя.
     """
-    def __init__(self, priority_direction: Optional[Direction] = None):
-        self.lock = threading.Lock()
-        self.condition = threading.Condition(self.lock)
+    def __init__(self, priority_direction: Optional[Direction] = None, clock: Optional[Clock] = None,
+                 policy: Optional[SchedulingPolicy] = None, trace: Optional[TraceRecorder] = None,
+                 instrument: bool = True, platoon_size: Optional[int] = None,
+                 capacity: int = 1, headway: float = 0.0):
+        if platoon_size is not None and platoon_size < 1:
+            raise ValueError("platoon_size must be at least 1")
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        if headway < 0:
+            raise ValueError("headway must not be negative")
+        if platoon_size is not None and capacity > 1:
+            raise ValueError("platoon_size requires capacity 1")
+        self.platoon_size = platoon_size
+        self.capacity = capacity
+        self.headway = headway
+        self.clock = clock or RealClock()
+        self.policy = policy or AlternatingPolicy()
+        self.trace = trace
+        self.sync_stats: Optional[SynchronizationStatistics] = None
+        if instrument:
+            self.sync_stats = SynchronizationStatistics()
+            self.lock = InstrumentedLock(self.sync_stats)
+        else:
+            self.lock = threading.Lock()
         self.current_direction: Optional[Direction] = None
         self.cars_on_bridge = 0
         self.current_car: Optional[int] = None
         self.priority_direction = priority_direction
         self.consecutive_cars = 0
         self.MAX_CONSECUTIVE = 3
-        self.last_change_time = time.time()
+        self.crossing_time = 1.0
+        self.last_change_time = self.clock.now()
+        self.last_admit_time = self.last_change_time
+        # Когда съедет последняя из машин на мосту (по расписанию)
+        self.empty_at = self.last_change_time
         
         # Очереди для машин
         self.waiting_queues: Dict[Direction, deque] = {
             Direction.LEFT_TO_RIGHT: deque(),
             Direction.RIGHT_TO_LEFT: deque()
         }
+        # Ожидающие машины: car_id -> Turn
+        self.turns: Dict[int, Turn] = {}
+        # Время прибытия машин в очередях: car_id -> время
+        self.arrival_times: Dict[int, float] = {}
         
         # Статистика
-        self.total_crossed = 0
-        self.crossing_times: List[float] = []
-        self.waiting_times: List[float] = []
-        self.direction_stats: Dict[Direction, Dict] = {
-            Direction.LEFT_TO_RIGHT: {'crossed': 0, 'total_wait': 0},
-            Direction.RIGHT_TO_LEFT: {'crossed': 0, 'total_wait': 0}
-        }
+        self.statistics = CrossingStatistics()
+        self.occupancy = OccupancyStatistics(capacity, headway)
 
-    def should_change_direction(self, current_time: float) -> bool:
-        """Определяет, нужно ли менять направление движения"""
-        if self.current_direction is None:
-            return True
-            
-        # Если достигнут лимит последовательных машин
-        if self.consecutive_cars >= self.MAX_CONSECUTIVE:
-            opposite_queue = self.waiting_queues[self.current_direction.opposite()]
-            return len(opposite_queue) > 0
-            
-        return False
+    def head_arrival(self, direction: Direction) -> Optional[float]:
+        """Время прибытия первой машины очереди или None, если очередь пуста"""
+        queue = self.waiting_queues[direction]
+        return self.arrival_times[queue[0]] if queue else None
+
+    def queue_length(self, direction: Direction) -> int:
+        return len(self.waiting_queues[direction])
+
+    def enqueue(self, car_id: int, direction: Direction, arrival_time: float):
+        """Ставит машину в очередь (вызывается под блокировкой)"""
+        self.waiting_queues[direction].append(car_id)
+        self.arrival_times[car_id] = arrival_time
+        if self.trace is not None:
+            self.trace.record(arrival_time, TraceEvent.ARRIVE, car_id, direction)
 
     def can_cross(self, car_id: int, direction: Direction) -> bool:
         """Проверяет, может ли машина проехать мост"""
-        # Если на мосту уже есть машина
-        if self.cars_on_bridge > 0:
+        if self.sync_stats is not None:
+            self.sync_stats.can_cross_evaluations += 1
+
+        # Если на мосту нет места для машины этого направления
+        if not self.has_room(direction):
             return False
             
         # Проверяем, что это первая машина в своей очереди
         if not self.waiting_queues[direction] or self.waiting_queues[direction][0] != car_id:
             return False
 
-        # Проверяем необходимость смены направления
-        current_time = time.time()
-        if self.should_change_direction(current_time):
-            # Если есть машины в противоположном направлении
-            opposite_direction = direction.opposite()
-            if len(self.waiting_queues[opposite_direction]) > 0:
-                if direction == self.current_direction:
-                    return False
-
-        # Проверяем приоритет
-        if self.priority_direction:
-            # Если есть машины в обоих направлениях
-            if all(len(q) > 0 for q in self.waiting_queues.values()):
-                if direction != self.priority_direction:
-                    # Неприоритетное направление может ехать только если:
-                    # 1. В приоритетном направлении достигнут лимит последовательных машин
-                    # 2. Нет активного направления (новый цикл)
-                    if (self.current_direction != self.priority_direction or
-                        self.consecutive_cars < self.MAX_CONSECUTIVE):
-                        return False
-
-        return True
-
-    def cross(self, car_id: int, direction: Direction) -> Tuple[float, float]:
-        """Метод для проезда автомобиля через мост"""
-        arrival_time = time.time()
+        return self.policy.choose(self) == direction
+
+    def has_room(self, direction: Direction) -> bool:
+        """Может ли на мост въехать еще одна машина направления direction (под блокировкой)"""
+        if self.cars_on_bridge == 0:
+            return True
+        return direction == self.current_direction and self.cars_on_bridge < self.capacity
+
+    def admission_time(self, now: float) -> float:
+        """
+        Момент въезда следующей попутной машины (под блокировкой): через
+        headway после предыдущей, но не позже, чем мост опустеет
+        """
+        if self.cars_on_bridge == 0:
+            return now
+        return max(now, min(self.last_admit_time + self.headway, self.empty_at))
+
+    @profiled('Bridge.cross')
+    def cross(self, car_id: int, direction: Direction, arrival_time: Optional[float] = None,
+              crossing_time: Optional[float] = None) -> Tuple[float, float]:
+        """
+        Метод для проезда автомобиля через мост.
+        arrival_time: момент прибытия, если машина подъехала раньше вызова
+        (например, ждала свободного обработчика в пуле).
+        crossing_time: время проезда машины, по умолчанию self.crossing_time
+        """
+        if arrival_time is None:
+            arrival_time = self.clock.now()
+        if crossing_time is None:
+            crossing_time = self.crossing_time
+        if self.platoon_size is not None:
+            return self._cross_in_platoon(car_id, direction, arrival_time, crossing_time)
         
-        with self.lock:
-            # Добавляем машину в очередь
-            self.waiting_queues[direction].append(car_id)
-            
-            # Ждем возможности проезда
-            while not self.can_cross(car_id, direction):
-                self.condition.wait()
-            
-            # Удаляем машину из очереди
-            self.waiting_queues[direction].popleft()
-            wait_time = time.time() - arrival_time
-            
-            # Обновляем состояние моста
-            if self.current_direction == direction:
-                self.consecutive_cars += 1
-            else:
-                self.current_direction = direction
-                self.consecutive_cars = 1
-                self.last_change_time = time.time()
-            
-            self.cars_on_bridge = 1
-            self.current_car = car_id
-            self.waiting_times.append(wait_time)
-            self.direction_stats[direction]['total_wait'] += wait_time
+        with span('wait_turn'):
+            with self.lock:
+                # Добавляем машину в очередь
+                self.enqueue(car_id, direction, arrival_time)
+
+                ready = self.can_cross(car_id, direction)
+                now = self.clock.now()
+                # Пока на мосту есть место, прибытие может изменить решение политики
+                deferred = self.cars_on_bridge < self.capacity
+                if ready and self.admission_time(now) <= now and self.clock.settled():
+                    turn = None
+                    admit_time = now
+                    wait_time = self.admit(car_id, direction, arrival_time, admit_time, crossing_time)
+                else:
+                    # Ждем, пока мост не передадут именно нам
+                    turn = self.turns[car_id] = Turn(threading.Condition(self.lock), arrival_time, crossing_time)
+                    if not deferred:
+                        self.await_turn(turn)
+
+            if turn is not None:
+                if deferred:
+                    # В этот же момент могут подъехать или съехать другие
+                    # машины: мост передается после них
+                    self.clock.settle()
+                    with self.lock:
+                        self.pass_on(self.clock.now())
+                        self.await_turn(turn)
+                admit_time, wait_time = turn.admit_time, turn.wait_time
         
-        # Симуляция проезда
-        crossing_time = 1.0
-        time.sleep(crossing_time)
+        # Симуляция проезда (с ожиданием headway за предыдущей машиной)
+        with span('crossing'):
+            self.clock.sleep(admit_time + crossing_time - self.clock.now())
         
+        self.leave(direction, crossing_time, car_id)
+        return crossing_time, wait_time
+
+    def await_turn(self, turn: Turn):
+        """Ждет, пока мост не передадут машине (под блокировкой)"""
+        while turn.wait_time is None:
+            if turn.retry_at is not None:
+                # Дожидаемся конца headway и событий этого момента без блокировки
+                self.lock.release()
+                try:
+                    self.clock.sleep(turn.retry_at - self.clock.now())
+                    self.clock.settle()
+                finally:
+                    self.lock.acquire()
+                turn.retry_at = None
+                self.pass_on(self.clock.now())
+                continue
+            self.clock.wait(turn.condition)
+            if self.sync_stats is not None:
+                self.sync_stats.record_wakeup(turn.wait_time is None and turn.retry_at is None)
+
+    def retry(self, turn: Turn):
+        """Повторная передача моста в turn.retry_at для машины без своего потока (без блокировки)"""
+        self.clock.sleep(turn.retry_at - self.clock.now())
+        self.clock.settle()
         with self.lock:
-            self.cars_on_bridge = 0
-            self.current_car = None
-            self.total_crossed += 1
-            self.direction_stats[direction]['crossed'] += 1
-            self.crossing_times.append(crossing_time)
-            
-            # Уведомляем ожидающие машины
-            self.condition.notify_all()
+            turn.retry_at = None
+            self.pass_on(self.clock.now())
+
+    def leave(self, direction: Direction, crossing_time: float, car_id: int):
+        """
+        Машина съехала с моста: место передается следующим машинам.
+        Если в этот же момент подъезжают или съезжают другие машины, мост
+        передается после них, как в событийном движке, — иначе решение
+        зависело бы от того, какой поток первым захватит блокировку.
+        """
+        with span('release'), self.lock:
+            self.release(direction, crossing_time, car_id)
+            settled = self.clock.settled()
+            if settled:
+                self.pass_on(self.clock.now())
+        if not settled:
+            self.settle_and_pass_on()
+
+    def settle_and_pass_on(self):
+        """Передает свободный мост после всех остальных событий текущего момента"""
+        self.clock.settle()
+        with self.lock:
+            self.pass_on(self.clock.now())
+
+    def pass_on(self, now: float):
+        """Передает свободные места на мосту и будит машины, которым они достались (под блокировкой)"""
+        if self.platoon_size is not None:
+            if self.cars_on_bridge == 0:
+                self._start_platoon(now)
+            return
+        for turn in self.fill(now):
+            self.wake(turn)
+
+    def request(self, car_id: int, direction: Direction, arrival_time: float,
+                on_admit: Callable[[Turn], None], crossing_time: Optional[float] = None) -> bool:
+        """
+        Неблокирующий въезд для машины без своего потока: машина сразу
+        встает в очередь моста, а on_admit(turn) вызывается под блокировкой,
+        когда ей передан мост (turn.admit_time и turn.wait_time заполнены,
+        в режиме колонн еще turn.depart_time). Проезд завершает depart.
+        Returns: True, если на мосту есть место: решение принимает
+        вызывающий, вызвав settle_and_pass_on после всех прибытий
+        текущего момента
+        """
+        if crossing_time is None:
+            crossing_time = self.crossing_time
+        with self.lock:
+            self.enqueue(car_id, direction, arrival_time)
+            self.turns[car_id] = Turn(None, arrival_time, crossing_time, on_admit)
+            return self.cars_on_bridge < self.capacity
+
+    def depart(self, car_id: int, direction: Direction, turn: Turn):
+        """Машина, въехавшая через request, съехала с моста: место передается дальше"""
+        # Съезд машин внутри колонны уже отмечен при ее сборке
+        if self.platoon_size is None or turn.last:
+            self.leave(direction, turn.crossing_time, car_id)
+
+    def wake(self, turn: Turn):
+        """Сообщает машине, что ей передан мост (под блокировкой)"""
+        if turn.on_admit is not None:
+            turn.on_admit(turn)
+        else:
+            self.clock.notify(turn.condition)
+
+    def _cross_in_platoon(self, car_id: int, direction: Direction, arrival_time: float,
+                          crossing_time: Optional[float]) -> Tuple[float, float]:
+        """Проезд в режиме колонн: машина ждет, пока ее включат в колонну, и едет по расписанию"""
+        with span('wait_turn'):
+            with self.lock:
+                self.enqueue(car_id, direction, arrival_time)
+                turn = self.turns[car_id] = Turn(threading.Condition(self.lock), arrival_time, crossing_time)
+                deferred = self.cars_on_bridge == 0 and not self.clock.settled()
+                if self.cars_on_bridge == 0 and not deferred:
+                    # Мост свободен: колонну собирает подъехавшая машина
+                    self._start_platoon(self.clock.now(), turn)
+                if not deferred:
+                    self.await_turn(turn)
+
+            if deferred:
+                # Колонна собирается после остальных прибытий этого момента
+                self.clock.settle()
+                with self.lock:
+                    self.pass_on(self.clock.now())
+                    self.await_turn(turn)
+
+        # Ожидание своего места в колонне и проезд — по расписанию, без блокировки
+        with span('crossing'):
+            self.clock.sleep(turn.depart_time - self.clock.now())
+
+        if turn.last:
+            self.leave(direction, crossing_time, car_id)
+
+        return crossing_time, turn.wait_time
+
+    def platoon_length(self, direction: Direction) -> int:
+        """
+        Сколько машин пускается в колонне направления direction (под блокировкой).
+        Если встречные машины ждут, колонна вместе с уже проехавшими подряд
+        машинами этого направления не выходит за MAX_CONSECUTIVE.
+        """
+        length = min(self.platoon_size, len(self.waiting_queues[direction]))
+        if self.waiting_queues[direction.opposite()]:
+            run = self.consecutive_cars if direction == self.current_direction else 0
+            length = min(length, max(1, self.MAX_CONSECUTIVE - run))
+        return length
+
+    def _start_platoon(self, now: float, own_turn: Optional[Turn] = None):
+        """
+        Пускает на свободный мост колонну (под блокировкой): назначает машинам
+        моменты въезда и съезда и будит их. own_turn — ожидание вызывающей
+        машины, ее будить не нужно.
+        """
+        direction = self.policy.choose(self)
+        if direction is None:
+            return
+        if self.sync_stats is not None:
+            self.sync_stats.can_cross_evaluations += 1
+
+        queue = self.waiting_queues[direction]
+        members = []
+        admit_time = now
+        for _ in range(self.platoon_length(direction)):
+            if members:
+                # Съезд предыдущей машины колонны отмечается сразу,
+                # съезд последней — в release
+                self._depart_scheduled(direction, members[-1])
+            car_id = queue[0]
+            turn = self.turns.pop(car_id)
+            turn.wait_time = self.admit(car_id, direction, turn.arrival_time, admit_time, turn.crossing_time)
+            turn.admit_time = admit_time
+            turn.depart_time = admit_time + turn.crossing_time
+            members.append(turn)
+            admit_time = turn.depart_time
+        members[-1].last = True
+
+        for turn in members:
+            if turn is not own_turn:
+                self.wake(turn)
+
+    def _depart_scheduled(self, direction: Direction, turn: Turn):
+        """Съезд машины внутри колонны по расписанию (под блокировкой)"""
+        if self.trace is not None:
+            self.trace.record(turn.depart_time, TraceEvent.DEPART, self.current_car, direction)
+        self.cars_on_bridge -= 1
+        self.statistics.record_crossing(direction, turn.crossing_time)
+
+    def next_car(self) -> Optional[Tuple[int, Direction]]:
+        """
+        Выбирает машину, которой передается свободный мост (под блокировкой).
+        Проехать может только первая машина очереди, поэтому политике
+        достаточно голов двух очередей.
+        """
+        direction = self.policy.choose(self)
+        if direction is None:
+            return None
+        return self.waiting_queues[direction][0], direction
+
+    def hand_off(self, now: float) -> Optional[Turn]:
+        """
+        Передает место на мосту следующей машине (под блокировкой).
+        Returns: ожидание машины, которую нужно разбудить, или None,
+        если ждать некому или выбранной машине на мосту нет места.
+        Если машине мешает только headway, она будится заранее, чтобы
+        повторить передачу моста в момент въезда (turn.retry_at)
+        """
+        chosen = self.next_car()
+        if chosen is None:
+            return None
         
-        return crossing_time, wait_time
+        car_id, direction = chosen
+        if not self.has_room(direction):
+            return None
+        admit_time = self.admission_time(now)
+        if admit_time > now:
+            # Если мост опустеет раньше, мост передаст съезд последней машины
+            turn = self.turns[car_id]
+            if admit_time < self.empty_at and turn.retry_at is None:
+                turn.retry_at = admit_time
+                self.wake(turn)
+            return None
+        turn = self.turns.pop(car_id)
+        turn.admit_time = now
+        turn.wait_time = self.admit(car_id, direction, turn.arrival_time, turn.admit_time, turn.crossing_time)
+        return turn
 
-    def get_statistics(self) -> Dict:
-        """Получение статистики работы моста"""
-        stats = {
-            'total_crossed': self.total_crossed,
-            'avg_crossing_time': sum(self.crossing_times) / len(self.crossing_times) if self.crossing_times else 0,
-            'avg_waiting_time': sum(self.waiting_times) / len(self.waiting_times) if self.waiting_times else 0,
-            'max_waiting_time': max(self.waiting_times) if self.waiting_times else 0,
-            'direction_stats': {}
-        }
+    def fill(self, now: float) -> List[Turn]:
+        """
+        Передает освободившиеся места на мосту, пока они есть (под блокировкой).
+        Returns: ожидания машин, которые нужно разбудить
+        """
+        turns = []
+        while self.cars_on_bridge < self.capacity:
+            turn = self.hand_off(now)
+            if turn is None:
+                break
+            turns.append(turn)
+        return turns
+
+    def admit(self, car_id: int, direction: Direction, arrival_time: float, now: float,
+              crossing_time: Optional[float] = None) -> float:
+        """
+        Пускает машину из головы очереди на мост (вызывается под блокировкой).
+        now: момент въезда; crossing_time: время проезда, по умолчанию self.crossing_time
+        Returns: время ожидания машины
+        """
+        # Удаляем машину из очереди
+        self.waiting_queues[direction].popleft()
+        del self.arrival_times[car_id]
+        if self.sync_stats is not None:
+            # Сколько машин осталось ждать в обеих очередях
+            self.sync_stats.queue_depth.add(len(self.arrival_times))
+        wait_time = now - arrival_time
         
-        for direction, dir_stats in self.direction_stats.items():
-            if dir_stats['crossed'] > 0:
-                avg_wait = dir_stats['total_wait'] / dir_stats['crossed']
-            else:
-                avg_wait = 0
-                
-            stats['direction_stats'][direction.value] = {
-                'total_crossed': dir_stats['crossed'],
-                'avg_waiting_time': avg_wait
-            }
+        # Обновляем состояние моста
+        if self.current_direction == direction:
+            self.consecutive_cars += 1
+        else:
+            self.current_direction = direction
+            self.consecutive_cars = 1
+            self.last_change_time = now
+            if self.trace is not None:
+                self.trace.record(now, TraceEvent.SWITCH, car_id, direction)
         
-        return stats
\ No newline at end of file
+        if self.trace is not None:
+            self.trace.record(now, TraceEvent.ADMIT, car_id, direction)
+        if crossing_time is None:
+            crossing_time = self.crossing_time
+        depart_time = now + crossing_time
+        self.empty_at = max(self.empty_at, depart_time) if self.cars_on_bridge else depart_time
+        self.cars_on_bridge += 1
+        self.current_car = car_id
+        self.last_admit_time = now
+        self.statistics.record_wait(direction, wait_time)
+        self.occupancy.record(now, depart_time)
+        return wait_time
+
+    def release(self, direction: Direction, crossing_time: float, car_id: Optional[int] = None):
+        """
+        Машина съехала с моста (вызывается под блокировкой).
+        car_id: номер съехавшей машины, по умолчанию последней въехавшей
+        """
+        if car_id is None:
+            car_id = self.current_car
+        if self.trace is not None:
+            self.trace.record(self.clock.now(), TraceEvent.DEPART, car_id, direction)
+        self.cars_on_bridge -= 1
+        if self.cars_on_bridge == 0:
+            self.current_car = None
+        self.statistics.record_crossing(direction, crossing_time)
+
+    @property
+    def total_crossed(self) -> int:
+        return self.statistics.total_crossed
+
+    def get_statistics(self) -> Dict:
+        """Получение статистики работы моста"""
+        stats = self.statistics.get_statistics()
+        stats['throughput'] = self.occupancy.get_statistics()
+        if self.sync_stats is not None:
+            stats['synchronization'] = self.sync_stats.get_statistics(stats['total_crossed'])
+        return stats
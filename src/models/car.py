@@ -1,38 +1,66 @@
 # src/models/car.py
 import threading
-import time
-from typing import Optional
+from typing import Callable, Optional
 from .direction import Direction
 from .bridge import Bridge
-from ..utils.logger import get_logger
+from ..utils.logger import car_log_enabled, get_car_logger, get_logger
 
 logger = get_logger(__name__)
+car_logger = get_car_logger(__name__)
 
 class Car(threading.Thread):
-    """Представляет автомобиль как отдельный поток"""
+    """
+    Представляет автомобиль как отдельный поток.
+    Поток регистрируется в часах моста при запуске и снимается с учета
+    по завершении, чтобы виртуальные часы знали о всех участниках.
+    on_finish вызывается последним действием потока (и после ошибки),
+    так планировщик узнает о завершении машины без опроса потоков.
+    """
     
-    def __init__(self, car_id: int, direction: Direction, bridge: Bridge):
+    def __init__(self, car_id: int, direction: Direction, bridge: Bridge, *,
+                 crossing_time: Optional[float] = None,
+                 on_finish: Optional[Callable[['Car'], None]] = None):
         super().__init__(name=f"Car-{car_id}-{direction.value}")
         self.car_id = car_id
         self.direction = direction
         self.bridge = bridge
         self.crossed = False
-        self.crossing_time: Optional[float] = None
+        # Заданное время проезда (None — по умолчанию моста), после проезда — фактическое
+        self.crossing_time: Optional[float] = crossing_time
         self.waiting_time: Optional[float] = None
+        self.on_finish = on_finish
+
+    def start(self):
+        self.bridge.clock.register()
+        try:
+            super().start()
+        except BaseException:
+            self.bridge.clock.unregister()
+            raise
 
     def run(self):
         try:
             # Попытка проезда через мост
-            crossing_time, waiting_time = self.bridge.cross(self.car_id, self.direction)
+            crossing_time, waiting_time = self.bridge.cross(
+                self.car_id, self.direction, crossing_time=self.crossing_time
+            )
             
             # Обновляем статистику
             self.crossed = True
             self.crossing_time = crossing_time
             self.waiting_time = waiting_time
             
-            logger.info(f"Car {self.car_id} has crossed the bridge. "
-                       f"Crossing time: {crossing_time:.2f}s, "
-                       f"Waiting time: {waiting_time:.2f}s")
+            if car_log_enabled(car_logger, self.car_id):
+                car_logger.info("Car %d has crossed the bridge. Crossing time: %.2fs, Waiting time: %.2fs",
+                                self.car_id, crossing_time, waiting_time)
             
         except Exception as e:
-            logger.error(f"Error during bridge crossing: {e}", exc_info=True)
\ No newline at end of file
+            logger.error(f"Error during bridge crossing: {e}", exc_info=True)
+        finally:
+            self.bridge.clock.unregister()
+            # Как threading.Thread с _target: обработчик обычно ссылается на
+            # планировщик, а тот на машину — без ссылки цикла не остается,
+            # и потоки прогона освобождаются сразу, а не сборщиком мусора
+            on_finish, self.on_finish = self.on_finish, None
+            if on_finish is not None:
+                on_finish(self)
@@ -0,0 +1,15 @@
+# src/models/car_result.py
+from dataclasses import dataclass
+from typing import Optional
+from .direction import Direction
+
+@dataclass(slots=True)
+class CarResult:
+    """Результат проезда машины, выполненного как задача, а не отдельный поток"""
+    car_id: int
+    direction: Direction
+    arrival_time: float
+    crossed: bool = False
+    # Заданное время проезда (None — по умолчанию моста), после проезда — фактическое
+    crossing_time: Optional[float] = None
+    waiting_time: Optional[float] = None
@@ -0,0 +1,87 @@
+# src/models/network.py
+import threading
+from typing import Dict, Hashable, List, Mapping, Optional, Sequence, Tuple
+from .bridge import Bridge
+from .direction import Direction
+from .policy import SchedulingPolicy
+from ..utils.clock import Clock, RealClock
+from ..utils.statistics import TripStatistics
+
+BridgeId = Hashable
+Route = Sequence[BridgeId]
+
+
+def chain_route(bridge_ids: Sequence[BridgeId], direction: Direction) -> List[BridgeId]:
+    """Маршрут по цепочке мостов: слева направо по порядку, справа налево — в обратном"""
+    if direction == Direction.LEFT_TO_RIGHT:
+        return list(bridge_ids)
+    return list(reversed(bridge_ids))
+
+
+class BridgeNetwork:
+    """
+    Сеть однополосных мостов.
+
+    Машина проезжает мосты своего маршрута по очереди, между мостами
+    едет travel_time секунд. У каждого моста свои блокировка и очереди,
+    поэтому машины на разных мостах не конкурируют друг с другом.
+    По умолчанию мосты образуют цепочку (chain_route), отдельным машинам
+    можно задать свои маршруты через routes.
+
+    Сеть повторяет интерфейс Bridge (clock, cross, get_statistics),
+    поэтому Car и CarScheduler работают с ней без изменений.
+    """
+    def __init__(self, bridge_ids: Sequence[BridgeId], priority_direction: Optional[Direction] = None,
+                 clock: Optional[Clock] = None, travel_time: float = 0.0,
+                 routes: Optional[Mapping[int, Route]] = None, policy: Optional[SchedulingPolicy] = None):
+        if not bridge_ids:
+            raise ValueError("Network must contain at least one bridge")
+        self.clock = clock or RealClock()
+        self.bridge_ids = list(bridge_ids)
+        self.bridges: Dict[BridgeId, Bridge] = {
+            bridge_id: Bridge(priority_direction, clock=self.clock, policy=policy) for bridge_id in self.bridge_ids
+        }
+        self.travel_time = travel_time
+        self.routes = dict(routes or {})
+
+        # Сквозная статистика общая для всех машин, поэтому под своей блокировкой
+        self.lock = threading.Lock()
+        self.trips = TripStatistics()
+
+    def route_for(self, car_id: int, direction: Direction) -> Route:
+        """Маршрут машины"""
+        route = self.routes.get(car_id)
+        return route if route is not None else chain_route(self.bridge_ids, direction)
+
+    def cross(self, car_id: int, direction: Direction, arrival_time: Optional[float] = None,
+              crossing_time: Optional[float] = None) -> Tuple[float, float]:
+        """
+        Проезд всего маршрута (crossing_time — время проезда каждого моста).
+        Returns: (время в пути, суммарное время ожидания на мостах)
+        """
+        if arrival_time is None:
+            arrival_time = self.clock.now()
+
+        route = self.route_for(car_id, direction)
+        total_wait = 0.0
+        hop_arrival = arrival_time
+        for hop, bridge_id in enumerate(route):
+            if hop:
+                self.clock.sleep(self.travel_time)
+                hop_arrival = self.clock.now()
+            _, wait_time = self.bridges[bridge_id].cross(car_id, direction, hop_arrival, crossing_time)
+            total_wait += wait_time
+
+        trip_time = self.clock.now() - arrival_time
+        with self.lock:
+            self.trips.record_trip(trip_time, total_wait)
+        return trip_time, total_wait
+
+    def get_statistics(self) -> Dict:
+        """Сквозная статистика и статистика каждого моста"""
+        with self.lock:
+            stats = self.trips.get_statistics()
+        stats['bridges'] = {
+            bridge_id: bridge.get_statistics() for bridge_id, bridge in self.bridges.items()
+        }
+        return stats
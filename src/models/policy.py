@@ -0,0 +1,157 @@
+# src/models/policy.py
+from typing import Dict, Optional, Type
+import numpy as np
+from .direction import Direction
+from ..utils.arrival_format import DIRECTION_CODES, DIRECTIONS
+
+# Код "направление не выбрано" в векторных движках
+NO_DIRECTION = -1
+
+
+class SchedulingPolicy:
+    """
+    Правило выбора направления, которому отдается свободный мост.
+
+    Решение принимается за O(1) по состоянию голов очередей. Мост
+    (любой движок) предоставляет:
+        head_arrival(direction) -> Optional[float]  время прибытия первой
+                                                    ожидающей машины или None
+        queue_length(direction) -> int              число ожидающих машин
+        current_direction, consecutive_cars, MAX_CONSECUTIVE, priority_direction
+    В очередях должны быть только уже подъехавшие машины.
+
+    Векторный вариант choose_batch принимает то же состояние массивами
+    по сценариям (коды направлений из DIRECTION_CODES, np.inf — очередь пуста) и
+    используется пакетным движком.
+    """
+    # Нужны ли choose_batch длины очередей (их подсчет в пакете дороже)
+    needs_queue_lengths = False
+
+    def choose(self, bridge) -> Optional[Direction]:
+        raise NotImplementedError
+
+    def choose_batch(self, heads: np.ndarray, lengths: Optional[np.ndarray], current: np.ndarray,
+                     consecutive: np.ndarray, max_consecutive: int, priority: int) -> np.ndarray:
+        raise NotImplementedError
+
+    @staticmethod
+    def earliest(bridge, candidates=DIRECTIONS) -> Optional[Direction]:
+        """
+        Направление среди candidates, чья первая машина подъехала раньше.
+        При равенстве — текущее направление, затем порядок Direction.
+        """
+        chosen = None
+        chosen_arrival = None
+        for direction in candidates:
+            arrival = bridge.head_arrival(direction)
+            if arrival is None:
+                continue
+            if (chosen is None or arrival < chosen_arrival or
+                    (arrival == chosen_arrival and direction == bridge.current_direction)):
+                chosen, chosen_arrival = direction, arrival
+        return chosen
+
+    @staticmethod
+    def earliest_batch(heads: np.ndarray, current: np.ndarray) -> np.ndarray:
+        """Векторный earliest: heads — (2, scenarios), np.inf у пустых очередей"""
+        left, right = heads
+        code_l = DIRECTION_CODES[Direction.LEFT_TO_RIGHT]
+        code_r = DIRECTION_CODES[Direction.RIGHT_TO_LEFT]
+        right_wins = (right < left) | ((right == left) & (current == code_r))
+        return np.where(right_wins, code_r, code_l)
+
+
+class FIFOPolicy(SchedulingPolicy):
+    """Мост получает машина, которая подъехала раньше всех"""
+
+    def choose(self, bridge) -> Optional[Direction]:
+        return self.earliest(bridge)
+
+    def choose_batch(self, heads, lengths, current, consecutive, max_consecutive, priority):
+        return self.earliest_batch(heads, current)
+
+
+class AlternatingPolicy(SchedulingPolicy):
+    """
+    Правило по умолчанию: машины едут в порядке прибытия, но после
+    MAX_CONSECUTIVE машин подряд направление обязано смениться, если
+    с другой стороны кто-то ждет. Пока ждут с обеих сторон, приоритетное
+    направление едет первым и уступает только после MAX_CONSECUTIVE
+    своих машин подряд.
+    """
+
+    def choose(self, bridge) -> Optional[Direction]:
+        current = bridge.current_direction
+        waiting = [direction for direction in DIRECTIONS if bridge.head_arrival(direction) is not None]
+        if len(waiting) < 2:
+            return waiting[0] if waiting else None
+
+        limit_reached = current is not None and bridge.consecutive_cars >= bridge.MAX_CONSECUTIVE
+        priority = bridge.priority_direction
+        if priority is not None:
+            # Приоритетное направление уступает только исчерпав лимит
+            if current == priority and limit_reached:
+                return priority.opposite()
+            return priority
+        if limit_reached:
+            return current.opposite()
+        return self.earliest(bridge)
+
+    def choose_batch(self, heads, lengths, current, consecutive, max_consecutive, priority):
+        chosen = self.earliest_batch(heads, current)
+        both = np.isfinite(heads).all(axis=0)
+        limit_reached = (current != NO_DIRECTION) & (consecutive >= max_consecutive)
+        if priority == NO_DIRECTION:
+            return np.where(both & limit_reached, 1 - current, chosen)
+        yielded = (current == priority) & limit_reached
+        return np.where(both, np.where(yielded, 1 - priority, priority), chosen)
+
+
+class StrictPriorityPolicy(SchedulingPolicy):
+    """
+    Приоритетное направление едет всегда, когда в нем есть машины;
+    без приоритетного направления — как FIFO
+    """
+
+    def choose(self, bridge) -> Optional[Direction]:
+        priority = bridge.priority_direction
+        if priority is not None and bridge.head_arrival(priority) is not None:
+            return priority
+        return self.earliest(bridge)
+
+    def choose_batch(self, heads, lengths, current, consecutive, max_consecutive, priority):
+        chosen = self.earliest_batch(heads, current)
+        if priority == NO_DIRECTION:
+            return chosen
+        return np.where(np.isfinite(heads[priority]), priority, chosen)
+
+
+class LongestQueueFirstPolicy(SchedulingPolicy):
+    """Мост получает направление с самой длинной очередью, при равенстве — как FIFO"""
+    needs_queue_lengths = True
+
+    def choose(self, bridge) -> Optional[Direction]:
+        left, right = (bridge.queue_length(direction) for direction in DIRECTIONS)
+        if left == right:
+            return self.earliest(bridge)
+        return DIRECTIONS[0] if left > right else DIRECTIONS[1]
+
+    def choose_batch(self, heads, lengths, current, consecutive, max_consecutive, priority):
+        left, right = lengths
+        chosen = self.earliest_batch(heads, current)
+        return np.where(left > right, 0, np.where(right > left, 1, chosen))
+
+
+POLICIES: Dict[str, Type[SchedulingPolicy]] = {
+    'alternating': AlternatingPolicy,
+    'fifo': FIFOPolicy,
+    'priority': StrictPriorityPolicy,
+    'longest_queue': LongestQueueFirstPolicy,
+}
+
+
+def get_policy(name: str) -> SchedulingPolicy:
+    """Политика по имени из POLICIES"""
+    if name not in POLICIES:
+        raise ValueError(f"Unknown scheduling policy: {name}")
+    return POLICIES[name]()
@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 from .direction import Direction
 
-@dataclass
+@dataclass(slots=True)
 class QueuedCar:
     """Представляет машину в очереди на мост"""
     car_id: int
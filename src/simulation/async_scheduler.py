@@ -0,0 +1,88 @@
+# src/simulation/async_scheduler.py
+import asyncio
+from typing import Iterable, Iterator, List, Optional, Tuple
+from ..models.async_bridge import AsyncBridge
+from ..models.car_result import CarResult
+from ..models.direction import Direction
+from ..utils.input_reader import ensure_sorted
+from ..utils.logger import car_log_enabled, get_car_logger, get_logger
+
+logger = get_logger(__name__)
+car_logger = get_car_logger(__name__)
+
+class AsyncCarScheduler:
+    """
+    Управляет появлением машин-корутин на асинхронном мосту.
+    Прибытия планируются через loop.call_at: следующее прибытие ставится
+    в цикл событий только после предыдущего, поэтому в куче таймеров
+    лежит одно будущее прибытие, а не все машины сразу.
+    """
+
+    def __init__(self, cars_data: Iterable[Tuple[float, int, Direction]], bridge: AsyncBridge):
+        self.cars_data = ensure_sorted(cars_data)
+        self.bridge = bridge
+        self.results: List[CarResult] = []
+        self._arrivals: Optional[Iterator[Tuple[float, int, Direction]]] = None
+        self._start = 0.0
+        self._remaining = 0
+        self._all_arrived = False
+        self._done: Optional[asyncio.Future] = None
+
+    async def run(self):
+        """Запускает машины в заданные моменты времени и ждет их проезда"""
+        loop = asyncio.get_running_loop()
+        self._start = loop.time()
+        self._done = loop.create_future()
+        self._arrivals = iter(self.cars_data)
+
+        self._schedule_next_arrival(loop)
+        if not self._done.done():
+            await self._done
+
+    def _schedule_next_arrival(self, loop: asyncio.AbstractEventLoop):
+        for arrival_time, car_id, direction, *extra in self._arrivals:
+            self._remaining += 1
+            loop.call_at(self._start + arrival_time, self._arrive, loop, car_id, direction, *extra[:1])
+            return
+
+        # Входные данные закончились
+        self._all_arrived = True
+        self._check_done()
+
+    def _check_done(self):
+        if self._all_arrived and self._remaining == 0 and not self._done.done():
+            self._done.set_result(None)
+
+    def _arrive(self, loop: asyncio.AbstractEventLoop, car_id: int, direction: Direction,
+                crossing_time: Optional[float] = None):
+        """Машина подъехала к мосту"""
+        result = CarResult(car_id, direction, loop.time(), crossing_time=crossing_time)
+        if car_log_enabled(car_logger, car_id):
+            car_logger.info("Car %d approaching bridge from %s", car_id, direction.value)
+        self.results.append(result)
+        loop.create_task(self._drive(result))
+        self._schedule_next_arrival(loop)
+
+    async def _drive(self, result: CarResult):
+        """Корутина одной машины"""
+        try:
+            crossing_time, waiting_time = await self.bridge.cross(
+                result.car_id, result.direction, arrival_time=result.arrival_time,
+                crossing_time=result.crossing_time
+            )
+            result.crossed = True
+            result.crossing_time = crossing_time
+            result.waiting_time = waiting_time
+
+            if car_log_enabled(car_logger, result.car_id):
+                car_logger.info("Car %d has crossed the bridge. Crossing time: %.2fs, Waiting time: %.2fs",
+                                result.car_id, crossing_time, waiting_time)
+        except Exception as e:
+            logger.error(f"Error during bridge crossing: {e}", exc_info=True)
+        finally:
+            self._remaining -= 1
+            self._check_done()
+
+    def get_completed_cars(self) -> int:
+        """Возвращает количество машин, успешно проехавших мост"""
+        return sum(1 for result in self.results if result.crossed)
@@ -0,0 +1,240 @@
+# src/simulation/batched.py
+from collections.abc import Sequence
+from typing import Dict, Iterable, List, Optional, Tuple
+import numpy as np
+from ..models.direction import Direction
+from ..models.policy import NO_DIRECTION, AlternatingPolicy, SchedulingPolicy
+from ..utils.arrival_format import DIRECTION_CODES
+from ..utils.statistics import PERCENTILES
+
+CODE_L = DIRECTION_CODES[Direction.LEFT_TO_RIGHT]
+CODE_R = DIRECTION_CODES[Direction.RIGHT_TO_LEFT]
+
+
+def scenarios_to_arrays(scenarios: Iterable[Iterable[tuple]]
+                        ) -> Tuple[np.ndarray, np.ndarray, Optional[np.ndarray]]:
+    """
+    Собирает список сценариев (списков (arrival_time, car_id, direction[, crossing_time]))
+    в двумерные массивы времени прибытия, кодов направлений и времени
+    проезда (None, если ни у одной машины оно не задано).
+    Короткие сценарии дополняются np.inf. Машины упорядочиваются по
+    (arrival_time, car_id); уже упорядоченные сценарии, как обычно и бывает,
+    не сортируются, а номера машин читаются только при равном времени прибытия.
+    """
+    scenarios = [cars_data if isinstance(cars_data, Sequence) else list(cars_data) for cars_data in scenarios]
+    width = max((len(cars_data) for cars_data in scenarios), default=0)
+    arrival_times = np.full((len(scenarios), width), np.inf)
+    is_right = np.zeros((len(scenarios), width), dtype=bool)
+    crossing_times = np.full((len(scenarios), width), np.nan)
+    left, right = Direction.LEFT_TO_RIGHT, Direction.RIGHT_TO_LEFT
+    for row, cars_data in enumerate(scenarios):
+        count = len(cars_data)
+        if not count:
+            continue
+        arrival_times[row, :count] = [car[0] for car in cars_data]
+        # Сравнение по identity: хэширование Enum в DIRECTION_CODES намного дороже
+        directions = [car[2] for car in cars_data]
+        if directions.count(left) + directions.count(right) != count:
+            raise ValueError(f"Scenario {row} has cars with an unknown direction")
+        is_right[row, :count] = [direction is right for direction in directions]
+        if max(map(len, cars_data)) > 3:
+            crossing_times[row, :count] = [car[3] if len(car) > 3 else np.nan for car in cars_data]
+
+    # Сценарии с нарушенным порядком (или с равным временем прибытия
+    # и убывающими номерами машин) сортируются по отдельности
+    later, earlier = arrival_times[:, 1:], arrival_times[:, :-1]
+    unsorted = (later < earlier).any(axis=1)
+    ties = (later == earlier) & np.isfinite(later)
+    for row in np.flatnonzero(ties.any(axis=1) & ~unsorted):
+        car_ids = np.array([car[1] for car in scenarios[row]])
+        unsorted[row] = (ties[row, :len(car_ids) - 1] & (car_ids[1:] < car_ids[:-1])).any()
+    for row in np.flatnonzero(unsorted):
+        count = len(scenarios[row])
+        car_ids = np.array([car[1] for car in scenarios[row]])
+        order = np.lexsort((car_ids, arrival_times[row, :count]))
+        for column in (arrival_times, is_right, crossing_times):
+            column[row, :count] = column[row, order]
+
+    directions = np.where(is_right, CODE_R, CODE_L).astype(np.uint8)
+    if np.isnan(crossing_times).all():
+        crossing_times = None
+    return arrival_times, directions, crossing_times
+
+
+class BatchedBridgeSimulator:
+    """
+    Векторная симуляция множества независимых сценариев одновременно.
+
+    Все сценарии продвигаются в ногу: за один шаг в каждом сценарии на мост
+    въезжает одна машина, а состояние (головы очередей, текущее направление,
+    счетчик подряд идущих машин, часы) хранится в массивах NumPy по одному
+    элементу на сценарий. Результаты те же, что у EventDrivenBridge
+    с той же политикой: в очередях только подъехавшие машины, а следующую
+    машину выбирает policy.choose_batch сразу для всех сценариев.
+    """
+    def __init__(self, priority_direction: Optional[Direction] = None,
+                 max_consecutive: int = 3, crossing_time: float = 1.0,
+                 policy: Optional[SchedulingPolicy] = None):
+        self.priority_direction = priority_direction
+        self.MAX_CONSECUTIVE = max_consecutive
+        self.crossing_time = crossing_time
+        self.policy = policy or AlternatingPolicy()
+
+    @staticmethod
+    def _split_directions(masks: Tuple[np.ndarray, np.ndarray], *columns: np.ndarray) -> List[np.ndarray]:
+        """
+        Раскладывает колонки машин по направлениям: для каждой колонки массив
+        (2, scenarios, width + 1), где значения машин направления сдвинуты
+        к началу строки, а остаток заполнен np.inf. Лишний столбец np.inf
+        нужен, чтобы голова исчерпанной очереди читалась без проверок.
+        """
+        counts = np.stack([mask.sum(axis=1) for mask in masks])
+        width = int(counts.max(initial=0))
+        orders = [np.argsort(~mask, axis=1, kind='stable')[:, :width] for mask in masks]
+        padding = np.arange(width + 1) >= counts[:, :, None]
+        split_columns = []
+        for values in columns:
+            split = np.empty((2, len(values), width + 1))
+            for code, order in enumerate(orders):
+                split[code, :, :width] = np.take_along_axis(values, order, axis=1)
+            split[padding] = np.inf
+            split_columns.append(split)
+        return split_columns
+
+    def simulate(self, arrival_times: np.ndarray, directions: np.ndarray,
+                 crossing_times: Optional[np.ndarray] = None) -> Dict:
+        """
+        Запуск симуляции.
+        arrival_times: (scenarios, cars) время прибытия, np.inf/np.nan — нет машины
+        directions: (scenarios, cars) коды направлений из DIRECTION_CODES
+        crossing_times: (scenarios, cars) время проезда машин, np.nan —
+        self.crossing_time; по умолчанию у всех self.crossing_time
+        Returns: статистика в формате get_statistics(), где каждое значение —
+        массив длиной scenarios
+        """
+        arrival_times = np.asarray(arrival_times, dtype=np.float64)
+        directions = np.asarray(directions)
+        if crossing_times is None:
+            crossing_times = np.full(arrival_times.shape, self.crossing_time)
+        crossing_times = np.asarray(crossing_times, dtype=np.float64)
+        if arrival_times.ndim != 2 or not arrival_times.shape == directions.shape == crossing_times.shape:
+            raise ValueError("arrival_times, directions and crossing_times must be 2-D arrays of the same shape")
+        crossing_times = np.where(np.isnan(crossing_times), self.crossing_time, crossing_times)
+
+        valid = np.isfinite(arrival_times)
+        arrival_times = np.where(valid, arrival_times, np.inf)
+        order = np.argsort(arrival_times, axis=1, kind='stable')
+        arrival_times = np.take_along_axis(arrival_times, order, axis=1)
+        directions = np.take_along_axis(directions, order, axis=1)
+        crossing_times = np.take_along_axis(crossing_times, order, axis=1)
+        valid = np.take_along_axis(valid, order, axis=1)
+
+        masks = (valid & (directions == CODE_L), valid & (directions == CODE_R))
+        queues, durations = self._split_directions(masks, arrival_times, crossing_times)
+        stride = queues.shape[2]
+        queues, durations = queues.ravel(), durations.ravel()
+
+        scenarios = len(arrival_times)
+        rows = np.arange(scenarios)
+        totals = valid.sum(axis=1)
+        steps = int(totals.max(initial=0))
+
+        # heads — индексы первой ожидающей машины каждого направления в плоских
+        # queues и durations, tails — первой еще не подъехавшей; tails нужны
+        # только политикам, которые смотрят на длины очередей
+        heads = np.stack([rows, rows + scenarios]) * stride
+        tails = heads.copy() if self.policy.needs_queue_lengths else None
+        lengths = None
+        clock = np.full(scenarios, -np.inf)
+        current = np.full(scenarios, NO_DIRECTION, dtype=np.int8)
+        consecutive = np.zeros(scenarios, dtype=np.int64)
+        priority = NO_DIRECTION if self.priority_direction is None else DIRECTION_CODES[self.priority_direction]
+
+        # Строка — шаг, столбец — сценарий: каждый шаг пишет непрерывную строку,
+        # а шаги после конца сценария отбрасываются после цикла
+        waits = np.empty((max(steps, 1), scenarios))
+        crossings = np.empty((max(steps, 1), scenarios))
+        chosen_directions = np.empty((max(steps, 1), scenarios), dtype=np.int8)
+
+        # У закончившихся сценариев головы обеих очередей — np.inf
+        with np.errstate(invalid='ignore'):
+            for step in range(steps):
+                head_times = queues[heads]
+
+                # Мост свободен с момента clock; если никто не подъехал — ждем прибытия
+                now = np.maximum(clock, np.minimum(head_times[CODE_L], head_times[CODE_R]))
+                if tails is not None:
+                    for code in (CODE_L, CODE_R):
+                        while True:
+                            upcoming = queues[tails[code]]
+                            arrived = (upcoming <= now) & np.isfinite(upcoming)
+                            if not arrived.any():
+                                break
+                            tails[code] += arrived
+                    lengths = tails - heads
+
+                # Головы очередей, где еще никто не подъехал, для политики пусты
+                waiting = np.where(head_times <= now, head_times, np.inf)
+                choice = self.policy.choose_batch(
+                    waiting, lengths, current, consecutive, self.MAX_CONSECUTIVE, priority
+                )
+
+                picked = heads[choice, rows]
+                duration = durations[picked]
+                waits[step] = now - queues[picked]
+                crossings[step] = duration
+                chosen_directions[step] = choice
+
+                consecutive = np.where(current == choice, consecutive + 1, 1)
+                current = choice
+                heads[choice, rows] += step < totals
+                clock = now + duration
+
+        finished = np.arange(len(waits))[:, None] >= totals
+        waits[finished] = np.nan
+        crossings[finished] = 0.0
+        chosen_directions[finished] = NO_DIRECTION
+        return self._statistics(waits.T, crossings.T, chosen_directions.T, totals)
+
+    def _statistics(self, waits: np.ndarray, crossings: np.ndarray,
+                    chosen_directions: np.ndarray, totals: np.ndarray) -> Dict:
+        """Статистика по сценариям в формате get_statistics()"""
+        def summary(mask: np.ndarray) -> Dict:
+            counts = mask.sum(axis=1)
+            has_cars = counts > 0
+            divisor = np.maximum(counts, 1)
+            values = np.where(mask, waits, 0.0)
+            mean = values.sum(axis=1) / divisor
+            deviations = np.where(mask, waits - mean[:, None], 0.0)
+            result = {
+                'total_crossed': counts,
+                'avg_waiting_time': mean,
+                'max_waiting_time': np.where(has_cars, np.where(mask, waits, -np.inf).max(axis=1), 0.0),
+                'std_waiting_time': np.sqrt((deviations ** 2).sum(axis=1) / divisor),
+            }
+            # Перцентили по правилу ближайшего ранга, как у LogHistogram,
+            # но точные: отсутствующие значения уходят в конец строки
+            ordered = np.sort(np.where(mask, waits, np.inf), axis=1)
+            for percentile in PERCENTILES:
+                rank = np.maximum(np.ceil(percentile / 100 * counts).astype(np.int64), 1) - 1
+                value = np.take_along_axis(ordered, rank[:, None], axis=1)[:, 0]
+                result[f'p{percentile}_waiting_time'] = np.where(has_cars, value, 0.0)
+            return result
+
+        crossed = ~np.isnan(waits)
+        stats = summary(crossed)
+        stats['avg_crossing_time'] = crossings.sum(axis=1) / np.maximum(totals, 1)
+        stats['direction_stats'] = {
+            direction.value: summary(crossed & (chosen_directions == code))
+            for direction, code in DIRECTION_CODES.items()
+        }
+        return stats
+
+def simulate_scenarios(scenarios: List[List[Tuple[float, int, Direction]]],
+                       priority_direction: Optional[Direction] = None,
+                       max_consecutive: int = 3, crossing_time: float = 1.0,
+                       policy: Optional[SchedulingPolicy] = None) -> Dict:
+    """Удобная обертка: симуляция списка сценариев в формате входных данных"""
+    arrival_times, directions, crossing_times = scenarios_to_arrays(scenarios)
+    simulator = BatchedBridgeSimulator(priority_direction, max_consecutive, crossing_time, policy)
+    return simulator.simulate(arrival_times, directions, crossing_times)
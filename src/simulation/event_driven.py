@@ -0,0 +1,258 @@
+# src/simulation/event_driven.py
+import heapq
+import itertools
+import logging
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from ..models.direction import Direction
+from ..models.policy import SchedulingPolicy
+from ..utils.input_reader import ensure_sorted
+from ..utils.logger import car_log_enabled, get_car_logger
+from ..utils.trace import TraceEvent, TraceRecorder
+from .single_threaded import SingleThreadedBridge
+
+car_logger = get_car_logger(__name__)
+
+# Типы событий. При равном времени прибытия обрабатываются раньше
+# освобождения моста, чтобы решение о следующей машине учитывало всех,
+# кто уже подъехал. READY — истек интервал headway, и на мост может
+# въехать следующая попутная машина.
+ARRIVAL = 0
+DEPARTURE = 1
+READY = 2
+
+# (время, тип, порядковый номер, машина, направление, время проезда)
+Event = Tuple[float, int, int, int, Direction, float]
+
+
+class EventDrivenBridge(SingleThreadedBridge):
+    """
+    Дискретно-событийная симуляция моста.
+
+    Прибытия и освобождения моста хранятся в куче событий, время
+    симуляции перескакивает от события к событию. В очередях находятся
+    только уже подъехавшие машины, а входные данные читаются лениво:
+    в куче одновременно лежит не больше одного будущего прибытия,
+    поэтому стоимость обработки события не зависит от числа машин.
+    Следующую машину выбирает policy, как и у SingleThreadedBridge.
+
+    Кроме разового simulate модель можно вести онлайн, например по
+    данным датчиков: submit добавляет прибытие, advance_to обрабатывает
+    события до заданного момента, snapshot_stats возвращает статистику
+    и прогноз ожидания для стоящих в очереди машин. Каждый вызов
+    обрабатывает только новые события, история заново не считается.
+
+    Емкость capacity и интервал headway — как у SingleThreadedBridge:
+    при свободном месте на мосту за одно решение въезжает несколько
+    попутных машин.
+    """
+    def __init__(self, priority_direction: Optional[Direction] = None,
+                 max_consecutive: int = 3, crossing_time: float = 1.0,
+                 policy: Optional[SchedulingPolicy] = None, trace: Optional[TraceRecorder] = None,
+                 capacity: int = 1, headway: float = 0.0):
+        super().__init__(priority_direction, max_consecutive, crossing_time, policy, trace, capacity, headway)
+        self.current_time = 0.0
+        self.events: List[Event] = []
+        self._sequence = itertools.count()
+        # Момент, на который уже запланировано событие READY
+        self._ready_at: Optional[float] = None
+        # Решения в момент current_time уже приняты (время модели сдвигалось)
+        self._decided = False
+
+    @property
+    def bridge_busy(self) -> bool:
+        return bool(self.deck)
+
+    def schedule(self, event_time: float, kind: int, car_id: int, direction: Direction, crossing_time: float):
+        """Добавляет событие в кучу"""
+        heapq.heappush(self.events, (event_time, kind, next(self._sequence), car_id, direction, crossing_time))
+
+    def arrive(self, arrival_time: float, car_id: int, direction: Direction, crossing_time: Optional[float] = None):
+        """Машина подъехала к мосту и встала в очередь"""
+        if car_log_enabled(car_logger, car_id, logging.DEBUG):
+            car_logger.debug("Car %d approaching bridge from %s", car_id, direction.value)
+        if crossing_time is None:
+            crossing_time = self.crossing_time
+        self.queues[direction].append(arrival_time, car_id, crossing_time)
+        if self.trace is not None:
+            self.trace.record(arrival_time, TraceEvent.ARRIVE, car_id, direction)
+
+    def depart(self, car_id: int, direction: Direction, crossing_time: float):
+        """Машина съехала с моста"""
+        heapq.heappop(self.deck)
+        self.statistics.record_crossing(direction, crossing_time)
+        if self.trace is not None:
+            self.trace.record(self.current_time, TraceEvent.DEPART, car_id, direction)
+
+    def dispatch(self) -> bool:
+        """Пускает на мост выбранные политикой машины, пока для них есть место"""
+        admitted = False
+        deck = self.deck
+        now = self.current_time
+        while len(deck) < self.capacity:
+            direction, car_info = self.choose_next_car(now)
+            if not direction or not car_info:
+                break
+
+            if deck:
+                admit_time = self.next_admit_time(direction, now)
+                if admit_time > now:
+                    # Попутной машине мешает только headway — ее въезд разбудит
+                    # событие READY; остальных пустит съезд машины с моста
+                    if (direction == self.current_direction and len(deck) < self.capacity
+                            and admit_time < max(deck) and self._ready_at != admit_time):
+                        self._ready_at = admit_time
+                        self.schedule(admit_time, READY, -1, direction, 0.0)
+                    break
+
+            arrival_time, car_id, crossing_time = self.queues[direction].popleft()
+
+            # Обновляем состояние моста
+            if self.current_direction != direction:
+                self.current_direction = direction
+                self.consecutive_cars = 1
+                if self.trace is not None:
+                    self.trace.record(now, TraceEvent.SWITCH, car_id, direction)
+            else:
+                self.consecutive_cars += 1
+
+            if self.trace is not None:
+                self.trace.record(now, TraceEvent.ADMIT, car_id, direction)
+            wait_time = now - arrival_time
+            depart_time = now + crossing_time
+            heapq.heappush(deck, depart_time)
+            self.last_admit_time = now
+            self.statistics.record_wait(direction, wait_time)
+            self.occupancy.record(now, depart_time)
+            self.schedule(depart_time, DEPARTURE, car_id, direction, crossing_time)
+            admitted = True
+
+            if car_log_enabled(car_logger, car_id, logging.DEBUG):
+                car_logger.debug(
+                    "Car %d has crossed the bridge. Direction: %s, Waiting time: %.2fs",
+                    car_id, direction.value, wait_time
+                )
+        return admitted
+
+    def _schedule_next_arrival(self, arrivals: Iterator[Tuple[float, int, Direction]]):
+        """Кладет в кучу следующее прибытие из входного потока"""
+        for arrival_time, car_id, direction, *extra in arrivals:
+            crossing_time = extra[0] if extra else self.crossing_time
+            self.schedule(arrival_time, ARRIVAL, car_id, direction, crossing_time)
+            return
+
+    def _step(self, arrivals: Optional[Iterator[Tuple[float, int, Direction]]] = None):
+        """Обрабатывает ближайшее событие из кучи"""
+        event_time, kind, _, car_id, direction, crossing_time = heapq.heappop(self.events)
+        self.current_time = event_time
+        self._decided = True
+
+        if kind == ARRIVAL:
+            self.arrive(event_time, car_id, direction, crossing_time)
+            if arrivals is not None:
+                self._schedule_next_arrival(arrivals)
+        elif kind == DEPARTURE:
+            self.depart(car_id, direction, crossing_time)
+
+        # Решение принимается после всех событий в текущий момент
+        if not self.events or self.events[0][0] > self.current_time:
+            self.dispatch()
+
+    def simulate(self, cars_data: Iterable[Tuple[float, int, Direction]]) -> Dict:
+        """
+        Запуск симуляции.
+        cars_data: (arrival_time, car_id, direction[, crossing_time]), может
+        быть ленивым итератором, отсортированным по времени прибытия.
+        """
+        arrivals = iter(ensure_sorted(cars_data))
+        self._schedule_next_arrival(arrivals)
+
+        while self.events:
+            self._step(arrivals)
+
+        return self.get_statistics()
+
+    def submit(self, arrival_time: float, car_id: int, direction: Direction,
+               crossing_time: Optional[float] = None):
+        """
+        Онлайн-режим: машина подъедет в момент arrival_time.
+        Прибытия можно добавлять в любом порядке, но позже текущего
+        времени модели: решения до current_time включительно уже приняты.
+        Прибытие ровно в current_time допускается, только пока время
+        модели не сдвигалось.
+        """
+        if arrival_time < self.current_time or (arrival_time == self.current_time and self._decided):
+            raise ValueError(
+                f"Arrival at {arrival_time} is not later than the current simulation time {self.current_time}"
+            )
+        if crossing_time is None:
+            crossing_time = self.crossing_time
+        self.schedule(arrival_time, ARRIVAL, car_id, direction, crossing_time)
+
+    def advance_to(self, until: float) -> int:
+        """
+        Онлайн-режим: обрабатывает все события до момента until включительно
+        и переводит время модели в until. Решение в момент until окончательно,
+        поэтому к вызову должны быть добавлены все прибытия не позже until —
+        тогда результат совпадает с simulate по тем же машинам.
+        Returns: число обработанных событий
+        """
+        if until < self.current_time:
+            raise ValueError(f"Cannot go back from {self.current_time} to {until}")
+        processed = 0
+        while self.events and self.events[0][0] <= until:
+            self._step()
+            processed += 1
+        self.current_time = until
+        self._decided = True
+        return processed
+
+    def projected_waits(self) -> Dict[int, float]:
+        """
+        Прогноз полного времени ожидания машин в очередях, если новых машин
+        не будет: очереди доигрываются по той же политике с учетом машин,
+        которые сейчас на мосту. Стоимость пропорциональна длине очередей.
+        Returns: номер машины -> ожидаемое время ожидания
+        """
+        projection = SingleThreadedBridge(self.priority_direction, self.MAX_CONSECUTIVE,
+                                          self.crossing_time, self.policy, capacity=self.capacity,
+                                          headway=self.headway)
+        projection.queues = {direction: queue.copy() for direction, queue in self.queues.items()}
+        projection.current_direction = self.current_direction
+        projection.consecutive_cars = self.consecutive_cars
+        projection.deck = list(self.deck)
+        projection.last_admit_time = self.last_admit_time
+
+        now = self.current_time
+        waits = {}
+        while True:
+            direction = self.policy.choose(projection)
+            if direction is None:
+                break
+            now = projection.next_admit_time(direction, now)
+            arrival_time, car_id, crossing_time = projection.queues[direction].popleft()
+            if projection.current_direction != direction:
+                projection.current_direction = direction
+                projection.consecutive_cars = 1
+            else:
+                projection.consecutive_cars += 1
+            waits[car_id] = now - arrival_time
+            heapq.heappush(projection.deck, now + crossing_time)
+            projection.last_admit_time = now
+        return waits
+
+    def snapshot_stats(self) -> Dict:
+        """
+        Онлайн-режим: статистика проехавших машин на текущий момент,
+        состояние моста и прогноз ожидания стоящих в очереди машин
+        """
+        stats = self.get_statistics()
+        waits = self.projected_waits()
+        stats.update({
+            'current_time': self.current_time,
+            'bridge_busy': self.bridge_busy,
+            'current_direction': self.current_direction.value if self.current_direction else None,
+            'queue_lengths': {direction.value: len(queue) for direction, queue in self.queues.items()},
+            'projected_waits': waits,
+            'projected_max_waiting_time': max(waits.values(), default=0.0),
+        })
+        return stats
@@ -23,8 +23,8 @@ def run_multi_threaded_simulation(
     # Создание машин
     for i in range(num_cars):
         direction = Direction.LEFT_TO_RIGHT if i % 2 == 0 else Direction.RIGHT_TO_LEFT
-        priority = direction == priority_direction if priority_direction else False
-        car = Car(i, direction, bridge, priority)
+        # Приоритет направления учитывает сам мост
+        car = Car(i, direction, bridge)
         cars.append(car)
     
     # Запуск всех потоков
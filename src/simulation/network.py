@@ -0,0 +1,157 @@
+# src/simulation/network.py
+import heapq
+import itertools
+import logging
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple
+from ..models.direction import Direction
+from ..models.network import BridgeId, Route, chain_route
+from ..models.policy import SchedulingPolicy
+from ..utils.input_reader import ensure_sorted
+from ..utils.logger import car_log_enabled, get_car_logger
+from ..utils.statistics import TripStatistics
+from .event_driven import ARRIVAL, EventDrivenBridge
+
+car_logger = get_car_logger(__name__)
+
+NetworkEvent = Tuple[float, int, int, int, Direction, float, BridgeId]
+
+
+class _NetworkBridge(EventDrivenBridge):
+    """Мост сети: свои очереди и правила, но события идут в общую кучу сети"""
+
+    def __init__(self, network: 'NetworkEventSimulator', bridge_id: BridgeId, **kwargs):
+        super().__init__(**kwargs)
+        self.network = network
+        self.bridge_id = bridge_id
+
+    def schedule(self, event_time: float, kind: int, car_id: int, direction: Direction, crossing_time: float):
+        self.network.schedule(event_time, kind, car_id, direction, crossing_time, self.bridge_id)
+
+
+class _Trip:
+    """Машина в пути: маршрут, номер текущего моста, время въезда в сеть и время на мостах"""
+    __slots__ = ('route', 'hop', 'start_time', 'crossing_total')
+
+    def __init__(self, route: Route, start_time: float):
+        self.route = route
+        self.hop = 0
+        self.start_time = start_time
+        self.crossing_total = 0.0
+
+
+class NetworkEventSimulator:
+    """
+    Дискретно-событийная симуляция сети мостов в одном процессе.
+
+    Каждый мост — EventDrivenBridge со своими очередями и правилами
+    выбора, а события всех мостов лежат в одной куче. Как и у одного
+    моста, внешние прибытия читаются лениво, а решение на мосту
+    принимается после всех событий в текущий момент, причем только
+    на мостах, где что-то произошло. Поэтому стоимость события не зависит
+    ни от числа мостов, ни от числа машин.
+
+    cars_data: (arrival_time, car_id, direction), дополнительно можно
+    указать время проезда каждого моста (число) и маршрут (список мостов);
+    без маршрута машина проезжает мосты цепочкой (chain_route).
+    """
+    def __init__(self, bridge_ids: Sequence[BridgeId], priority_direction: Optional[Direction] = None,
+                 max_consecutive: int = 3, crossing_time: float = 1.0, travel_time: float = 0.0,
+                 routes: Optional[Mapping[int, Route]] = None, policy: Optional[SchedulingPolicy] = None):
+        if not bridge_ids:
+            raise ValueError("Network must contain at least one bridge")
+        self.bridge_ids = list(bridge_ids)
+        self.bridges: Dict[BridgeId, _NetworkBridge] = {
+            bridge_id: _NetworkBridge(
+                self, bridge_id, priority_direction=priority_direction,
+                max_consecutive=max_consecutive, crossing_time=crossing_time, policy=policy
+            )
+            for bridge_id in self.bridge_ids
+        }
+        self.crossing_time = crossing_time
+        self.travel_time = travel_time
+        self.routes = dict(routes or {})
+        self.current_time = 0.0
+        self.events: List[NetworkEvent] = []
+        self._sequence = itertools.count()
+        self._trips: Dict[int, _Trip] = {}
+        self.trips = TripStatistics()
+
+    def schedule(self, event_time: float, kind: int, car_id: int, direction: Direction,
+                 crossing_time: float, bridge_id: BridgeId):
+        """Добавляет событие моста bridge_id в общую кучу"""
+        heapq.heappush(
+            self.events, (event_time, kind, next(self._sequence), car_id, direction, crossing_time, bridge_id)
+        )
+
+    def _schedule_next_arrival(self, arrivals: Iterator[tuple]):
+        """Кладет в кучу въезд в сеть следующей машины из входного потока"""
+        for arrival_time, car_id, direction, *extra in arrivals:
+            route, crossing_time = None, self.crossing_time
+            for value in extra:
+                if isinstance(value, (int, float)):
+                    crossing_time = value
+                else:
+                    route = value
+            if route is None:
+                route = self.routes.get(car_id) or chain_route(self.bridge_ids, direction)
+            if not route:
+                raise ValueError(f"Car {car_id} has an empty route")
+            self._trips[car_id] = _Trip(route, arrival_time)
+            self.schedule(arrival_time, ARRIVAL, car_id, direction, crossing_time, route[0])
+            return
+
+    def _depart(self, car_id: int, direction: Direction, crossing_time: float):
+        """Машина съехала с моста: едет к следующему мосту или покидает сеть"""
+        trip = self._trips[car_id]
+        trip.hop += 1
+        trip.crossing_total += crossing_time
+        if trip.hop < len(trip.route):
+            self.schedule(
+                self.current_time + self.travel_time, ARRIVAL, car_id, direction, crossing_time, trip.route[trip.hop]
+            )
+            return
+
+        del self._trips[car_id]
+        trip_time = self.current_time - trip.start_time
+        waiting_time = trip_time - trip.crossing_total - (len(trip.route) - 1) * self.travel_time
+        self.trips.record_trip(trip_time, waiting_time)
+        if car_log_enabled(car_logger, car_id, logging.DEBUG):
+            car_logger.debug("Car %d left the network after %.2fs", car_id, trip_time)
+
+    def simulate(self, cars_data: Iterable[tuple]) -> Dict:
+        """Запуск симуляции сети (cars_data может быть ленивым итератором)"""
+        arrivals = iter(ensure_sorted(cars_data))
+        self._schedule_next_arrival(arrivals)
+        touched: Dict[BridgeId, _NetworkBridge] = {}
+
+        while self.events:
+            event_time, kind, _, car_id, direction, crossing_time, bridge_id = heapq.heappop(self.events)
+            self.current_time = event_time
+            bridge = self.bridges[bridge_id]
+            bridge.current_time = event_time
+
+            if kind == ARRIVAL:
+                bridge.arrive(event_time, car_id, direction, crossing_time)
+                # Въезд в сеть (первый мост маршрута) — берем следующую машину
+                if self._trips[car_id].hop == 0:
+                    self._schedule_next_arrival(arrivals)
+            else:
+                bridge.depart(car_id, direction, crossing_time)
+                self._depart(car_id, direction, crossing_time)
+            touched[bridge_id] = bridge
+
+            # Решения принимаются после всех событий в текущий момент
+            if not self.events or self.events[0][0] > self.current_time:
+                for bridge in touched.values():
+                    bridge.dispatch()
+                touched.clear()
+
+        return self.get_statistics()
+
+    def get_statistics(self) -> Dict:
+        """Сквозная статистика и статистика каждого моста"""
+        stats = self.trips.get_statistics()
+        stats['bridges'] = {
+            bridge_id: bridge.get_statistics() for bridge_id, bridge in self.bridges.items()
+        }
+        return stats
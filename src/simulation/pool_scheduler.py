@@ -0,0 +1,148 @@
+# src/simulation/pool_scheduler.py
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Deque, Iterable, List, Optional, Tuple
+from ..models.bridge import Bridge, Turn
+from ..models.car_result import CarResult
+from ..models.direction import Direction
+from ..utils.input_reader import ensure_sorted
+from ..utils.latch import CountDownLatch
+from ..utils.logger import car_log_enabled, get_car_logger, get_logger
+
+logger = get_logger(__name__)
+car_logger = get_car_logger(__name__)
+
+class PooledCarScheduler:
+    """
+    Управляет появлением машин, но вместо отдельного потока на машину
+    отдает проезды ограниченному пулу обработчиков.
+
+    Подъехавшая машина сразу встает в очередь моста (Bridge.request),
+    поэтому политика выбора видит всех ожидающих, как и в многопоточном
+    режиме. Обработчик занимают только машины, которым мост уже передан:
+    он дожидается конца проезда и освобождает мост. Если все обработчики
+    заняты, въехавшая машина ждет в очереди планировщика и съезжает
+    позже расписания, поэтому обработчиков должно быть не меньше, чем
+    машин одновременно на мосту (capacity или platoon_size).
+    """
+
+    def __init__(self, cars_data: Iterable[Tuple[float, int, Direction]], bridge: Bridge, max_workers: int = 8):
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+
+        self.cars_data = ensure_sorted(cars_data)
+        self.bridge = bridge
+        self.clock = bridge.clock
+        self.max_workers = max_workers
+        self.results: List[CarResult] = []
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="BridgeWorker")
+        self._lock = threading.Lock()
+        self._backlog: Deque[Tuple[CarResult, Turn]] = deque()
+        self._running = 0
+        self._completion = CountDownLatch()
+
+    def run(self):
+        """Ставит машины в очередь моста в заданные моменты времени"""
+        last_arrival = 0
+
+        # Пока планировщик ставит машины, симуляция не завершена
+        self._completion.count_up()
+        self.clock.register()
+        # На мосту есть место, но решение ждет остальных прибытий текущего момента
+        pass_on_pending = False
+        try:
+            for arrival_time, car_id, direction, *extra in self.cars_data:
+                wait_time = arrival_time - last_arrival
+                if pass_on_pending and wait_time > 0:
+                    self.bridge.settle_and_pass_on()
+                    pass_on_pending = False
+                self.clock.sleep(max(0.0, wait_time))
+                last_arrival = arrival_time
+
+                result = CarResult(car_id, direction, self.clock.now(), crossing_time=extra[0] if extra else None)
+                if car_log_enabled(car_logger, car_id):
+                    car_logger.info("Car %d approaching bridge from %s", car_id, direction.value)
+                self.results.append(result)
+                self._completion.count_up()
+                try:
+                    pass_on_pending |= self.bridge.request(car_id, direction, result.arrival_time,
+                                                           partial(self._admitted, result),
+                                                           crossing_time=result.crossing_time)
+                except BaseException:
+                    self._completion.count_down()
+                    raise
+            if pass_on_pending:
+                self.bridge.settle_and_pass_on()
+        finally:
+            self.clock.unregister()
+            self._completion.count_down()
+
+    def _admitted(self, result: CarResult, turn: Turn):
+        """
+        Мост передан машине или ей назначена повторная попытка въезда
+        (под блокировкой моста): то и другое отдается обработчику
+        """
+        with self._lock:
+            if self._running >= self.max_workers:
+                self._backlog.append((result, turn))
+                return
+            self._running += 1
+
+        # Обработчик считается участником симуляции с момента постановки задачи
+        self.clock.register()
+        self.executor.submit(self._work, result, turn)
+
+    def _work(self, result: Optional[CarResult], turn: Turn):
+        """Обработчик: проводит въехавшую машину и берет следующую из очереди"""
+        try:
+            while result is not None:
+                self._cross(result, turn)
+                with self._lock:
+                    if self._backlog:
+                        result, turn = self._backlog.popleft()
+                    else:
+                        result = None
+                        self._running -= 1
+        finally:
+            self.clock.unregister()
+
+    def _cross(self, result: CarResult, turn: Turn):
+        if turn.wait_time is None:
+            # Машине мешает только headway: повторяем передачу моста в момент въезда
+            try:
+                self.bridge.retry(turn)
+            except Exception as e:
+                logger.error(f"Error during bridge hand-off: {e}", exc_info=True)
+            return
+
+        result.waiting_time = turn.wait_time
+        try:
+            depart_time = turn.depart_time
+            if depart_time is None:
+                depart_time = turn.admit_time + turn.crossing_time
+            self.clock.sleep(depart_time - self.clock.now())
+            self.bridge.depart(result.car_id, result.direction, turn)
+            result.crossed = True
+            result.crossing_time = turn.crossing_time
+
+            if car_log_enabled(car_logger, result.car_id):
+                car_logger.info("Car %d has crossed the bridge. Crossing time: %.2fs, Waiting time: %.2fs",
+                                result.car_id, result.crossing_time, result.waiting_time)
+        except Exception as e:
+            logger.error(f"Error during bridge crossing: {e}", exc_info=True)
+        finally:
+            self._completion.count_down()
+
+    def wait_completion(self, timeout: Optional[float] = 60.0) -> bool:
+        """Ожидает завершения проезда всех машин"""
+        if not self._completion.wait(timeout):
+            return False
+
+        self.executor.shutdown(wait=False)
+        return True
+
+    def get_completed_cars(self) -> int:
+        """Возвращает количество машин, успешно проехавших мост"""
+        return sum(1 for result in self.results if result.crossed)
@@ -0,0 +1,106 @@
+# src/simulation/replay.py
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+from ..models.bridge import Bridge
+from ..models.direction import Direction
+from ..models.policy import get_policy
+from ..utils.arrival_format import DIRECTIONS
+from ..utils.clock import VirtualClock
+from ..utils.trace import Trace, TraceEvent, TraceRecorder
+from .event_driven import EventDrivenBridge
+from .scheduler import CarScheduler
+from .single_threaded import SingleThreadedBridge
+
+REPLAY_ENGINES = ('single', 'event', 'threaded')
+
+
+def cars_from_trace(trace: Trace) -> List[Tuple[float, int, Direction, float]]:
+    """
+    Восстанавливает входные данные по трассе: прибытия берутся из ARRIVE,
+    а время проезда каждой машины — как разность DEPART и ADMIT.
+    """
+    arrivals = trace.of_kind(TraceEvent.ARRIVE)
+    admits = trace.of_kind(TraceEvent.ADMIT)
+    departs = trace.of_kind(TraceEvent.DEPART)
+    if not len(arrivals) == len(admits) == len(departs):
+        raise ValueError("Trace is incomplete: every car must arrive, be admitted and depart")
+
+    # Номера машин уникальны, поэтому въезды и съезды сопоставляются сортировкой
+    admit_order = np.argsort(admits['car_id'], kind='stable')
+    depart_order = np.argsort(departs['car_id'], kind='stable')
+    car_ids = admits['car_id'][admit_order]
+    if (not np.array_equal(car_ids, departs['car_id'][depart_order]) or
+            not np.array_equal(car_ids, np.sort(arrivals['car_id']))):
+        raise ValueError("Trace arrivals, admissions and departures do not match")
+    crossing_times = departs['time'][depart_order] - admits['time'][admit_order]
+    crossing = crossing_times[np.searchsorted(car_ids, arrivals['car_id'])]
+    return [
+        (time, car_id, DIRECTIONS[code], duration)
+        for time, car_id, code, duration in zip(
+            arrivals['time'].tolist(), arrivals['car_id'].tolist(), arrivals['direction'].tolist(), crossing.tolist()
+        )
+    ]
+
+
+def replay(trace: Trace, engine: str = 'single', timeout: float = 120.0) -> np.ndarray:
+    """
+    Прогоняет восстановленные из трассы машины через движок engine
+    с параметрами из метаданных трассы. Колонны (platoon_size) есть только
+    у многопоточного моста, поэтому такие трассы воспроизводятся только им.
+    Returns: события новой трассы
+    """
+    if engine not in REPLAY_ENGINES:
+        raise ValueError(f"Unknown replay engine: {engine}")
+    metadata = trace.metadata
+    platoon_size = metadata.get('platoon_size')
+    if platoon_size is not None and engine != 'threaded':
+        raise ValueError(f"Trace was recorded with platoon_size={platoon_size}, "
+                         f"which only the threaded engine supports")
+    priority = metadata.get('priority_direction')
+    priority = Direction(priority) if priority else None
+    policy = get_policy(metadata.get('policy', 'alternating'))
+    max_consecutive = metadata.get('max_consecutive', 3)
+    capacity = metadata.get('capacity', 1)
+    headway = metadata.get('headway', 0.0)
+    cars_data = sorted(cars_from_trace(trace), key=lambda car: (car[0], car[1]))
+
+    recorder = TraceRecorder(metadata=metadata)
+    if engine == 'threaded':
+        bridge = Bridge(priority, clock=VirtualClock(), policy=policy, trace=recorder,
+                        platoon_size=platoon_size, capacity=capacity, headway=headway)
+        bridge.MAX_CONSECUTIVE = max_consecutive
+        scheduler = CarScheduler(cars_data, bridge)
+        scheduler.run()
+        if not scheduler.wait_completion(timeout):
+            raise TimeoutError("Replay did not finish in time")
+    else:
+        engine_cls = SingleThreadedBridge if engine == 'single' else EventDrivenBridge
+        engine_cls(priority, max_consecutive, policy=policy, trace=recorder,
+                   capacity=capacity, headway=headway).simulate(cars_data)
+    return recorder.events()
+
+
+def compare_decisions(expected: np.ndarray, actual: np.ndarray, tolerance: float = 1e-6) -> Optional[str]:
+    """
+    Сравнивает решения двух трасс: порядок въезда машин на мост и моменты
+    въезда. Returns: описание первого расхождения или None
+    """
+    expected = expected[expected['kind'] == TraceEvent.ADMIT]
+    actual = actual[actual['kind'] == TraceEvent.ADMIT]
+    common = min(len(expected), len(actual))
+    differs = ((expected['car_id'][:common] != actual['car_id'][:common]) |
+               (np.abs(expected['time'][:common] - actual['time'][:common]) > tolerance))
+    if differs.any():
+        index = int(np.argmax(differs))
+        want, got = expected[index], actual[index]
+        return (f"Decision {index}: expected car {want['car_id']} at {want['time']:.6f}, "
+                f"got car {got['car_id']} at {got['time']:.6f}")
+    if len(expected) != len(actual):
+        return f"Expected {len(expected)} admissions, got {len(actual)}"
+    return None
+
+
+def summarize(trace: Trace) -> Dict[str, int]:
+    """Число событий каждого типа"""
+    counts = np.bincount(trace.events['kind'], minlength=len(TraceEvent))
+    return {kind.name.lower(): int(counts[kind]) for kind in TraceEvent}
@@ -1,53 +1,136 @@
 # src/simulation/scheduler.py
 import threading
-import time
-from typing import List, Tuple
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
 from ..models.car import Car
 from ..models.bridge import Bridge
 from ..models.direction import Direction
-from ..utils.logger import get_logger
+from ..utils.input_reader import ensure_sorted
+from ..utils.latch import CountDownLatch
+from ..utils.logger import car_log_enabled, get_car_logger, get_logger
+from ..utils.performance import profiled, span
 
 logger = get_logger(__name__)
+car_logger = get_car_logger(__name__)
+
+# Обработчик прогресса: (проехало машин, всего машин)
+ProgressCallback = Callable[[int, int], None]
 
 class CarScheduler:
-    """Управляет появлением машин и их движением"""
+    """
+    Управляет появлением машин и их движением.
+    Машина сообщает планировщику о завершении сама, поэтому ожидание
+    конца симуляции не опрашивает потоки, а число проехавших машин
+    хранится счетчиком.
+    """
     
-    def __init__(self, cars_data: List[Tuple[float, int, Direction]], bridge: Bridge):
-        self.cars_data = sorted(cars_data)
+    def __init__(self, cars_data: Iterable[Tuple[float, int, Direction]], bridge: Bridge,
+                 on_progress: Optional[ProgressCallback] = None):
+        # Данные могут быть ленивым итератором: машины читаются по мере прибытия
+        self.cars_data = ensure_sorted(cars_data)
         self.bridge = bridge
+        self.clock = bridge.clock
         self.cars: List[Car] = []
         self.active_cars: List[threading.Thread] = []
+        # Для ленивого входа общее число машин становится известно по мере прибытия
+        self.total_cars: Optional[int] = len(self.cars_data) if hasattr(self.cars_data, '__len__') else None
+        self._progress_callbacks: List[ProgressCallback] = [on_progress] if on_progress else []
+        self._lock = threading.Lock()
+        self._completion = CountDownLatch()
+        self._finished: Set[int] = set()
+        self._subset_latches: Dict[int, List[CountDownLatch]] = {}
+        self._crossed = 0
+
+    def add_progress_callback(self, callback: ProgressCallback):
+        """callback(crossed, total) вызывается потоком каждой завершившейся машины"""
+        self._progress_callbacks.append(callback)
 
+    @profiled('CarScheduler.run')
     def run(self):
         """Запускает машины в заданные моменты времени"""
-        simulation_start = time.time()
         last_arrival = 0
 
-        for arrival_time, car_id, direction in self.cars_data:
-            # Ждем до следующего времени прибытия
-            wait_time = arrival_time - last_arrival
-            if wait_time > 0:
-                time.sleep(wait_time)
-            last_arrival = arrival_time
-            
-            # Создаем и запускаем машину
-            car = Car(car_id, direction, self.bridge)
-            logger.info(f"Car {car_id} approaching bridge from {direction.value}")
-            car.start()
-            self.cars.append(car)
-
-    def wait_completion(self, timeout: float = 60.0) -> bool:
-        """Ожидает завершения проезда всех машин"""
-        end_time = time.time() + timeout
-        
-        while time.time() < end_time:
-            # Проверяем все ли машины проехали
-            if all(not car.is_alive() for car in self.cars):
-                return True
-            time.sleep(0.1)
-        
+        # Пока планировщик запускает машины, симуляция не завершена
+        self._completion.count_up()
+        # Планировщик тоже участник: пока он не уснул, виртуальное время стоит
+        self.clock.register()
+        try:
+            for arrival_time, car_id, direction, *extra in self.cars_data:
+                # Ждем до следующего времени прибытия. С виртуальными часами
+                # sleep(0) дает уже запущенным машинам встать в очередь
+                # до появления следующей.
+                wait_time = arrival_time - last_arrival
+                with span('wait_arrival'):
+                    self.clock.sleep(max(0.0, wait_time))
+                last_arrival = arrival_time
+
+                # Создаем и запускаем машину
+                with span('start_car'):
+                    car = Car(car_id, direction, self.bridge, crossing_time=extra[0] if extra else None,
+                              on_finish=self._car_finished)
+                    if car_log_enabled(car_logger, car_id):
+                        car_logger.info("Car %d approaching bridge from %s", car_id, direction.value)
+                    self._completion.count_up()
+                    try:
+                        car.start()
+                    except BaseException:
+                        self._completion.count_down()
+                        raise
+                self.cars.append(car)
+        finally:
+            self.clock.unregister()
+            with self._lock:
+                if self.total_cars is None:
+                    self.total_cars = len(self.cars)
+            self._completion.count_down()
+
+    def _car_finished(self, car: Car):
+        """Вызывается потоком машины последним действием"""
+        with self._lock:
+            self._finished.add(car.car_id)
+            if car.crossed:
+                self._crossed += 1
+            crossed = self._crossed
+            total = self.total_cars if self.total_cars is not None else len(self.cars)
+            latches = self._subset_latches.pop(car.car_id, ())
+        for latch in latches:
+            latch.count_down()
+        for callback in self._progress_callbacks:
+            try:
+                callback(crossed, total)
+            except Exception as e:
+                logger.error(f"Progress callback failed: {e}", exc_info=True)
+        self._completion.count_down()
+
+    def wait_completion(self, timeout: Optional[float] = 60.0) -> bool:
+        """
+        Ожидает завершения проезда всех машин.
+        Returns: True, как только завершилась последняя машина; False по таймауту
+        """
+        return self._completion.wait(timeout)
+
+    def wait_for(self, car_ids: Iterable[int], timeout: Optional[float] = 60.0) -> bool:
+        """
+        Ожидает завершения машин с номерами car_ids (в том числе еще не подъехавших).
+        Returns: False по таймауту
+        """
+        latch = CountDownLatch()
+        with self._lock:
+            pending = set(car_ids) - self._finished
+            for car_id in pending:
+                latch.count_up()
+                self._subset_latches.setdefault(car_id, []).append(latch)
+        if latch.wait(timeout):
+            return True
+        # Таймаут: снимаем защелку, чтобы она не копилась у машин
+        with self._lock:
+            for car_id in pending:
+                latches = self._subset_latches.get(car_id)
+                if latches and latch in latches:
+                    latches.remove(latch)
+                    if not latches:
+                        del self._subset_latches[car_id]
         return False
 
     def get_completed_cars(self) -> int:
         """Возвращает количество машин, успешно проехавших мост"""
-        return sum(1 for car in self.cars if car.crossed)
\ No newline at end of file
+        return self._crossed
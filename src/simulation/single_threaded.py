@@ -1,150 +1,177 @@
-from typing import List, Tuple, Dict, Optional
+import heapq
+from typing import Iterable, List, Tuple, Dict, Optional
+from ..models.arrival_queue import ArrivalQueue, QueueItem
 from ..models.direction import Direction
-from ..utils.logger import get_logger
-from collections import deque
+from ..models.policy import AlternatingPolicy, SchedulingPolicy
+from ..utils.input_reader import ensure_sorted
+from ..utils.logger import car_log_enabled, get_car_logger
+from ..utils.performance import profiled, profiler
+from ..utils.statistics import CrossingStatistics, OccupancyStatistics
+from ..utils.trace import TraceEvent, TraceRecorder
 
-logger = get_logger(__name__)
+car_logger = get_car_logger(__name__)
 
 class SingleThreadedBridge:
-    """Однопоточная реализация моста"""
-    def __init__(self, priority_direction: Optional[Direction] = None):
+    """
+    Однопоточная реализация моста.
+    В очереди попадают только машины, подъехавшие к моменту освобождения
+    моста; следующую машину выбирает policy (по умолчанию AlternatingPolicy),
+    как и у многопоточного Bridge. С trace записываются события моста.
+
+    На мосту одновременно может быть до capacity машин одного направления,
+    попутная машина въезжает не раньше чем через headway после предыдущей,
+    а встречная ждет, пока мост опустеет. По умолчанию (capacity=1) машины
+    едут строго по одной.
+    """
+    def __init__(self, priority_direction: Optional[Direction] = None,
+                 max_consecutive: int = 3, crossing_time: float = 1.0,
+                 policy: Optional[SchedulingPolicy] = None, trace: Optional[TraceRecorder] = None,
+                 capacity: int = 1, headway: float = 0.0):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        if headway < 0:
+            raise ValueError("headway must not be negative")
         self.current_direction: Optional[Direction] = None
         self.consecutive_cars = 0
-        self.MAX_CONSECUTIVE = 3
+        self.MAX_CONSECUTIVE = max_consecutive
+        self.crossing_time = crossing_time
         self.priority_direction = priority_direction
+        self.policy = policy or AlternatingPolicy()
+        self.trace = trace
+        self.capacity = capacity
+        self.headway = headway
+        # Моменты съезда машин, которые сейчас на мосту (куча), и последний въезд
+        self.deck: List[float] = []
+        self.last_admit_time = 0.0
         
-        # Очереди для машин с указанием времени прибытия
+        # Очереди машин: колонки времени прибытия, номера и времени проезда
         self.queues = {
-            Direction.LEFT_TO_RIGHT: deque(),
-            Direction.RIGHT_TO_LEFT: deque()
+            Direction.LEFT_TO_RIGHT: ArrivalQueue(),
+            Direction.RIGHT_TO_LEFT: ArrivalQueue()
         }
         
         # Статистика
-        self.total_crossed = 0
-        self.crossing_times: List[float] = []
-        self.waiting_times: List[float] = []
-        self.direction_stats = {
-            Direction.LEFT_TO_RIGHT: {'crossed': 0, 'total_wait': 0},
-            Direction.RIGHT_TO_LEFT: {'crossed': 0, 'total_wait': 0}
-        }
+        self.statistics = CrossingStatistics()
+        self.occupancy = OccupancyStatistics(capacity, headway)
 
-    def can_switch_direction(self, new_direction: Direction) -> bool:
-        """Проверяет возможность смены направления движения"""
-        if self.current_direction is None:
-            return True
-            
-        if self.current_direction == new_direction:
-            if self.consecutive_cars >= self.MAX_CONSECUTIVE:
-                return len(self.queues[new_direction.opposite()]) == 0
-            return True
-            
-        return False
+    def head_arrival(self, direction: Direction) -> Optional[float]:
+        """Время прибытия первой машины очереди или None, если очередь пуста"""
+        return self.queues[direction].head_arrival()
 
-    def choose_next_car(self, current_time: float) -> Tuple[Optional[Direction], Optional[Tuple[float, int]]]:
-        """Выбирает следующую машину для проезда"""
-        # Если есть приоритетное направление и машины в обоих направлениях
-        if (self.priority_direction and 
-            all(len(q) > 0 for q in self.queues.values())):
-            return self.priority_direction, self.queues[self.priority_direction][0]
-            
-        # Если можно продолжить текущее направление
-        if (self.current_direction and 
-            len(self.queues[self.current_direction]) > 0 and
-            self.can_switch_direction(self.current_direction)):
-            return self.current_direction, self.queues[self.current_direction][0]
-            
-        # Проверяем очереди с учетом времени прибытия
-        earliest_time = float('inf')
-        chosen_direction = None
-        chosen_car = None
+    def queue_length(self, direction: Direction) -> int:
+        return len(self.queues[direction])
 
-        for direction in Direction:
-            if len(self.queues[direction]) > 0:
-                arrival_time, car_id = self.queues[direction][0]
-                if arrival_time < earliest_time:
-                    earliest_time = arrival_time
-                    chosen_direction = direction
-                    chosen_car = (arrival_time, car_id)
+    def choose_next_car(self, current_time: float) -> Tuple[Optional[Direction], Optional[QueueItem]]:
+        """Выбирает следующую машину для проезда"""
+        direction = self.policy.choose(self)
+        if direction is None:
+            return None, None
+        return direction, self.queues[direction].peek()
 
-        return chosen_direction, chosen_car
+    def next_admit_time(self, direction: Direction, now: float) -> float:
+        """
+        Самый ранний момент не раньше now, когда машина направления direction
+        может въехать: попутная — при свободном месте и через headway после
+        предыдущего въезда, любая — когда мост опустеет
+        """
+        deck = self.deck
+        while deck and deck[0] <= now:
+            heapq.heappop(deck)
+        if not deck:
+            return now
+        empty_at = max(deck)
+        if direction != self.current_direction:
+            return empty_at
+        admit_time = max(now, self.last_admit_time + self.headway)
+        if len(deck) >= self.capacity:
+            admit_time = max(admit_time, deck[0])
+        return min(admit_time, empty_at)
 
-    def simulate(self, cars_data: List[Tuple[float, int, Direction]]) -> Dict:
-        """Запуск симуляции"""
+    @profiled('SingleThreadedBridge.simulate')
+    def simulate(self, cars_data: Iterable[Tuple[float, int, Direction]]) -> Dict:
+        """Запуск симуляции (cars_data может быть ленивым итератором)"""
         current_time = 0.0  # Текущее время симуляции
+        arrivals = iter(ensure_sorted(cars_data))
+        # Обертки выбираются до цикла: без профилирования это исходные функции
+        read_arrival = profiler.wrap(next, 'read_arrival')
+        choose_next_car = profiler.wrap(self.choose_next_car, 'choose_next_car')
+        deck = self.deck
+        capacity = self.capacity
+        pending = read_arrival(arrivals, None)
         
-        # Распределяем машины по очередям
-        for arrival_time, car_id, direction in sorted(cars_data):
-            logger.info(f"Car {car_id} approaching bridge from {direction.value}")
-            self.queues[direction].append((arrival_time, car_id))
-        
-        # Обрабатываем машины
-        while any(len(q) > 0 for q in self.queues.values()):
-            direction, car_info = self.choose_next_car(current_time)
+        while pending is not None or any(self.queues.values()):
+            # Мост простаивает — переходим к прибытию следующей машины
+            if pending is not None and not any(self.queues.values()):
+                current_time = max(current_time, pending[0])
+
+            # Ставим в очереди всех, кто подъехал к текущему моменту
+            while pending is not None and pending[0] <= current_time:
+                arrival_time, car_id, direction, *extra = pending
+                if car_log_enabled(car_logger, car_id):
+                    car_logger.info("Car %d approaching bridge from %s", car_id, direction.value)
+                crossing_time = extra[0] if extra else self.crossing_time
+                self.queues[direction].append(arrival_time, car_id, crossing_time)
+                if self.trace is not None:
+                    self.trace.record(arrival_time, TraceEvent.ARRIVE, car_id, direction)
+                pending = read_arrival(arrivals, None)
+
+            direction, car_info = choose_next_car(current_time)
             if not direction or not car_info:
                 break
+
+            if deck:
+                admit_time = self.next_admit_time(direction, current_time)
+                if admit_time > current_time:
+                    # Места на мосту пока нет; до этого момента решение может
+                    # измениться только с прибытием новой машины
+                    if pending is not None and pending[0] < admit_time:
+                        admit_time = pending[0]
+                    current_time = admit_time
+                    continue
                 
-            arrival_time, car_id = car_info
-            self.queues[direction].popleft()
-            
-            # Переходим к времени прибытия машины, если оно больше текущего
-            if arrival_time > current_time:
-                current_time = arrival_time
+            arrival_time, car_id, crossing_time = self.queues[direction].popleft()
             
             # Обновляем состояние моста
             if self.current_direction != direction:
                 self.current_direction = direction
                 self.consecutive_cars = 1
+                if self.trace is not None:
+                    self.trace.record(current_time, TraceEvent.SWITCH, car_id, direction)
             else:
                 self.consecutive_cars += 1
             
             # Симулируем проезд
-            crossing_time = 1.0
-            wait_time = max(0.0, current_time - arrival_time)
-            current_time += crossing_time
+            wait_time = current_time - arrival_time
+            depart_time = current_time + crossing_time
+            if self.trace is not None:
+                self.trace.record(current_time, TraceEvent.ADMIT, car_id, direction)
+                self.trace.record(depart_time, TraceEvent.DEPART, car_id, direction)
+            heapq.heappush(deck, depart_time)
+            self.last_admit_time = current_time
             
             # Обновляем статистику
-            self.total_crossed += 1
-            self.crossing_times.append(crossing_time)
-            self.waiting_times.append(wait_time)
-            self.direction_stats[direction]['crossed'] += 1
-            self.direction_stats[direction]['total_wait'] += wait_time
-            
-            logger.info(
-                f"Car {car_id} has crossed the bridge. "
-                f"Direction: {direction.value}, "
-                f"Crossing time: {crossing_time:.2f}s, "
-                f"Waiting time: {wait_time:.2f}s"
-            )
+            self.statistics.record_wait(direction, wait_time)
+            self.statistics.record_crossing(direction, crossing_time)
+            self.occupancy.record(current_time, depart_time)
             
-            # После MAX_CONSECUTIVE машин меняем направление
-            if self.consecutive_cars >= self.MAX_CONSECUTIVE:
-                if len(self.queues[direction.opposite()]) > 0:
-                    self.current_direction = None
-                    self.consecutive_cars = 0
+            if car_log_enabled(car_logger, car_id):
+                car_logger.info(
+                    "Car %d has crossed the bridge. Direction: %s, Crossing time: %.2fs, Waiting time: %.2fs",
+                    car_id, direction.value, crossing_time, wait_time
+                )
+
+            # На заполненный мост до ближайшего съезда никто не въедет
+            if len(deck) >= capacity:
+                current_time = heapq.heappop(deck)
         
         return self.get_statistics()
 
+    @property
+    def total_crossed(self) -> int:
+        return self.statistics.total_crossed
+
     def get_statistics(self) -> Dict:
         """Получение статистики"""
-        stats = {
-            'total_crossed': self.total_crossed,
-            'avg_crossing_time': sum(self.crossing_times) / len(self.crossing_times) 
-                if self.crossing_times else 0,
-            'avg_waiting_time': sum(self.waiting_times) / len(self.waiting_times) 
-                if self.waiting_times else 0,
-            'max_waiting_time': max(self.waiting_times) if self.waiting_times else 0,
-            'direction_stats': {}
-        }
-        
-        for direction, dir_stats in self.direction_stats.items():
-            if dir_stats['crossed'] > 0:
-                avg_wait = dir_stats['total_wait'] / dir_stats['crossed']
-            else:
-                avg_wait = 0
-                
-            stats['direction_stats'][direction.value] = {
-                'total_crossed': dir_stats['crossed'],
-                'avg_waiting_time': avg_wait
-            }
-        
-        return stats
\ No newline at end of file
+        stats = self.statistics.get_statistics()
+        stats['throughput'] = self.occupancy.get_statistics()
+        return stats
@@ -0,0 +1,208 @@
+# src/simulation/sweep.py
+import csv
+import itertools
+import json
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Set
+from ..models.direction import Direction
+from ..models.policy import get_policy
+from ..utils.arrival_format import ArrivalColumns
+from ..utils.input_reader import InputReader
+from ..utils.logger import configure_logging, get_logger
+from .event_driven import EventDrivenBridge
+from .single_threaded import SingleThreadedBridge
+
+logger = get_logger(__name__)
+
+# Движки, которые можно перебирать: имя -> класс с simulate(cars_data)
+ENGINES = {
+    'single': SingleThreadedBridge,
+    'event': EventDrivenBridge,
+}
+
+NO_PRIORITY = 'none'
+
+# Колонки результата: параметры прогона и сводная статистика
+STAT_FIELDS = (
+    'total_crossed', 'avg_waiting_time', 'max_waiting_time', 'std_waiting_time',
+    'p50_waiting_time', 'p95_waiting_time', 'p99_waiting_time',
+)
+DIRECTION_FIELDS = tuple(
+    f'{direction.value}_{field}'
+    for direction in Direction for field in ('total_crossed', 'avg_waiting_time')
+)
+
+
+@dataclass(frozen=True)
+class SweepCase:
+    """Один прогон перебора параметров"""
+    input_file: str
+    engine: str = 'event'
+    max_consecutive: int = 3
+    priority_direction: str = NO_PRIORITY
+    arrival_rate: float = 1.0
+    crossing_time: float = 1.0
+    policy: str = 'alternating'
+
+    @property
+    def key(self) -> str:
+        """Идентификатор прогона, по которому возобновляется прерванный перебор"""
+        return '|'.join(str(value) for value in asdict(self).values())
+
+
+FIELDS = ('key',) + tuple(SweepCase.__dataclass_fields__) + STAT_FIELDS + DIRECTION_FIELDS
+
+
+def build_grid(input_files: Iterable[str], engines: Iterable[str] = ('event',),
+               max_consecutive: Iterable[int] = (3,), priority_directions: Iterable[str] = (NO_PRIORITY,),
+               arrival_rates: Iterable[float] = (1.0,), crossing_times: Iterable[float] = (1.0,),
+               policies: Iterable[str] = ('alternating',)) -> List[SweepCase]:
+    """Декартово произведение значений параметров"""
+    return [
+        SweepCase(*values)
+        for values in itertools.product(
+            input_files, engines, max_consecutive, priority_directions, arrival_rates, crossing_times, policies
+        )
+    ]
+
+
+@lru_cache(maxsize=4)
+def _load_cars(input_file: str):
+    """Входной файл читается в процессе один раз на все его прогоны"""
+    return InputReader.read_cars_data(input_file)
+
+
+def _scale_arrivals(cars_data, arrival_rate: float):
+    """Ускоряет поток прибытий в arrival_rate раз"""
+    if arrival_rate == 1.0:
+        return cars_data
+    if isinstance(cars_data, ArrivalColumns):
+        return ArrivalColumns(cars_data.arrival_times / arrival_rate, cars_data.car_ids, cars_data.directions)
+    return [(arrival_time / arrival_rate, car_id, direction, *extra)
+            for arrival_time, car_id, direction, *extra in cars_data]
+
+
+def run_case(case: SweepCase) -> Dict:
+    """Выполняет один прогон и возвращает строку таблицы результатов"""
+    if case.engine not in ENGINES:
+        raise ValueError(f"Unknown engine: {case.engine}")
+    if case.arrival_rate <= 0:
+        raise ValueError("arrival_rate must be positive")
+
+    priority = None if case.priority_direction == NO_PRIORITY else Direction(case.priority_direction)
+    bridge = ENGINES[case.engine](priority, case.max_consecutive, case.crossing_time, get_policy(case.policy))
+    stats = bridge.simulate(_scale_arrivals(_load_cars(case.input_file), case.arrival_rate))
+
+    row = {'key': case.key, **asdict(case)}
+    row.update((field, stats[field]) for field in STAT_FIELDS)
+    for direction in Direction:
+        direction_stats = stats['direction_stats'][direction.value]
+        row[f'{direction.value}_total_crossed'] = direction_stats['total_crossed']
+        row[f'{direction.value}_avg_waiting_time'] = direction_stats['avg_waiting_time']
+    return row
+
+
+class ResultTable:
+    """
+    Таблица результатов в CSV или JSON Lines (по расширению .jsonl/.json).
+    Каждая строка дописывается и сбрасывается на диск сразу, поэтому после
+    прерывания в файле остаются все завершенные прогоны, а недописанная
+    последняя строка отбрасывается при следующем открытии.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.is_json = os.path.splitext(path)[1] in ('.jsonl', '.json')
+        self._file = None
+        self._writer = None
+
+    def completed_keys(self) -> Set[str]:
+        """Ключи прогонов, которые уже есть в файле"""
+        if not os.path.exists(self.path):
+            return set()
+        self._drop_partial_line()
+
+        keys = set()
+        with open(self.path, 'r', newline='') as file:
+            if self.is_json:
+                for line in file:
+                    if line.strip():
+                        keys.add(json.loads(line)['key'])
+            else:
+                keys.update(row['key'] for row in csv.DictReader(file))
+        return keys
+
+    def _drop_partial_line(self):
+        """Обрезает строку, которую не успели дописать до конца"""
+        with open(self.path, 'rb+') as file:
+            data = file.read()
+            if data and not data.endswith(b'\n'):
+                file.truncate(data.rfind(b'\n') + 1)
+
+    def open(self):
+        new_file = not os.path.exists(self.path) or os.path.getsize(self.path) == 0
+        self._file = open(self.path, 'a', newline='')
+        if not self.is_json:
+            self._writer = csv.DictWriter(self._file, fieldnames=FIELDS)
+            if new_file:
+                self._writer.writeheader()
+
+    def append(self, row: Dict):
+        if self.is_json:
+            self._file.write(json.dumps(row) + '\n')
+        else:
+            self._writer.writerow(row)
+        self._file.flush()
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self) -> 'ResultTable':
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        self.close()
+
+
+def _init_worker():
+    """Процессы-обработчики не пишут в лог каждую машину"""
+    configure_logging(car_level=logging.WARNING)
+
+
+def run_sweep(cases: Sequence[SweepCase], output: str, workers: Optional[int] = None,
+              on_result: Optional[Callable[[Dict], None]] = None) -> int:
+    """
+    Выполняет прогоны в пуле процессов и дописывает результаты в output
+    по мере завершения. Прогоны, которые уже есть в output, пропускаются,
+    а упавшие не записываются и повторяются при следующем запуске.
+    Returns: число успешно выполненных прогонов
+    """
+    table = ResultTable(output)
+    done = table.completed_keys()
+    pending = list({case.key: case for case in cases if case.key not in done}.values())
+    if len(cases) > len(pending):
+        logger.info(f"Skipping {len(cases) - len(pending)} completed runs")
+    if not pending:
+        return 0
+
+    with table, ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+        futures = {executor.submit(run_case, case): case for case in pending}
+        completed = 0
+        for future in as_completed(futures):
+            try:
+                row = future.result()
+            except Exception as e:
+                logger.error(f"Run {futures[future].key} failed: {e}")
+                continue
+            table.append(row)
+            completed += 1
+            if on_result:
+                on_result(row)
+    return completed
@@ -0,0 +1,227 @@
+# src/utils/arrival_format.py
+import os
+import shutil
+import struct
+import tempfile
+from collections.abc import Sequence
+from itertools import islice
+from typing import Iterator, Optional, Tuple, Union
+import numpy as np
+from ..models.direction import Direction
+
+# Бинарный колоночный формат прибытий:
+#   заголовок 16 байт: MAGIC (8 байт) + число машин (uint64, little-endian)
+#   arrival_time: float64[n], car_id: int64[n], direction: uint8[n]
+# Колонки идут друг за другом, поэтому файл читается через numpy.memmap
+# без разбора и копирования.
+MAGIC = b'BRGARR1\n'
+HEADER = struct.Struct('<8sQ')
+
+TIME_DTYPE = np.dtype('<f8')
+ID_DTYPE = np.dtype('<i8')
+DIRECTION_DTYPE = np.dtype('u1')
+
+# Коды направлений в колонке direction
+DIRECTIONS: Tuple[Direction, ...] = (Direction.LEFT_TO_RIGHT, Direction.RIGHT_TO_LEFT)
+DIRECTION_CODES = {direction: code for code, direction in enumerate(DIRECTIONS)}
+
+# Сколько строк превращается в кортежи за раз при итерации
+ITER_CHUNK = 65536
+
+
+class ArrivalColumns(Sequence):
+    """
+    Прибытия в виде трех колонок NumPy.
+    Ведет себя как последовательность кортежей (arrival_time, car_id, direction),
+    поэтому подходит всем симуляторам. Срезы не копируют данные.
+    """
+
+    def __init__(self, arrival_times: np.ndarray, car_ids: np.ndarray, directions: np.ndarray):
+        if not len(arrival_times) == len(car_ids) == len(directions):
+            raise ValueError("Arrival columns must have the same length")
+        self.arrival_times = arrival_times
+        self.car_ids = car_ids
+        self.directions = directions
+
+    def __len__(self) -> int:
+        return len(self.arrival_times)
+
+    def __getitem__(self, index: Union[int, slice]):
+        if isinstance(index, slice):
+            return ArrivalColumns(self.arrival_times[index], self.car_ids[index], self.directions[index])
+        return (float(self.arrival_times[index]), int(self.car_ids[index]),
+                DIRECTIONS[self.directions[index]])
+
+    def __iter__(self) -> Iterator[Tuple[float, int, Direction]]:
+        for start in range(0, len(self), ITER_CHUNK):
+            end = start + ITER_CHUNK
+            directions = [DIRECTIONS[code] for code in self.directions[start:end].tolist()]
+            yield from zip(self.arrival_times[start:end].tolist(), self.car_ids[start:end].tolist(), directions)
+
+    def is_sorted(self) -> bool:
+        """Проверяет порядок прибытия (при равном времени — по номеру машины)"""
+        times = self.arrival_times
+        if len(times) < 2:
+            return True
+        later = times[1:] > times[:-1]
+        same = times[1:] == times[:-1]
+        return bool(np.all(later | (same & (self.car_ids[1:] >= self.car_ids[:-1]))))
+
+    def sorted(self) -> 'ArrivalColumns':
+        """Возвращает копию, отсортированную по (arrival_time, car_id)"""
+        order = np.lexsort((self.car_ids, self.arrival_times))
+        return ArrivalColumns(self.arrival_times[order], self.car_ids[order], self.directions[order])
+
+
+class ArrivalWriter:
+    """
+    Потоковая запись прибытий в бинарный формат кусками.
+    Колонки копятся во временных файлах рядом с целевым и собираются
+    в один файл при закрытии, поэтому число машин заранее знать не нужно.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.count = 0
+        directory = os.path.dirname(os.path.abspath(path))
+        self._columns = [
+            tempfile.NamedTemporaryFile('wb', dir=directory, delete=False) for _ in range(3)
+        ]
+
+    def write(self, arrival_times, car_ids, directions):
+        """Дописывает кусок колонок (directions — коды из DIRECTION_CODES)"""
+        arrays = (
+            np.ascontiguousarray(arrival_times, dtype=TIME_DTYPE),
+            np.ascontiguousarray(car_ids, dtype=ID_DTYPE),
+            np.ascontiguousarray(directions, dtype=DIRECTION_DTYPE),
+        )
+        if not len(arrays[0]) == len(arrays[1]) == len(arrays[2]):
+            raise ValueError("Arrival columns must have the same length")
+
+        for column, array in zip(self._columns, arrays):
+            column.write(array.tobytes())
+        self.count += len(arrays[0])
+
+    def close(self):
+        """Собирает колонки в целевой файл; при ошибке записи файл удаляется"""
+        try:
+            with open(self.path, 'wb') as output:
+                output.write(HEADER.pack(MAGIC, self.count))
+                for column in self._columns:
+                    column.close()
+                    with open(column.name, 'rb') as source:
+                        shutil.copyfileobj(source, output)
+        except BaseException:
+            if os.path.exists(self.path):
+                os.unlink(self.path)
+            raise
+        finally:
+            self._discard_columns()
+
+    def abort(self):
+        """Отбрасывает записанное: целевой файл не создается"""
+        self._discard_columns()
+
+    def _discard_columns(self):
+        for column in self._columns:
+            column.close()
+            if os.path.exists(column.name):
+                os.unlink(column.name)
+
+    def __enter__(self) -> 'ArrivalWriter':
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        # Недописанный файл с корректным заголовком выглядел бы целым
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+def is_arrival_file(path: str) -> bool:
+    """Проверяет, что файл записан в бинарном формате прибытий"""
+    with open(path, 'rb') as file:
+        return file.read(len(MAGIC)) == MAGIC
+
+
+def write_arrivals(path: str, columns: ArrivalColumns):
+    """Записывает колонки прибытий в файл"""
+    with ArrivalWriter(path) as writer:
+        writer.write(columns.arrival_times, columns.car_ids, columns.directions)
+
+
+def load_arrivals(path: str) -> ArrivalColumns:
+    """Отображает бинарный файл прибытий в память без копирования"""
+    with open(path, 'rb') as file:
+        magic, count = HEADER.unpack(file.read(HEADER.size))
+    if magic != MAGIC:
+        raise ValueError(f"{path} is not a binary arrival file")
+
+    if count == 0:
+        return ArrivalColumns(np.empty(0, TIME_DTYPE), np.empty(0, ID_DTYPE), np.empty(0, DIRECTION_DTYPE))
+
+    offset = HEADER.size
+    arrival_times = np.memmap(path, dtype=TIME_DTYPE, mode='r', offset=offset, shape=(count,))
+    offset += count * TIME_DTYPE.itemsize
+    car_ids = np.memmap(path, dtype=ID_DTYPE, mode='r', offset=offset, shape=(count,))
+    offset += count * ID_DTYPE.itemsize
+    directions = np.memmap(path, dtype=DIRECTION_DTYPE, mode='r', offset=offset, shape=(count,))
+    return ArrivalColumns(arrival_times, car_ids, directions)
+
+
+def encode_directions(values: np.ndarray) -> np.ndarray:
+    """Превращает строковые направления в коды, ValueError при неизвестном"""
+    codes = np.full(len(values), 255, dtype=DIRECTION_DTYPE)
+    for direction, code in DIRECTION_CODES.items():
+        codes[values == direction.value] = code
+    if np.any(codes == 255):
+        bad = values[codes == 255][0]
+        raise ValueError(f"'{bad}' is not a valid Direction")
+    return codes
+
+
+def parse_csv_chunk(lines) -> ArrivalColumns:
+    """
+    Векторный разбор строк CSV arrival_time,car_id,direction.
+    Необязательная четвертая колонка crossing_time пропускается:
+    бинарный формат ее не хранит
+    """
+    table = np.loadtxt(
+        lines, delimiter=',', ndmin=1, usecols=(0, 1, 2),
+        dtype=[('arrival_time', TIME_DTYPE), ('car_id', ID_DTYPE), ('direction', 'U16')]
+    )
+    return ArrivalColumns(
+        np.ascontiguousarray(table['arrival_time']),
+        np.ascontiguousarray(table['car_id']),
+        encode_directions(table['direction'])
+    )
+
+
+def convert_csv(csv_path: str, output_path: str, chunk_size: int = 1_000_000) -> int:
+    """
+    Конвертирует входной CSV в бинарный формат.
+    Файл разбирается кусками по chunk_size строк. Если строки не
+    отсортированы, колонки сортируются после записи.
+    Returns: число машин
+    """
+    in_order = True
+    last: Optional[Tuple[float, int]] = None
+
+    with open(csv_path, 'r') as file, ArrivalWriter(output_path) as writer:
+        next(file, None)  # Пропускаем заголовок, как InputReader
+        while True:
+            lines = [line for line in islice(file, chunk_size) if line.strip()]
+            if not lines:
+                break
+            chunk = parse_csv_chunk(lines)
+            if in_order:
+                in_order = chunk.is_sorted() and (last is None or chunk[0][:2] >= last)
+                last = chunk[-1][:2]
+            writer.write(chunk.arrival_times, chunk.car_ids, chunk.directions)
+        count = writer.count
+
+    if not in_order:
+        columns = load_arrivals(output_path).sorted()
+        write_arrivals(output_path, columns)
+    return count
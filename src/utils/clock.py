@@ -0,0 +1,236 @@
+# src/utils/clock.py
+import asyncio
+import heapq
+import itertools
+import selectors
+import threading
+import time
+from typing import Dict, List, Tuple
+
+
+class Clock:
+    """
+    Источник времени для симуляции.
+    Мост, машины и планировщик получают время, спят и ждут на условных
+    переменных только через часы, поэтому реальное время можно подменить
+    виртуальным.
+    """
+
+    def now(self) -> float:
+        """Текущее время в секундах"""
+        raise NotImplementedError
+
+    def sleep(self, duration: float) -> None:
+        """Приостанавливает текущий поток на duration секунд"""
+        raise NotImplementedError
+
+    def wait(self, condition: threading.Condition) -> None:
+        """Ожидание на условной переменной (блокировка должна быть захвачена)"""
+        condition.wait()
+
+    def notify(self, condition: threading.Condition, n: int = 1) -> None:
+        """Пробуждает n потоков, ожидающих на условной переменной"""
+        condition.notify(n)
+
+    def notify_all(self, condition: threading.Condition) -> None:
+        """Пробуждает все потоки, ожидающие на условной переменной"""
+        condition.notify_all()
+
+    def settled(self) -> bool:
+        """
+        Все события текущего момента обработаны: кроме вызывающего потока
+        активных участников нет и никто не спит до этого момента
+        """
+        return True
+
+    def settle(self) -> None:
+        """Ждет, пока не будут обработаны все остальные события текущего момента"""
+
+    def register(self) -> None:
+        """Регистрирует новый поток-участник симуляции"""
+
+    def unregister(self) -> None:
+        """Снимает поток-участник с учета"""
+
+
+class RealClock(Clock):
+    """Часы реального времени: time.time() и time.sleep()"""
+
+    def now(self) -> float:
+        return time.time()
+
+    def sleep(self, duration: float) -> None:
+        if duration > 0:
+            time.sleep(duration)
+
+
+class VirtualClock(Clock):
+    """
+    Детерминированные виртуальные часы.
+
+    Время не зависит от реального и сдвигается только тогда, когда все
+    зарегистрированные потоки заблокированы: спят в sleep() или ждут
+    в wait(). В этот момент часы переходят к ближайшему моменту пробуждения.
+    Поэтому каждый поток, участвующий в симуляции, должен быть
+    зарегистрирован через register() до запуска и снят через unregister()
+    после завершения, а ожидание и уведомление на условных переменных
+    должны идти через wait()/notify()/notify_all() часов.
+
+    sleep(0) блокирует поток до тех пор, пока все остальные участники
+    не заблокируются, не сдвигая время. settle() ждет еще дольше: поток
+    просыпается только после всех, кто спит до текущего момента через
+    sleep, — так решение в момент t видит все прибытия и съезды в t.
+    """
+
+    # Очередность пробуждения спящих до одного момента
+    SLEEP_PHASE = 0
+    SETTLE_PHASE = 1
+
+    def __init__(self, start: float = 0.0):
+        self._mutex = threading.Lock()
+        self._now = start
+        self._active = 0
+        # (момент пробуждения, фаза, порядковый номер, событие)
+        self._sleepers: List[Tuple[float, int, int, threading.Event]] = []
+        self._sequence = itertools.count()
+        self._waiters: Dict[int, int] = {}
+
+    def now(self) -> float:
+        return self._now
+
+    def sleep(self, duration: float) -> None:
+        self._sleep_until(max(0.0, duration), self.SLEEP_PHASE)
+
+    def settled(self) -> bool:
+        with self._mutex:
+            return self._active <= 1 and (not self._sleepers or self._sleepers[0][0] > self._now)
+
+    def settle(self) -> None:
+        if not self.settled():
+            self._sleep_until(0.0, self.SETTLE_PHASE)
+
+    def _sleep_until(self, duration: float, phase: int) -> None:
+        wakeup = threading.Event()
+        with self._mutex:
+            heapq.heappush(self._sleepers, (self._now + duration, phase, next(self._sequence), wakeup))
+            self._active -= 1
+            self._advance()
+        wakeup.wait()
+
+    def wait(self, condition: threading.Condition) -> None:
+        with self._mutex:
+            key = id(condition)
+            self._waiters[key] = self._waiters.get(key, 0) + 1
+            self._active -= 1
+            self._advance()
+        # Поток снова будет учтен как активный тем, кто его разбудит
+        condition.wait()
+
+    def notify(self, condition: threading.Condition, n: int = 1) -> None:
+        with self._mutex:
+            key = id(condition)
+            waiting = self._waiters.get(key, 0)
+            woken = min(n, waiting)
+            if woken == waiting:
+                self._waiters.pop(key, None)
+            else:
+                self._waiters[key] = waiting - woken
+            self._active += woken
+        condition.notify(n)
+
+    def notify_all(self, condition: threading.Condition) -> None:
+        with self._mutex:
+            self._active += self._waiters.pop(id(condition), 0)
+        condition.notify_all()
+
+    def register(self) -> None:
+        with self._mutex:
+            self._active += 1
+
+    def unregister(self) -> None:
+        with self._mutex:
+            self._active -= 1
+            self._advance()
+
+    def _advance(self) -> None:
+        """Сдвигает время, если все участники заблокированы (под self._mutex)"""
+        if self._active > 0 or not self._sleepers:
+            return
+
+        # Будятся спящие до ближайшего момента, но только одной фазы
+        wakeup_time, phase = self._sleepers[0][:2]
+        self._now = max(self._now, wakeup_time)
+        while self._sleepers and self._sleepers[0][0] <= self._now and self._sleepers[0][1] == phase:
+            wakeup = heapq.heappop(self._sleepers)[3]
+            self._active += 1
+            wakeup.set()
+
+
+class LoopClock(Clock):
+    """
+    Часы цикла событий asyncio: время берется из loop.time().
+    Ждать нужно через await, поэтому sleep() и settle() у этих часов нет:
+    событий текущего момента корутина дожидается, уступая цикл, пока
+    settled() не станет истинным.
+    """
+
+    def now(self) -> float:
+        try:
+            return asyncio.get_running_loop().time()
+        except RuntimeError:
+            # Вне цикла событий (например, при создании моста)
+            return time.monotonic()
+
+    def settled(self) -> bool:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return True
+        # В реальном времени одновременных событий не бывает
+        return not isinstance(loop, VirtualEventLoop) or loop.settled()
+
+
+class _VirtualTimeSelector:
+    """Селектор, который вместо ожидания таймера сдвигает время цикла"""
+
+    def __init__(self, selector, loop: 'VirtualEventLoop'):
+        self._selector = selector
+        self._loop = loop
+
+    def select(self, timeout=None):
+        if timeout is None:
+            # Таймеров нет, ждать можно только ввода-вывода
+            return self._selector.select(None)
+
+        events = self._selector.select(0)
+        if not events and timeout > 0:
+            self._loop._virtual_time += timeout
+        return events
+
+    def __getattr__(self, name):
+        return getattr(self._selector, name)
+
+
+class VirtualEventLoop(asyncio.SelectorEventLoop):
+    """
+    Цикл событий asyncio с виртуальным временем.
+    Когда готовых задач нет, время сразу переходит к ближайшему таймеру,
+    поэтому asyncio.sleep() и loop.call_at() не ждут реального времени.
+    """
+
+    def __init__(self, start: float = 0.0):
+        self._virtual_time = start
+        super().__init__(_VirtualTimeSelector(selectors.DefaultSelector(), self))
+
+    def time(self) -> float:
+        return self._virtual_time
+
+    def settled(self) -> bool:
+        """
+        Все события текущего момента обработаны: кроме выполняющегося
+        обратного вызова готовых задач нет и ни один таймер не наступил
+        """
+        if self._ready:
+            return False
+        # Таймеры в пределах разрешения часов цикл считает наступившими
+        return not self._scheduled or self._scheduled[0].when() >= self.time() + self._clock_resolution
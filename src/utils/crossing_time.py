@@ -0,0 +1,149 @@
+# src/utils/crossing_time.py
+import math
+from typing import Iterable, Iterator, Optional, Tuple
+import numpy as np
+from ..models.direction import Direction
+
+# Сколько значений генерируется за один векторный вызов
+DEFAULT_BATCH_SIZE = 65536
+
+
+class CrossingTimeDistribution:
+    """Распределение времени проезда: векторная генерация size значений"""
+
+    def sample(self, rng: np.random.Generator, size: int) -> np.ndarray:
+        raise NotImplementedError
+
+
+class Deterministic(CrossingTimeDistribution):
+    """Постоянное время проезда"""
+
+    def __init__(self, value: float = 1.0):
+        if value <= 0:
+            raise ValueError("Crossing time must be positive")
+        self.value = value
+
+    def sample(self, rng: np.random.Generator, size: int) -> np.ndarray:
+        return np.full(size, self.value)
+
+
+class Exponential(CrossingTimeDistribution):
+    """Экспоненциальное время проезда со средним mean"""
+
+    def __init__(self, mean: float = 1.0):
+        if mean <= 0:
+            raise ValueError("Mean crossing time must be positive")
+        self.mean = mean
+
+    def sample(self, rng: np.random.Generator, size: int) -> np.ndarray:
+        return rng.exponential(self.mean, size)
+
+
+class LogNormal(CrossingTimeDistribution):
+    """
+    Логнормальное время проезда со средним mean; sigma — стандартное
+    отклонение логарифма (чем больше, тем тяжелее хвост)
+    """
+
+    def __init__(self, mean: float = 1.0, sigma: float = 0.5):
+        if mean <= 0 or sigma < 0:
+            raise ValueError("Log-normal crossing time needs mean > 0 and sigma >= 0")
+        self.mean = mean
+        self.sigma = sigma
+
+    def sample(self, rng: np.random.Generator, size: int) -> np.ndarray:
+        mu = math.log(self.mean) - self.sigma ** 2 / 2
+        return rng.lognormal(mu, self.sigma, size)
+
+
+class Empirical(CrossingTimeDistribution):
+    """Выборка с возвращением из наблюдавшихся значений"""
+
+    def __init__(self, values: Iterable[float]):
+        self.values = np.asarray(list(values), dtype=np.float64)
+        if len(self.values) == 0 or np.any(self.values <= 0):
+            raise ValueError("Empirical crossing times must be a non-empty set of positive values")
+
+    @classmethod
+    def from_file(cls, path: str) -> 'Empirical':
+        """Файл с одним значением в строке (или CSV, берется первая колонка)"""
+        values = []
+        with open(path, 'r') as file:
+            for line in file:
+                field = line.split(',')[0].strip()
+                try:
+                    values.append(float(field))
+                except ValueError:
+                    continue  # Заголовок и пустые строки
+        return cls(values)
+
+    def sample(self, rng: np.random.Generator, size: int) -> np.ndarray:
+        return rng.choice(self.values, size)
+
+
+def parse_distribution(spec: str) -> CrossingTimeDistribution:
+    """
+    Разбирает описание распределения из командной строки:
+    deterministic:1.5, exponential:1.0, lognormal:1.0,0.5, empirical:times.txt
+    """
+    name, _, params = spec.partition(':')
+    name = name.strip().lower()
+    if name == 'empirical':
+        if not params:
+            raise ValueError("Empirical distribution needs a file: empirical:<path>")
+        return Empirical.from_file(params)
+
+    distributions = {
+        'deterministic': Deterministic,
+        'exponential': Exponential,
+        'lognormal': LogNormal,
+    }
+    if name not in distributions:
+        raise ValueError(f"Unknown crossing time distribution: {name}")
+    args = [float(value) for value in params.split(',') if value.strip()]
+    return distributions[name](*args)
+
+
+class CrossingTimeSampler:
+    """
+    Поток времен проезда из распределения.
+    Значения генерируются векторно пачками по batch_size генератором
+    с зерном seed, а не по одному на машину, поэтому при одинаковом
+    зерне k-я машина получает одно и то же время в любом движке.
+    """
+
+    def __init__(self, distribution: CrossingTimeDistribution, seed: Optional[int] = 0,
+                 batch_size: int = DEFAULT_BATCH_SIZE):
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        self.distribution = distribution
+        self.rng = np.random.default_rng(seed)
+        self.batch_size = batch_size
+        self._batch: list = []
+        self._position = 0
+
+    def take(self, size: int) -> np.ndarray:
+        """Следующие size значений одним массивом"""
+        return self.distribution.sample(self.rng, size)
+
+    def __iter__(self) -> Iterator[float]:
+        return self
+
+    def __next__(self) -> float:
+        if self._position == len(self._batch):
+            self._batch = self.take(self.batch_size).tolist()
+            self._position = 0
+        value = self._batch[self._position]
+        self._position += 1
+        return value
+
+
+def assign_crossing_times(cars_data: Iterable[tuple], sampler: CrossingTimeSampler
+                          ) -> Iterator[Tuple[float, int, Direction, float]]:
+    """
+    Добавляет машинам время проезда в порядке прибытия.
+    Время из входных данных (четвертая колонка) сохраняется.
+    """
+    for arrival_time, car_id, direction, *extra in cars_data:
+        crossing_time = extra[0] if extra and extra[0] is not None else next(sampler)
+        yield arrival_time, car_id, direction, crossing_time
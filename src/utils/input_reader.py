@@ -1,22 +1,144 @@
 # src/utils/input_reader.py
 import csv
-from typing import List, Tuple
+import heapq
+import os
+import tempfile
+from collections.abc import Sequence
+from itertools import islice
+from typing import Iterable, Iterator, List, Tuple, Union
 from ..models.direction import Direction
+from .arrival_format import ArrivalColumns, is_arrival_file, load_arrivals
+
+# (arrival_time, car_id, direction) или, если во входном файле есть
+# четвертая колонка, (arrival_time, car_id, direction, crossing_time)
+CarData = Tuple[float, int, Direction]
+
+# Сколько строк сортируется в памяти за раз при внешней сортировке
+DEFAULT_CHUNK_SIZE = 1_000_000
+
+
+def _sort_key(car: CarData) -> Tuple[float, int]:
+    return car[0], car[1]
+
+
+def ensure_sorted(cars_data: Iterable[CarData]) -> Iterable[CarData]:
+    """
+    Возвращает машины в порядке прибытия, не копируя уже отсортированные данные.
+    Последовательность проверяется и сортируется только при необходимости,
+    итератор проверяется на лету: нарушение порядка вызывает ValueError.
+    """
+    if isinstance(cars_data, ArrivalColumns):
+        return cars_data if cars_data.is_sorted() else cars_data.sorted()
+    if isinstance(cars_data, Sequence):
+        if all(_sort_key(cars_data[i]) <= _sort_key(cars_data[i + 1]) for i in range(len(cars_data) - 1)):
+            return cars_data
+        return sorted(cars_data, key=_sort_key)
+    return _check_sorted(iter(cars_data))
+
+
+def _check_sorted(cars_data: Iterator[CarData]) -> Iterator[CarData]:
+    last_arrival = float('-inf')
+    for car in cars_data:
+        if car[0] < last_arrival:
+            raise ValueError("Cars data must be sorted by arrival time")
+        last_arrival = car[0]
+        yield car
+
 
 class InputReader:
     @staticmethod
-    def read_cars_data(filename: str) -> List[Tuple[float, int, Direction]]:
+    def parse_row(row: List[str]) -> CarData:
+        """Разбирает строку входного файла: arrival_time, car_id, direction[, crossing_time]"""
+        if len(row) > 3 and row[3].strip():
+            return float(row[0]), int(row[1]), Direction(row[2]), float(row[3])
+        return float(row[0]), int(row[1]), Direction(row[2])
+
+    @staticmethod
+    def read_cars_data(filename: str) -> Union[List[CarData], ArrivalColumns]:
+        """
+        Читает данные о машинах из входного файла (CSV или бинарного).
+        Returns: List of (arrival_time, car_id, direction); для бинарного
+        файла — отображенные в память колонки с тем же интерфейсом
+        """
+        if is_arrival_file(filename):
+            return ensure_sorted(load_arrivals(filename))
+        return list(InputReader.iter_cars_data(filename))
+
+    @staticmethod
+    def iter_cars_data(filename: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[CarData]:
         """
-        Читает данные о машинах из входного файла.
-        Returns: List of (arrival_time, car_id, direction)
+        Лениво читает данные о машинах в порядке прибытия.
+        Уже отсортированный файл читается потоком без копирования. Иначе
+        выполняется внешняя сортировка: файл режется на отсортированные
+        куски по chunk_size строк во временных файлах, которые затем
+        сливаются, так что в памяти одновременно не больше одного куска.
+        Бинарный файл отображается в память и читается без разбора строк.
         """
-        cars_data = []
-        with open(filename, 'r') as file:
+        if is_arrival_file(filename):
+            return iter(ensure_sorted(load_arrivals(filename)))
+        if InputReader.is_sorted(filename):
+            return InputReader._stream(filename)
+        return InputReader._external_sort(filename, chunk_size)
+
+    @staticmethod
+    def is_sorted(filename: str) -> bool:
+        """
+        Проверяет, что строки файла уже идут в порядке прибытия.
+        Разбирается только время прибытия, номер машины — лишь при равном
+        времени, направление не разбирается вовсе.
+        """
+        last_time = float('-inf')
+        last_id = None
+        with open(filename, 'r', newline='') as file:
             reader = csv.reader(file)
             next(reader, None)  # Пропускаем заголовок
             for row in reader:
                 arrival_time = float(row[0])
-                car_id = int(row[1])
-                direction = Direction(row[2])
-                cars_data.append((arrival_time, car_id, direction))
-        return sorted(cars_data)  # Сортируем по времени прибытия
\ No newline at end of file
+                if arrival_time < last_time:
+                    return False
+                if arrival_time == last_time and int(row[1]) < int(last_id):
+                    return False
+                last_time = arrival_time
+                last_id = row[1]
+        return True
+
+    @staticmethod
+    def _stream(filename: str) -> Iterator[CarData]:
+        with open(filename, 'r', newline='') as file:
+            reader = csv.reader(file)
+            next(reader, None)  # Пропускаем заголовок
+            for row in reader:
+                yield InputReader.parse_row(row)
+
+    @staticmethod
+    def _external_sort(filename: str, chunk_size: int) -> Iterator[CarData]:
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+
+        chunk_files = []
+        try:
+            cars = InputReader._stream(filename)
+            while True:
+                chunk = sorted(islice(cars, chunk_size), key=_sort_key)
+                if not chunk:
+                    break
+                chunk_file = tempfile.NamedTemporaryFile('w', newline='', suffix='.csv', delete=False)
+                chunk_files.append(chunk_file.name)
+                with chunk_file:
+                    writer = csv.writer(chunk_file)
+                    for arrival_time, car_id, direction, *extra in chunk:
+                        writer.writerow((repr(arrival_time), car_id, direction.value, *map(repr, extra)))
+                del chunk
+
+            yield from heapq.merge(
+                *(InputReader._read_chunk(name) for name in chunk_files), key=_sort_key
+            )
+        finally:
+            for name in chunk_files:
+                os.unlink(name)
+
+    @staticmethod
+    def _read_chunk(filename: str) -> Iterator[CarData]:
+        with open(filename, 'r', newline='') as file:
+            for row in csv.reader(file):
+                yield InputReader.parse_row(row)
@@ -0,0 +1,40 @@
+# src/utils/latch.py
+import threading
+from typing import Optional
+
+
+class CountDownLatch:
+    """
+    Счетчик незавершенных задач: wait возвращается, когда он дошел до нуля.
+    В отличие от java.util.concurrent.CountDownLatch счетчик можно
+    увеличивать (count_up), потому что число машин при ленивом чтении
+    входных данных заранее неизвестно. Ожидание не опрашивает состояние:
+    ждущий поток будит последний count_down.
+    """
+
+    def __init__(self, count: int = 0):
+        if count < 0:
+            raise ValueError("count must not be negative")
+        self._count = count
+        self._condition = threading.Condition(threading.Lock())
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    def count_up(self, amount: int = 1):
+        with self._condition:
+            self._count += amount
+
+    def count_down(self):
+        with self._condition:
+            if self._count == 0:
+                raise ValueError("count_down called more times than count_up")
+            self._count -= 1
+            if self._count == 0:
+                self._condition.notify_all()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Ждет обнуления счетчика не дольше timeout секунд; False по таймауту"""
+        with self._condition:
+            return self._condition.wait_for(lambda: self._count == 0, timeout)
@@ -1,18 +1,198 @@
 # src/utils/logger.py
+import atexit
 import logging
-from typing import Optional
+import queue
+import sys
+import threading
+import time
+import traceback
+from logging.handlers import QueueHandler
+from typing import List, Optional, TextIO
+
+FORMAT = '%(asctime)s - %(threadName)s - %(levelname)s - %(message)s'
+
+# Сообщения о каждой машине пишутся в логгеры с этим префиксом, чтобы
+# их уровень и выборка настраивались отдельно от остальных сообщений
+CAR_LOGGER_PREFIX = 'cars'
+
+# Сколько записей фоновый поток пишет за один вызов write
+DEFAULT_BATCH_SIZE = 1024
+# Сколько фоновый поток копит записи после пробуждения, секунды
+DEFAULT_FLUSH_INTERVAL = 0.05
+
+
+class LazyQueueHandler(QueueHandler):
+    """
+    Кладет запись в очередь без форматирования: сообщение собирается
+    из msg и args уже в фоновом потоке. Аргументы сообщений о машинах —
+    числа и строки, поэтому откладывать форматирование безопасно.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        if record.exc_info:
+            # Трассировку нужно снять сейчас, пока жив кадр исключения
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+class BatchingQueueListener:
+    """
+    Фоновый поток, который забирает записи из очереди и пишет их в поток
+    вывода пачками. Получив запись, поток ждет flush_interval, чтобы
+    записи накопились, и выводит их по batch_size за один write. Иначе
+    он просыпался бы на каждую запись и отнимал GIL у потоков машин.
+    """
+    _STOP = None
+
+    def __init__(self, records: queue.SimpleQueue, stream: TextIO, formatter: logging.Formatter,
+                 batch_size: int = DEFAULT_BATCH_SIZE, flush_interval: float = DEFAULT_FLUSH_INTERVAL):
+        self.records = records
+        self.stream = stream
+        self.formatter = formatter
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._thread = threading.Thread(target=self._run, name='LogWriter', daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        """Дописывает все записи из очереди и останавливает поток"""
+        self.records.put(self._STOP)
+        self._thread.join()
+
+    def _run(self):
+        stopping = False
+        while not stopping:
+            batch = [self.records.get()]
+            if batch[0] is not self._STOP:
+                time.sleep(self.flush_interval)
+            while not stopping:
+                while len(batch) < self.batch_size:
+                    try:
+                        batch.append(self.records.get_nowait())
+                    except queue.Empty:
+                        break
+                if self._STOP in batch:
+                    stopping = True
+                    batch = [record for record in batch if record is not self._STOP]
+                if batch:
+                    self._write(batch)
+                if len(batch) < self.batch_size:
+                    break
+                batch = []
+
+    def _write(self, batch: List[logging.LogRecord]):
+        try:
+            self.stream.write(''.join(self.formatter.format(record) + '\n' for record in batch))
+            self.stream.flush()
+        except Exception:
+            # Ошибка вывода не должна останавливать фоновый поток
+            if logging.raiseExceptions:
+                traceback.print_exc(file=sys.stderr)
+
+
+class _LoggingState:
+    """Текущие настройки вывода, общие для всех логгеров из get_logger"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.loggers: List[logging.Logger] = []
+        self.stream: Optional[TextIO] = None
+        self.records: Optional[queue.SimpleQueue] = None
+        self.listener: Optional[BatchingQueueListener] = None
+        self.car_level = logging.INFO
+        self.car_sample_every = 1
+
+    def make_handler(self) -> logging.Handler:
+        if self.records is not None:
+            return LazyQueueHandler(self.records)
+        handler = logging.StreamHandler(self.stream)
+        handler.setFormatter(logging.Formatter(FORMAT))
+        return handler
+
+
+_state = _LoggingState()
+
+
+def _is_car_logger(logger: logging.Logger) -> bool:
+    return logger.name.startswith(CAR_LOGGER_PREFIX + '.')
+
+
+def _attach(logger: logging.Logger):
+    """Ставит логгеру обработчик текущего режима вместо прежнего"""
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+    logger.addHandler(_state.make_handler())
+    logger.setLevel(_state.car_level if _is_car_logger(logger) else logging.INFO)
+
 
 def get_logger(name: Optional[str] = None) -> logging.Logger:
     """Создание и настройка логгера"""
     logger = logging.getLogger(name or __name__)
-    
-    if not logger.handlers:
-        handler = logging.StreamHandler()
-        formatter = logging.Formatter(
-            '%(asctime)s - %(threadName)s - %(levelname)s - %(message)s'
-        )
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
-        logger.setLevel(logging.INFO)
-    
-    return logger
\ No newline at end of file
+
+    with _state.lock:
+        if not logger.handlers:
+            _attach(logger)
+            _state.loggers.append(logger)
+
+    return logger
+
+
+def get_car_logger(name: str) -> logging.Logger:
+    """
+    Логгер сообщений о каждой машине (прибытие, проезд).
+    Перед записью вызывающий код проверяет car_log_enabled, поэтому
+    отключенные и не попавшие в выборку сообщения ничего не стоят.
+    """
+    return get_logger(f'{CAR_LOGGER_PREFIX}.{name}')
+
+
+def car_log_enabled(logger: logging.Logger, car_id: int, level: int = logging.INFO) -> bool:
+    """Нужно ли писать сообщение уровня level о машине car_id"""
+    return logger.isEnabledFor(level) and car_id % _state.car_sample_every == 0
+
+
+def configure_logging(use_queue: bool = False, car_level: int = logging.INFO, car_sample_every: int = 1,
+                      stream: Optional[TextIO] = None, batch_size: int = DEFAULT_BATCH_SIZE,
+                      flush_interval: float = DEFAULT_FLUSH_INTERVAL):
+    """
+    Настройка вывода для всех логгеров, в том числе уже созданных.
+    use_queue: записи ставятся в очередь, а форматирует и пишет их пачками
+    фоновый поток, так что потоки машин не ждут вывода в терминал
+    car_level: уровень сообщений о каждой машине
+    car_sample_every: писать сообщения только о каждой N-й машине (по номеру)
+    stream: куда писать, по умолчанию sys.stderr
+    """
+    if car_sample_every < 1:
+        raise ValueError("car_sample_every must be at least 1")
+    shutdown_logging()
+
+    with _state.lock:
+        _state.stream = stream
+        _state.car_level = car_level
+        _state.car_sample_every = car_sample_every
+        if use_queue:
+            _state.records = queue.SimpleQueue()
+            _state.listener = BatchingQueueListener(
+                _state.records, stream or sys.stderr, logging.Formatter(FORMAT), batch_size, flush_interval
+            )
+            _state.listener.start()
+        for logger in _state.loggers:
+            _attach(logger)
+
+
+def shutdown_logging():
+    """Дописывает очередь записей и возвращает логгеры к синхронному выводу"""
+    with _state.lock:
+        listener, _state.listener = _state.listener, None
+        if listener is None:
+            return
+        _state.records = None
+        for logger in _state.loggers:
+            _attach(logger)
+    listener.stop()
+
+
+atexit.register(shutdown_logging)
@@ -1,19 +1,283 @@
 # src/utils/performance.py
+import itertools
+import json
+import threading
 import time
-from typing import Callable, Any, Dict
+from contextlib import nullcontext
 from functools import wraps
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
-def measure_time(func: Callable[..., Any]) -> Callable[..., Dict]:
-    """Декоратор для измерения времени выполнения функции"""
-    @wraps(func)
-    def wrapper(*args, **kwargs) -> Dict:
-        start_time = time.time()
-        result = func(*args, **kwargs)
-        end_time = time.time()
-        
+# Путь участка в дереве вызовов: имена от корневого участка до текущего
+SpanPath = Tuple[str, ...]
+
+_NULL_SPAN = nullcontext()
+
+
+class _ThreadState:
+    """Стек открытых участков и накопленные замеры одного потока"""
+    __slots__ = ('stack', 'stats')
+
+    def __init__(self):
+        # Элемент стека: (путь, время начала) или None для участка вне выборки
+        self.stack: List[Optional[Tuple[SpanPath, int]]] = []
+        # путь -> [число вызовов, суммарное время, максимальное время], нс
+        self.stats: Dict[SpanPath, List[int]] = {}
+
+
+class _Span:
+    """Контекстный менеджер одного замера"""
+    __slots__ = ('_profiler', '_name')
+
+    def __init__(self, profiler: 'Profiler', name: str):
+        self._profiler = profiler
+        self._name = name
+
+    def __enter__(self) -> '_Span':
+        self._profiler._push(self._name)
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        self._profiler._pop()
+
+
+class Profiler:
+    """
+    Иерархический профилировщик участков кода.
+
+    Участок открывается через span(name) или декоратор profiled и замеряется
+    монотонными часами perf_counter_ns. У каждого потока свой стек открытых
+    участков, поэтому вложенность отслеживается без блокировок, а замеры
+    сливаются в одно дерево вызовов только при построении отчета.
+
+    sample_every: замерять только каждый N-й корневой участок (вместе со
+    всеми вложенными), остальные проходят почти без накладных расходов.
+    Выключенный профилировщик возвращает из span общий пустой контекст.
+    """
+
+    def __init__(self, enabled: bool = False, sample_every: int = 1):
+        self._local = threading.local()
+        self._states_lock = threading.Lock()
+        self._states: List[_ThreadState] = []
+        self.enabled = False
+        self.sample_every = 1
+        self._roots = itertools.count()
+        if enabled:
+            self.enable(sample_every)
+
+    def enable(self, sample_every: int = 1):
+        """Включает замеры; sample_every — доля корневых участков в выборке (1/N)"""
+        if sample_every < 1:
+            raise ValueError("sample_every must be at least 1")
+        self.sample_every = sample_every
+        self.enabled = True
+
+    def disable(self):
+        self.enabled = False
+
+    def reset(self):
+        """Сбрасывает накопленные замеры"""
+        with self._states_lock:
+            for state in self._states:
+                state.stats.clear()
+        self._roots = itertools.count()
+
+    def span(self, name: str):
+        """Контекстный менеджер замера участка name"""
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, name)
+
+    def profiled(self, name: Optional[str] = None) -> Callable[[Callable], Callable]:
+        """
+        Декоратор: каждый вызов функции — участок с именем name
+        (по умолчанию полное имя функции). Результат возвращается без изменений.
+        """
+        def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+            span_name = name or func.__qualname__
+
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                with _Span(self, span_name):
+                    return func(*args, **kwargs)
+
+            return wrapper
+
+        return decorator
+
+    def wrap(self, func: Callable[..., Any], name: Optional[str] = None) -> Callable[..., Any]:
+        """
+        Замеряемая версия func или сама func, если профилировщик выключен.
+        Для горячих циклов: обертка выбирается один раз до цикла.
+        """
+        if not self.enabled:
+            return func
+        return self.profiled(name)(func)
+
+    def _state(self) -> _ThreadState:
+        state = getattr(self._local, 'state', None)
+        if state is None:
+            state = self._local.state = _ThreadState()
+            with self._states_lock:
+                self._states.append(state)
+        return state
+
+    def _push(self, name: str):
+        stack = self._state().stack
+        if stack:
+            parent = stack[-1]
+            if parent is None:
+                stack.append(None)
+                return
+            path = parent[0] + (name,)
+        elif next(self._roots) % self.sample_every:
+            stack.append(None)
+            return
+        else:
+            path = (name,)
+        stack.append((path, time.perf_counter_ns()))
+
+    def _pop(self):
+        end = time.perf_counter_ns()
+        state = self._state()
+        frame = state.stack.pop()
+        if frame is None:
+            return
+        path, start = frame
+        elapsed = end - start
+        entry = state.stats.get(path)
+        if entry is None:
+            state.stats[path] = [1, elapsed, elapsed]
+        else:
+            entry[0] += 1
+            entry[1] += elapsed
+            if elapsed > entry[2]:
+                entry[2] = elapsed
+
+    def collect(self) -> Dict[SpanPath, List[int]]:
+        """Замеры всех потоков, слитые по путям: [число вызовов, суммарное, максимальное], нс"""
+        merged: Dict[SpanPath, List[int]] = {}
+        with self._states_lock:
+            states = list(self._states)
+        for state in states:
+            for path, (count, total, longest) in list(state.stats.items()):
+                entry = merged.setdefault(path, [0, 0, 0])
+                entry[0] += count
+                entry[1] += total
+                entry[2] = max(entry[2], longest)
+        return merged
+
+    def call_tree(self) -> List[Dict]:
+        """
+        Дерево вызовов: список корневых узлов, у каждого name, count,
+        total_ns, self_ns (без вложенных участков), max_ns и children
+        """
+        nodes: Dict[SpanPath, Dict] = {}
+        roots: List[Dict] = []
+        for path, (count, total, longest) in sorted(self.collect().items()):
+            node = {'name': path[-1], 'count': count, 'total_ns': total, 'self_ns': total,
+                    'max_ns': longest, 'children': []}
+            nodes[path] = node
+            parent = nodes.get(path[:-1])
+            if parent is None:
+                roots.append(node)
+            else:
+                parent['children'].append(node)
+                parent['self_ns'] -= total
+
+        def by_total(items: List[Dict]):
+            items.sort(key=lambda node: node['total_ns'], reverse=True)
+            for node in items:
+                by_total(node['children'])
+
+        by_total(roots)
+        return roots
+
+    def report(self) -> str:
+        """Текстовый отчет: дерево вызовов с числом вызовов и временем"""
+        lines = [f"{'span':<44}{'calls':>10}{'total ms':>12}{'self ms':>12}{'avg us':>12}{'max us':>12}"]
+
+        def walk(node: Dict, depth: int):
+            name = '  ' * depth + node['name']
+            lines.append(
+                f"{name:<44}{node['count']:>10}{node['total_ns'] / 1e6:>12.2f}{node['self_ns'] / 1e6:>12.2f}"
+                f"{node['total_ns'] / node['count'] / 1e3:>12.1f}{node['max_ns'] / 1e3:>12.1f}"
+            )
+            for child in node['children']:
+                walk(child, depth + 1)
+
+        for root in self.call_tree():
+            walk(root, 0)
+        if self.sample_every > 1:
+            lines.append(f"(every {self.sample_every}th root span sampled)")
+        return '\n'.join(lines)
+
+    def folded(self) -> List[str]:
+        """Стеки в свернутом формате flamegraph.pl: 'a;b;c <собственное время, нс>'"""
+        lines = []
+
+        def walk(node: Dict, prefix: str):
+            stack = f"{prefix};{node['name']}" if prefix else node['name']
+            if node['self_ns'] > 0:
+                lines.append(f"{stack} {node['self_ns']}")
+            for child in node['children']:
+                walk(child, stack)
+
+        for root in self.call_tree():
+            walk(root, '')
+        return lines
+
+    def speedscope(self, name: str = 'bridge simulation') -> Dict:
+        """Профиль в формате speedscope (тип sampled, вес стека — собственное время)"""
+        frames: List[Dict] = []
+        frame_index: Dict[str, int] = {}
+        samples: List[List[int]] = []
+        weights: List[int] = []
+
+        def walk(node: Dict, stack: List[int]):
+            index = frame_index.get(node['name'])
+            if index is None:
+                index = frame_index[node['name']] = len(frames)
+                frames.append({'name': node['name']})
+            stack = stack + [index]
+            if node['self_ns'] > 0:
+                samples.append(stack)
+                weights.append(node['self_ns'])
+            for child in node['children']:
+                walk(child, stack)
+
+        for root in self.call_tree():
+            walk(root, [])
         return {
-            'result': result,
-            'execution_time': end_time - start_time
+            '$schema': 'https://www.speedscope.app/file-format-schema.json',
+            'shared': {'frames': frames},
+            'profiles': [{
+                'type': 'sampled',
+                'name': name,
+                'unit': 'nanoseconds',
+                'startValue': 0,
+                'endValue': sum(weights),
+                'samples': samples,
+                'weights': weights,
+            }],
         }
-    
-    return wrapper
\ No newline at end of file
+
+    def export(self, path: str):
+        """Записывает профиль: *.json — для speedscope, иначе свернутые стеки"""
+        with open(path, 'w') as file:
+            if path.endswith('.json'):
+                json.dump(self.speedscope(), file)
+            else:
+                file.write(''.join(line + '\n' for line in self.folded()))
+
+
+# Общий профилировщик симулятора, по умолчанию выключен
+profiler = Profiler()
+span = profiler.span
+profiled = profiler.profiled
+
+
+def measure_time(func: Callable[..., Any]) -> Callable[..., Any]:
+    """Декоратор для измерения времени выполнения функции (участок общего профилировщика)"""
+    return profiled()(func)
@@ -0,0 +1,175 @@
+# src/utils/result_cache.py
+import hashlib
+import json
+import os
+import tempfile
+from functools import lru_cache
+from itertools import islice
+from typing import Dict, Iterable, List, Optional
+import numpy as np
+from .arrival_format import DIRECTION_CODES, ITER_CHUNK, ArrivalColumns
+
+# Кэш результатов симуляции на диске. Запись хранится в файле <ключ>.json,
+# ключ — sha256 от хэша входных данных, параметров прогона и версии кода,
+# поэтому изменение любого из них дает новый ключ, а не устаревший результат.
+# Время последнего обращения хранится в mtime файла: при превышении
+# размера кэша удаляются записи, к которым дольше всего не обращались.
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+HASH_BLOCK_SIZE = 1 << 20
+
+SOURCE_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def default_cache_dir() -> str:
+    """Каталог кэша по умолчанию: $XDG_CACHE_HOME/bridge_simulation"""
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'bridge_simulation')
+
+
+@lru_cache(maxsize=1)
+def code_version() -> str:
+    """Хэш исходного кода симулятора (все .py в src/): новая версия кода — новые ключи"""
+    digest = hashlib.sha256()
+    for directory, subdirectories, files in os.walk(SOURCE_ROOT):
+        subdirectories[:] = sorted(name for name in subdirectories if name != '__pycache__')
+        for name in sorted(files):
+            if name.endswith('.py'):
+                path = os.path.join(directory, name)
+                digest.update(os.path.relpath(path, SOURCE_ROOT).encode())
+                with open(path, 'rb') as file:
+                    digest.update(file.read())
+    return digest.hexdigest()
+
+
+def hash_file(path: str) -> str:
+    """Хэш содержимого входного файла (CSV или бинарного)"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as file:
+        for block in iter(lambda: file.read(HASH_BLOCK_SIZE), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def hash_arrivals(cars_data: Iterable) -> str:
+    """
+    Хэш прибытий в памяти. Строки переводятся в колонки NumPy кусками,
+    а у ArrivalColumns хэшируются сами колонки без копирования.
+    """
+    digest = hashlib.sha256()
+    if isinstance(cars_data, ArrivalColumns):
+        for column in (cars_data.arrival_times, cars_data.car_ids, cars_data.directions):
+            digest.update(memoryview(np.ascontiguousarray(column)))
+        return digest.hexdigest()
+
+    rows = iter(cars_data)
+    while True:
+        chunk = list(islice(rows, ITER_CHUNK))
+        if not chunk:
+            break
+        digest.update(np.array([row[0] for row in chunk], dtype=np.float64).tobytes())
+        digest.update(np.array([row[1] for row in chunk], dtype=np.int64).tobytes())
+        digest.update(np.array([DIRECTION_CODES[row[2]] for row in chunk], dtype=np.uint8).tobytes())
+        # Необязательная колонка времени проезда; NaN — время моста по умолчанию
+        digest.update(np.array([row[3] if len(row) > 3 else np.nan for row in chunk], dtype=np.float64).tobytes())
+    return digest.hexdigest()
+
+
+def cache_key(data_hash: str, params: Dict) -> str:
+    """Ключ записи: хэш данных, параметры прогона и версия кода"""
+    payload = json.dumps({'data': data_hash, 'code': code_version(), 'params': params}, sort_keys=True)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def _to_json(value):
+    """Числа NumPy в статистике пакетного движка"""
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class ResultCache:
+    """
+    Кэш get_statistics() прогонов (и, по желанию, результатов по машинам)
+    с ограничением размера и вытеснением давно не использованных записей.
+    Запись пишется во временный файл и переименовывается, поэтому
+    одновременные прогоны не видят недописанных записей.
+    """
+
+    def __init__(self, directory: Optional[str] = None, max_bytes: int = DEFAULT_MAX_BYTES):
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be positive")
+        self.directory = directory or default_cache_dir()
+        self.max_bytes = max_bytes
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key + '.json')
+
+    def get(self, key: str) -> Optional[Dict]:
+        """
+        Запись по ключу или None.
+        Returns: {'stats': ..., 'cars': список строк или None, 'params': ...}
+        """
+        path = self._path(key)
+        try:
+            with open(path) as file:
+                entry = json.load(file)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError):
+            # Поврежденная запись считается отсутствующей
+            self._remove(path)
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return entry
+
+    def put(self, key: str, stats: Dict, cars: Optional[List] = None, params: Optional[Dict] = None):
+        """Сохраняет результат прогона и вытесняет старые записи сверх размера"""
+        entry = {'stats': stats, 'cars': cars, 'params': params}
+        descriptor, temp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(descriptor, 'w') as file:
+                json.dump(entry, file, default=_to_json)
+            os.replace(temp_path, self._path(key))
+        except BaseException:
+            self._remove(temp_path)
+            raise
+        self.evict()
+
+    def entries(self) -> List[os.DirEntry]:
+        return [entry for entry in os.scandir(self.directory) if entry.name.endswith('.json')]
+
+    def size(self) -> int:
+        """Суммарный размер записей, байт"""
+        return sum(entry.stat().st_size for entry in self.entries())
+
+    def evict(self):
+        """Удаляет записи, к которым дольше всего не обращались, пока кэш больше max_bytes"""
+        entries = []
+        for entry in self.entries():
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            self._remove(path)
+            total -= size
+
+    def clear(self):
+        for entry in self.entries():
+            self._remove(entry.path)
+
+    @staticmethod
+    def _remove(path: str):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,346 @@
+# src/utils/statistics.py
+import math
+from typing import Dict, Iterable
+from ..models.direction import Direction
+
+# Квантили времени ожидания, которые попадают в статистику
+PERCENTILES = (50, 95, 99)
+
+
+class RunningStats:
+    """
+    Онлайн-статистика за O(1) памяти: количество, среднее и дисперсия
+    по алгоритму Уэлфорда, минимум и максимум. Объединяется с другой
+    такой же статистикой без потери точности.
+    """
+    __slots__ = ('count', 'mean', '_m2', 'min', 'max')
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value: float):
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def merge(self, other: 'RunningStats'):
+        if other.count == 0:
+            return
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self._m2 += other._m2 + delta * delta * self.count * other.count / count
+        self.count = count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    @property
+    def total(self) -> float:
+        return self.mean * self.count
+
+    @property
+    def variance(self) -> float:
+        return self._m2 / self.count if self.count else 0.0
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.variance)
+
+
+class LogHistogram:
+    """
+    Гистограмма с логарифмическими корзинами в духе HDR Histogram.
+    Каждая степень двойки делится на SUB_BUCKETS равных корзин, поэтому
+    относительная погрешность квантиля не превышает 1 / (2 * SUB_BUCKETS)
+    при любом масштабе значений, а память зависит только от диапазона
+    значений, но не от их количества. Нули и отрицательные значения
+    попадают в отдельную корзину. Гистограммы складываются.
+    """
+    SUB_BUCKETS = 128
+
+    __slots__ = ('counts', 'zero_count', 'count')
+
+    def __init__(self):
+        self.counts: Dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+
+    def add(self, value: float):
+        self.count += 1
+        if value <= 0:
+            self.zero_count += 1
+            return
+        mantissa, exponent = math.frexp(value)
+        index = exponent * self.SUB_BUCKETS + int((mantissa - 0.5) * 2 * self.SUB_BUCKETS)
+        self.counts[index] = self.counts.get(index, 0) + 1
+
+    def merge(self, other: 'LogHistogram'):
+        for index, count in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + count
+        self.zero_count += other.zero_count
+        self.count += other.count
+
+    def _bucket_value(self, index: int) -> float:
+        """Середина корзины"""
+        exponent, sub = divmod(index, self.SUB_BUCKETS)
+        return math.ldexp(0.5 + (sub + 0.5) / (2 * self.SUB_BUCKETS), exponent)
+
+    def quantiles(self, fractions: Iterable[float]) -> Dict[float, float]:
+        """Значения квантилей (fractions в [0, 1]) по правилу ближайшего ранга"""
+        fractions = sorted(fractions)
+        result = {fraction: 0.0 for fraction in fractions}
+        if self.count == 0:
+            return result
+
+        targets = iter((fraction, max(1, math.ceil(fraction * self.count))) for fraction in fractions)
+        fraction, target = next(targets)
+        cumulative = self.zero_count
+        while cumulative >= target:
+            result[fraction] = 0.0
+            fraction, target = next(targets, (None, None))
+            if fraction is None:
+                return result
+
+        for index in sorted(self.counts):
+            cumulative += self.counts[index]
+            while cumulative >= target:
+                result[fraction] = self._bucket_value(index)
+                fraction, target = next(targets, (None, None))
+                if fraction is None:
+                    return result
+        return result
+
+
+class SampleStatistics:
+    """Сводка по одной величине: онлайн-моменты плюс гистограмма квантилей"""
+    __slots__ = ('moments', 'histogram')
+
+    def __init__(self):
+        self.moments = RunningStats()
+        self.histogram = LogHistogram()
+
+    def add(self, value: float):
+        self.moments.add(value)
+        self.histogram.add(value)
+
+    def merge(self, other: 'SampleStatistics'):
+        self.moments.merge(other.moments)
+        self.histogram.merge(other.histogram)
+
+    def percentiles(self) -> Dict[int, float]:
+        """Перцентили PERCENTILES, ограниченные наблюдавшимся диапазоном"""
+        values = self.histogram.quantiles(p / 100 for p in PERCENTILES)
+        if self.moments.count == 0:
+            return {p: 0.0 for p in PERCENTILES}
+        low, high = self.moments.min, self.moments.max
+        return {p: min(max(values[p / 100], low), high) for p in PERCENTILES}
+
+
+class CrossingStatistics:
+    """
+    Статистика проездов через мост, общая для всех реализаций.
+    Время ожидания и проезда накапливается онлайн по направлениям,
+    общая статистика получается их объединением, поэтому память
+    не растет с числом машин, а get_statistics() не зависит от него.
+    """
+
+    def __init__(self):
+        self.waiting: Dict[Direction, SampleStatistics] = {
+            direction: SampleStatistics() for direction in Direction
+        }
+        self.crossing: Dict[Direction, RunningStats] = {
+            direction: RunningStats() for direction in Direction
+        }
+
+    def record_wait(self, direction: Direction, wait_time: float):
+        """Машина въехала на мост после ожидания wait_time"""
+        self.waiting[direction].add(wait_time)
+
+    def record_crossing(self, direction: Direction, crossing_time: float):
+        """Машина съехала с моста"""
+        self.crossing[direction].add(crossing_time)
+
+    @property
+    def total_crossed(self) -> int:
+        return sum(stats.count for stats in self.crossing.values())
+
+    def merge(self, other: 'CrossingStatistics'):
+        for direction in Direction:
+            self.waiting[direction].merge(other.waiting[direction])
+            self.crossing[direction].merge(other.crossing[direction])
+
+    @staticmethod
+    def _waiting_summary(waiting: SampleStatistics) -> Dict:
+        moments = waiting.moments
+        summary = {
+            'avg_waiting_time': moments.mean if moments.count else 0,
+            'max_waiting_time': moments.max if moments.count else 0,
+            'std_waiting_time': moments.std,
+        }
+        for percentile, value in waiting.percentiles().items():
+            summary[f'p{percentile}_waiting_time'] = value
+        return summary
+
+    def get_statistics(self) -> Dict:
+        """Сводная статистика в формате get_statistics() мостов"""
+        waiting = SampleStatistics()
+        crossing = RunningStats()
+        for direction in Direction:
+            waiting.merge(self.waiting[direction])
+            crossing.merge(self.crossing[direction])
+
+        stats = {
+            'total_crossed': crossing.count,
+            'avg_crossing_time': crossing.mean if crossing.count else 0,
+            **self._waiting_summary(waiting),
+            'direction_stats': {}
+        }
+
+        for direction in Direction:
+            stats['direction_stats'][direction.value] = {
+                'total_crossed': self.crossing[direction].count,
+                **self._waiting_summary(self.waiting[direction])
+            }
+
+        return stats
+
+
+class OccupancyStatistics:
+    """
+    Занятость моста емкостью capacity машин: время, когда на мосту
+    была хотя бы одна машина (объединение интервалов проезда), и
+    суммарное время проезда всех машин — столько мост на одну машину
+    был бы занят той же работой. Их отношение — выигрыш пропускной
+    способности от емкости: при насыщенной очереди мост пропускает во
+    столько раз больше машин в секунду. Въезды записываются в порядке
+    времени, поэтому объединение считается онлайн за O(1).
+    """
+    __slots__ = ('capacity', 'headway', 'count', 'busy_time', 'serial_busy_time',
+                 'first_admit', 'busy_until')
+
+    def __init__(self, capacity: int = 1, headway: float = 0.0):
+        self.capacity = capacity
+        self.headway = headway
+        self.count = 0
+        self.busy_time = 0.0
+        self.serial_busy_time = 0.0
+        self.first_admit = None
+        self.busy_until = -math.inf
+
+    def record(self, admit_time: float, depart_time: float):
+        """Машина занимает мост с admit_time до depart_time"""
+        if self.first_admit is None:
+            self.first_admit = admit_time
+        self.count += 1
+        self.serial_busy_time += depart_time - admit_time
+        if admit_time >= self.busy_until:
+            self.busy_time += depart_time - admit_time
+            self.busy_until = depart_time
+        elif depart_time > self.busy_until:
+            self.busy_time += depart_time - self.busy_until
+            self.busy_until = depart_time
+
+    def get_statistics(self) -> Dict:
+        span = self.busy_until - self.first_admit if self.count else 0.0
+        return {
+            'capacity': self.capacity,
+            'headway': self.headway,
+            'busy_time': self.busy_time,
+            'serial_busy_time': self.serial_busy_time,
+            'cars_per_second': self.count / span if span > 0 else 0.0,
+            'throughput_gain': self.serial_busy_time / self.busy_time if self.busy_time > 0 else 1.0,
+        }
+
+
+class TripStatistics:
+    """Сквозная статистика поездок по сети мостов: время в пути и суммарное ожидание"""
+
+    def __init__(self):
+        self.trip = SampleStatistics()
+        self.waiting = SampleStatistics()
+
+    def record_trip(self, trip_time: float, waiting_time: float):
+        """Машина проехала весь маршрут"""
+        self.trip.add(trip_time)
+        self.waiting.add(waiting_time)
+
+    @property
+    def total_trips(self) -> int:
+        return self.trip.moments.count
+
+    def merge(self, other: 'TripStatistics'):
+        self.trip.merge(other.trip)
+        self.waiting.merge(other.waiting)
+
+    def get_statistics(self) -> Dict:
+        trip, waiting = self.trip.moments, self.waiting.moments
+        stats = {
+            'total_trips': trip.count,
+            'avg_trip_time': trip.mean if trip.count else 0,
+            'max_trip_time': trip.max if trip.count else 0,
+            'avg_trip_waiting_time': waiting.mean if waiting.count else 0,
+            'max_trip_waiting_time': waiting.max if waiting.count else 0,
+        }
+        for percentile, value in self.trip.percentiles().items():
+            stats[f'p{percentile}_trip_time'] = value
+        return stats
+
+
+class SynchronizationStatistics:
+    """
+    Счетчики синхронизации многопоточного моста: ожидание блокировки
+    (наносекунды perf_counter_ns), пробуждения ожидающих машин, проверки
+    can_cross и длина очередей в момент въезда. Обновляются под
+    блокировкой моста, поэтому своей блокировки не требуют.
+    """
+    __slots__ = ('lock_acquisitions', 'lock_wait_ns', 'max_lock_wait_ns',
+                 'wakeups', 'spurious_wakeups', 'can_cross_evaluations', 'queue_depth')
+
+    def __init__(self):
+        self.lock_acquisitions = 0
+        self.lock_wait_ns = 0
+        self.max_lock_wait_ns = 0
+        self.wakeups = 0
+        self.spurious_wakeups = 0
+        self.can_cross_evaluations = 0
+        self.queue_depth = SampleStatistics()
+
+    def record_lock_wait(self, wait_ns: int):
+        """Блокировка захвачена после ожидания wait_ns"""
+        self.lock_acquisitions += 1
+        self.lock_wait_ns += wait_ns
+        if wait_ns > self.max_lock_wait_ns:
+            self.max_lock_wait_ns = wait_ns
+
+    def record_wakeup(self, spurious: bool):
+        """Ожидающая машина проснулась; spurious — мост ей так и не передан"""
+        self.wakeups += 1
+        if spurious:
+            self.spurious_wakeups += 1
+
+    def get_statistics(self, total_crossed: int) -> Dict:
+        depth = self.queue_depth.moments
+        stats = {
+            'lock_acquisitions': self.lock_acquisitions,
+            'total_lock_wait_ms': self.lock_wait_ns / 1e6,
+            'avg_lock_wait_us': self.lock_wait_ns / 1e3 / self.lock_acquisitions if self.lock_acquisitions else 0,
+            'max_lock_wait_us': self.max_lock_wait_ns / 1e3,
+            'wakeups': self.wakeups,
+            'spurious_wakeups': self.spurious_wakeups,
+            'can_cross_evaluations': self.can_cross_evaluations,
+            'can_cross_per_crossing': self.can_cross_evaluations / total_crossed if total_crossed else 0,
+            'avg_queue_depth': depth.mean if depth.count else 0,
+            'max_queue_depth': depth.max if depth.count else 0,
+        }
+        for percentile, value in self.queue_depth.percentiles().items():
+            stats[f'p{percentile}_queue_depth'] = value
+        return stats
@@ -0,0 +1,152 @@
+# src/utils/trace.py
+import json
+import struct
+import threading
+from array import array
+from enum import IntEnum
+from typing import Dict, Optional
+import numpy as np
+from ..models.direction import Direction
+from .arrival_format import DIRECTION_CODES
+
+# Бинарная трасса событий моста:
+#   MAGIC (8 байт) + число событий (uint64) + длина метаданных (uint32)
+#   метаданные: JSON (политика, приоритет, MAX_CONSECUTIVE, режим)
+#   события: записи TRACE_DTYPE по 18 байт подряд
+# Записи фиксированной длины, поэтому трасса читается через numpy.memmap.
+MAGIC = b'BRGTRC1\n'
+HEADER = struct.Struct('<8sQI')
+
+TRACE_DTYPE = np.dtype([
+    ('time', '<f8'),
+    ('car_id', '<i8'),
+    ('direction', 'u1'),
+    ('kind', 'u1'),
+])
+
+# Сколько событий копится в памяти до дозаписи в файл
+DEFAULT_CHUNK_SIZE = 65536
+
+
+class TraceEvent(IntEnum):
+    """Тип события трассы"""
+    ARRIVE = 0   # машина встала в очередь
+    ADMIT = 1    # машина въехала на мост
+    DEPART = 2   # машина съехала с моста
+    SWITCH = 3   # направление движения сменилось (перед ADMIT этой машины)
+
+
+class TraceRecorder:
+    """
+    Запись трассы событий в колонки array.array.
+
+    Без path трасса остается в памяти (events()), с path события
+    дописываются в файл кусками по chunk_size, а close() записывает
+    итоговое число событий в заголовок. record потокобезопасен.
+    """
+
+    def __init__(self, path: Optional[str] = None, metadata: Optional[Dict] = None,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE):
+        self.path = path
+        self.metadata = dict(metadata or {})
+        self.chunk_size = chunk_size
+        self.count = 0
+        self._lock = threading.Lock()
+        self._chunks = []
+        self._reset_columns()
+
+        self._file = None
+        if path is not None:
+            self._metadata_bytes = json.dumps(self.metadata).encode()
+            self._file = open(path, 'wb')
+            self._file.write(HEADER.pack(MAGIC, 0, len(self._metadata_bytes)))
+            self._file.write(self._metadata_bytes)
+
+    def _reset_columns(self):
+        self._times = array('d')
+        self._car_ids = array('q')
+        self._directions = array('B')
+        self._kinds = array('B')
+
+    def record(self, time: float, kind: TraceEvent, car_id: int, direction: Direction):
+        """Добавляет событие"""
+        with self._lock:
+            self._times.append(time)
+            self._car_ids.append(car_id)
+            self._directions.append(DIRECTION_CODES[direction])
+            self._kinds.append(kind)
+            if len(self._times) >= self.chunk_size:
+                self._flush()
+
+    def _flush(self):
+        """Переносит накопленные события в кусок записей (под блокировкой)"""
+        if not self._times:
+            return
+        chunk = np.empty(len(self._times), TRACE_DTYPE)
+        chunk['time'] = np.frombuffer(self._times, dtype=np.float64)
+        chunk['car_id'] = np.frombuffer(self._car_ids, dtype=np.int64)
+        chunk['direction'] = np.frombuffer(self._directions, dtype=np.uint8)
+        chunk['kind'] = np.frombuffer(self._kinds, dtype=np.uint8)
+        self.count += len(chunk)
+        self._reset_columns()
+
+        if self._file is not None:
+            self._file.write(chunk.tobytes())
+        else:
+            self._chunks.append(chunk)
+
+    def events(self) -> np.ndarray:
+        """Все события трассы, записанной в память"""
+        if self.path is not None:
+            raise ValueError("Trace is written to a file, use load_trace()")
+        with self._lock:
+            self._flush()
+            if len(self._chunks) > 1:
+                self._chunks = [np.concatenate(self._chunks)]
+            return self._chunks[0] if self._chunks else np.empty(0, TRACE_DTYPE)
+
+    def close(self):
+        """Дописывает оставшиеся события и заголовок файла"""
+        with self._lock:
+            if self._file is None:
+                return
+            self._flush()
+            self._file.seek(0)
+            self._file.write(HEADER.pack(MAGIC, self.count, len(self._metadata_bytes)))
+            self._file.close()
+            self._file = None
+
+    def __enter__(self) -> 'TraceRecorder':
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        self.close()
+
+
+class Trace:
+    """Прочитанная трасса: события (memmap) и метаданные записи"""
+
+    def __init__(self, events: np.ndarray, metadata: Dict):
+        self.events = events
+        self.metadata = metadata
+
+    def __len__(self) -> int:
+        return len(self.events)
+
+    def of_kind(self, kind: TraceEvent) -> np.ndarray:
+        """События одного типа в порядке записи"""
+        return self.events[self.events['kind'] == kind]
+
+
+def load_trace(path: str) -> Trace:
+    """Отображает файл трассы в память без копирования"""
+    with open(path, 'rb') as file:
+        magic, count, metadata_size = HEADER.unpack(file.read(HEADER.size))
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a bridge trace file")
+        metadata = json.loads(file.read(metadata_size) or b'{}')
+
+    if count == 0:
+        return Trace(np.empty(0, TRACE_DTYPE), metadata)
+    events = np.memmap(path, dtype=TRACE_DTYPE, mode='r', offset=HEADER.size + metadata_size, shape=(count,))
+    return Trace(events, metadata)
@@ -0,0 +1,224 @@
+# src/utils/workload.py
+import math
+from typing import Iterator, Optional, Sequence
+import numpy as np
+from .arrival_format import DIRECTIONS, ArrivalColumns, ArrivalWriter, DIRECTION_DTYPE, ID_DTYPE
+
+# Сколько машин генерируется за один векторный шаг
+DEFAULT_CHUNK_SIZE = 1_000_000
+
+# Часы пик в долях периода (утро и вечер суток) для rush_hours
+RUSH_HOURS = ((7 / 24, 9 / 24), (17 / 24, 19 / 24))
+
+CSV_HEADER = 'arrival_time,car_id,direction\n'
+
+
+class ArrivalProcess:
+    """
+    Процесс прибытий: бесконечный поток отсортированных моментов
+    прибытия кусками по size значений. Состояние процесса между кусками
+    (текущее время, фаза MMPP) живет в генераторе chunks, поэтому один
+    объект можно запускать несколько раз.
+    """
+
+    def chunks(self, rng: np.random.Generator, size: int) -> Iterator[np.ndarray]:
+        raise NotImplementedError
+
+
+class Poisson(ArrivalProcess):
+    """Пуассоновский поток с интенсивностью rate машин в секунду"""
+
+    def __init__(self, rate: float = 1.0):
+        if rate <= 0:
+            raise ValueError("Arrival rate must be positive")
+        self.rate = rate
+
+    def chunks(self, rng: np.random.Generator, size: int) -> Iterator[np.ndarray]:
+        now = 0.0
+        while True:
+            times = np.cumsum(rng.exponential(1 / self.rate, size))
+            times += now
+            now = times[-1]
+            yield times
+
+
+class NonHomogeneousPoisson(ArrivalProcess):
+    """
+    Неоднородный пуассоновский поток с периодической кусочно-постоянной
+    интенсивностью: rates[i] машин в секунду на i-м интервале длины
+    bin_width, после последнего интервала профиль повторяется.
+    Моменты прибытия получаются заменой времени: накопленная
+    интенсивность Λ(t) кусочно-линейна, и прибытия — это Λ^-1 от сумм
+    экспоненциальных величин, что векторно считается через np.interp
+    без прореживания.
+    """
+
+    def __init__(self, rates: Sequence[float], bin_width: float = 3600.0):
+        self.rates = np.asarray(rates, dtype=np.float64)
+        if len(self.rates) == 0 or np.any(self.rates <= 0):
+            raise ValueError("Rate profile must be a non-empty list of positive rates")
+        if bin_width <= 0:
+            raise ValueError("bin_width must be positive")
+        self.bin_width = bin_width
+        self.period = bin_width * len(self.rates)
+        # Узлы Λ(t) на границах интервалов одного периода
+        self._edges = np.arange(len(self.rates) + 1) * bin_width
+        self._cumulative = np.concatenate(([0.0], np.cumsum(self.rates * bin_width)))
+
+    @classmethod
+    def rush_hours(cls, base_rate: float, peak_rate: float, period: float = 86400.0,
+                   bins: int = 24) -> 'NonHomogeneousPoisson':
+        """Профиль суток: base_rate вне часов пик RUSH_HOURS и peak_rate в них"""
+        starts = np.arange(bins) / bins
+        rates = np.full(bins, float(base_rate))
+        for peak_start, peak_end in RUSH_HOURS:
+            rates[(starts >= peak_start) & (starts < peak_end)] = peak_rate
+        return cls(rates, period / bins)
+
+    def chunks(self, rng: np.random.Generator, size: int) -> Iterator[np.ndarray]:
+        total = self._cumulative[-1]
+        level = 0.0
+        while True:
+            levels = np.cumsum(rng.exponential(1.0, size))
+            levels += level
+            level = levels[-1]
+            cycles, remainder = np.divmod(levels, total)
+            yield cycles * self.period + np.interp(remainder, self._cumulative, self._edges)
+
+
+class MMPP(ArrivalProcess):
+    """
+    Пачечный поток: марковски модулированный пуассоновский процесс с двумя
+    фазами. В спокойной фазе машины идут с интенсивностью quiet_rate,
+    в фазе пачки — с burst_rate; длительность фаз экспоненциальна со
+    средними quiet_mean и burst_mean секунд. Фазы генерируются пачками:
+    число прибытий в фазе — Poisson(rate * длительность), а сами моменты
+    равномерны внутри фазы.
+    """
+
+    def __init__(self, quiet_rate: float, burst_rate: float, quiet_mean: float, burst_mean: float):
+        if quiet_rate < 0 or burst_rate <= 0:
+            raise ValueError("MMPP needs quiet_rate >= 0 and burst_rate > 0")
+        if quiet_mean <= 0 or burst_mean <= 0:
+            raise ValueError("Mean phase durations must be positive")
+        self.rates = np.array([quiet_rate, burst_rate])
+        self.means = np.array([quiet_mean, burst_mean])
+
+    def chunks(self, rng: np.random.Generator, size: int) -> Iterator[np.ndarray]:
+        # Сколько пар фаз нужно, чтобы в среднем набрать кусок
+        per_cycle = float(self.rates @ self.means)
+        cycles = max(1, math.ceil(size / per_cycle))
+        phases = np.tile([0, 1], cycles)
+        now = 0.0
+        pending = np.empty(0)
+        while True:
+            while len(pending) < size:
+                durations = rng.exponential(self.means[phases])
+                starts = now + np.cumsum(durations) - durations
+                now = starts[-1] + durations[-1]
+                counts = rng.poisson(self.rates[phases] * durations)
+                offsets = rng.random(counts.sum()) * np.repeat(durations, counts)
+                times = np.repeat(starts, counts) + offsets
+                # Фазы не пересекаются, поэтому достаточно общей сортировки
+                times.sort()
+                pending = np.concatenate((pending, times))
+            yield pending[:size]
+            pending = pending[size:]
+
+
+def parse_process(spec: str) -> ArrivalProcess:
+    """
+    Разбирает описание процесса прибытий из командной строки:
+    poisson:2.0, rush:0.5,3.0[,period], nhpp:bin_width,rate1,rate2,...,
+    mmpp:quiet_rate,burst_rate,quiet_mean,burst_mean
+    """
+    name, _, params = spec.partition(':')
+    name = name.strip().lower()
+    args = [float(value) for value in params.split(',') if value.strip()]
+    if name == 'poisson':
+        return Poisson(*args)
+    if name == 'rush':
+        if len(args) < 2:
+            raise ValueError("Rush hour profile needs base and peak rates: rush:<base>,<peak>[,<period>]")
+        return NonHomogeneousPoisson.rush_hours(*args)
+    if name == 'nhpp':
+        if len(args) < 2:
+            raise ValueError("Rate profile needs a bin width and rates: nhpp:<bin_width>,<rate>,...")
+        return NonHomogeneousPoisson(args[1:], args[0])
+    if name == 'mmpp':
+        if len(args) != 4:
+            raise ValueError("MMPP needs four values: mmpp:<quiet_rate>,<burst_rate>,<quiet_mean>,<burst_mean>")
+        return MMPP(*args)
+    raise ValueError(f"Unknown arrival process: {name}")
+
+
+class WorkloadGenerator:
+    """
+    Синтетические входные данные: моменты прибытия из process и
+    направления, где left_share — доля машин слева направо (дисбаланс
+    направлений). Данные выдаются отсортированными кусками ArrivalColumns
+    по chunk_size машин, без кортежей Python, поэтому десятки миллионов
+    машин пишутся в файл потоком. Время и направления берутся из
+    независимых генераторов с зерном seed: при тех же seed и chunk_size
+    получаются те же данные.
+    """
+
+    def __init__(self, process: ArrivalProcess, left_share: float = 0.5, seed: Optional[int] = 0,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE):
+        if not 0 <= left_share <= 1:
+            raise ValueError("left_share must be between 0 and 1")
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        self.process = process
+        self.left_share = left_share
+        self.seed = seed
+        self.chunk_size = chunk_size
+
+    def chunks(self, num_cars: int) -> Iterator[ArrivalColumns]:
+        """num_cars машин кусками; номера машин идут по порядку прибытия"""
+        time_rng, direction_rng = (np.random.default_rng(seed)
+                                   for seed in np.random.SeedSequence(self.seed).spawn(2))
+        times = self.process.chunks(time_rng, self.chunk_size)
+        for start in range(0, num_cars, self.chunk_size):
+            size = min(self.chunk_size, num_cars - start)
+            arrival_times = next(times)[:size]
+            directions = (direction_rng.random(size) >= self.left_share).astype(DIRECTION_DTYPE)
+            car_ids = np.arange(start, start + size, dtype=ID_DTYPE)
+            yield ArrivalColumns(arrival_times, car_ids, directions)
+
+    def generate(self, num_cars: int) -> ArrivalColumns:
+        """Все num_cars машин одним набором колонок"""
+        chunks = list(self.chunks(num_cars))
+        if not chunks:
+            return ArrivalColumns(np.empty(0), np.empty(0, ID_DTYPE), np.empty(0, DIRECTION_DTYPE))
+        return ArrivalColumns(
+            np.concatenate([chunk.arrival_times for chunk in chunks]),
+            np.concatenate([chunk.car_ids for chunk in chunks]),
+            np.concatenate([chunk.directions for chunk in chunks]),
+        )
+
+
+def write_csv(path: str, chunks: Iterator[ArrivalColumns]) -> int:
+    """
+    Записывает куски в CSV с заголовком, как его читает InputReader.
+    Время пишется в кратчайшем точном виде (repr). Returns: число машин
+    """
+    names = np.array([direction.value for direction in DIRECTIONS])
+    count = 0
+    with open(path, 'w') as file:
+        file.write(CSV_HEADER)
+        for chunk in chunks:
+            rows = map('{},{},{}\n'.format, chunk.arrival_times.tolist(), chunk.car_ids.tolist(),
+                       names[chunk.directions].tolist())
+            file.write(''.join(rows))
+            count += len(chunk)
+    return count
+
+
+def write_binary(path: str, chunks: Iterator[ArrivalColumns]) -> int:
+    """Записывает куски в бинарный формат прибытий. Returns: число машин"""
+    with ArrivalWriter(path) as writer:
+        for chunk in chunks:
+            writer.write(chunk.arrival_times, chunk.car_ids, chunk.directions)
+        return writer.count
+
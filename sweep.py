@@ -0,0 +1,89 @@
+import argparse
+import os
+import time
+from src.models.policy import POLICIES
+from src.simulation.sweep import ENGINES, NO_PRIORITY, build_grid, run_sweep
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Run a parameter sweep of the bridge simulation on all cores')
+    parser.add_argument(
+        '--input-files',
+        nargs='+',
+        default=['input.txt'],
+        help='Input files with car arrival times (CSV or binary)'
+    )
+    parser.add_argument(
+        '--engine',
+        nargs='+',
+        choices=sorted(ENGINES),
+        default=['event'],
+        help='Simulation engines to run'
+    )
+    parser.add_argument(
+        '--max-consecutive',
+        nargs='+',
+        type=int,
+        default=[3],
+        help='Values of MAX_CONSECUTIVE'
+    )
+    parser.add_argument(
+        '--priority-direction',
+        nargs='+',
+        choices=[NO_PRIORITY, 'left_to_right', 'right_to_left'],
+        default=[NO_PRIORITY],
+        help='Priority directions'
+    )
+    parser.add_argument(
+        '--arrival-rate',
+        nargs='+',
+        type=float,
+        default=[1.0],
+        help='Arrival rate multipliers (2 means cars arrive twice as often)'
+    )
+    parser.add_argument(
+        '--crossing-time',
+        nargs='+',
+        type=float,
+        default=[1.0],
+        help='Crossing times in seconds'
+    )
+    parser.add_argument(
+        '--policy',
+        nargs='+',
+        choices=list(POLICIES),
+        default=['alternating'],
+        help='Scheduling policies'
+    )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=os.cpu_count(),
+        help='Number of worker processes'
+    )
+    parser.add_argument(
+        '--output',
+        type=str,
+        default='sweep_results.csv',
+        help='Result table (.csv or .jsonl); an existing table is resumed'
+    )
+    return parser.parse_args()
+
+def main():
+    args = parse_args()
+    cases = build_grid(
+        args.input_files, args.engine, args.max_consecutive,
+        args.priority_direction, args.arrival_rate, args.crossing_time, args.policy
+    )
+    logger.info(f"Running {len(cases)} simulations on {args.workers} processes...")
+    start_time = time.time()
+
+    completed = run_sweep(cases, args.output, args.workers)
+
+    logger.info(f"Completed {completed} runs in {time.time() - start_time:.2f} seconds, "
+                f"results in {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+from src.models.direction import Direction
+from src.simulation.event_driven import EventDrivenBridge
+from src.utils.arrival_format import ArrivalColumns, ArrivalWriter, convert_csv, is_arrival_file, load_arrivals
+from src.utils.input_reader import InputReader
+
+class TestArrivalFormat(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.csv_file = os.path.join(self.directory.name, 'input.txt')
+        self.binary_file = os.path.join(self.directory.name, 'input.arr')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def create_test_input(self, data):
+        """Создает тестовый входной файл с заголовком"""
+        with open(self.csv_file, 'w') as f:
+            f.write("arrival_time,car_id,direction\n")
+            for arrival_time, car_id, direction in data:
+                f.write(f"{arrival_time},{car_id},{direction.value}\n")
+
+    def test_round_trip(self):
+        """CSV и бинарный файл читаются одинаково"""
+        data = [
+            (0.0, 1, Direction.LEFT_TO_RIGHT),
+            (0.5, 2, Direction.RIGHT_TO_LEFT),
+            (2.25, 3, Direction.LEFT_TO_RIGHT),
+        ]
+        self.create_test_input(data)
+
+        self.assertEqual(convert_csv(self.csv_file, self.binary_file, chunk_size=2), 3)
+
+        self.assertTrue(is_arrival_file(self.binary_file))
+        self.assertFalse(is_arrival_file(self.csv_file))
+        self.assertEqual(list(InputReader.read_cars_data(self.binary_file)),
+                         InputReader.read_cars_data(self.csv_file))
+
+    def test_crossing_time_column_is_skipped(self):
+        """CSV с колонкой времени проезда конвертируется без нее"""
+        with open(self.csv_file, 'w') as f:
+            f.write("arrival_time,car_id,direction,crossing_time\n")
+            f.write("0.0,1,left_to_right,2.5\n0.5,2,right_to_left,\n1.0,3,left_to_right,0.75\n")
+
+        self.assertEqual(convert_csv(self.csv_file, self.binary_file), 3)
+        self.assertEqual(list(load_arrivals(self.binary_file)), [
+            (0.0, 1, Direction.LEFT_TO_RIGHT),
+            (0.5, 2, Direction.RIGHT_TO_LEFT),
+            (1.0, 3, Direction.LEFT_TO_RIGHT),
+        ])
+
+    def test_unsorted_csv_is_sorted(self):
+        """Неотсортированный CSV сортируется при конвертации"""
+        data = [(float(10 - i), i, Direction.RIGHT_TO_LEFT) for i in range(10)]
+        self.create_test_input(data)
+
+        convert_csv(self.csv_file, self.binary_file, chunk_size=3)
+        columns = load_arrivals(self.binary_file)
+
+        self.assertTrue(columns.is_sorted())
+        self.assertEqual(columns[0], (1.0, 9, Direction.RIGHT_TO_LEFT))
+
+    def test_slices_are_zero_copy(self):
+        """Срезы колонок не копируют данные"""
+        self.create_test_input([(float(i), i, Direction.LEFT_TO_RIGHT) for i in range(100)])
+        convert_csv(self.csv_file, self.binary_file)
+
+        columns = load_arrivals(self.binary_file)
+        window = columns[10:20]
+
+        self.assertIsInstance(window, ArrivalColumns)
+        self.assertEqual(len(window), 10)
+        self.assertTrue(np.shares_memory(window.arrival_times, columns.arrival_times))
+        self.assertEqual(window[0], (10.0, 10, Direction.LEFT_TO_RIGHT))
+
+    def test_simulators_accept_binary_file(self):
+        """Симулятор принимает бинарный файл через read_cars_data"""
+        data = [(float(i // 2), i, Direction.LEFT_TO_RIGHT if i % 2 else Direction.RIGHT_TO_LEFT)
+                for i in range(20)]
+        self.create_test_input(data)
+        convert_csv(self.csv_file, self.binary_file)
+
+        from_binary = EventDrivenBridge().simulate(InputReader.read_cars_data(self.binary_file))
+        from_csv = EventDrivenBridge().simulate(InputReader.read_cars_data(self.csv_file))
+
+        self.assertEqual(from_binary, from_csv)
+
+    def test_failed_write_leaves_no_file(self):
+        """Ошибка внутри with не оставляет недописанный файл и временные колонки"""
+        with self.assertRaises(RuntimeError):
+            with ArrivalWriter(self.binary_file) as writer:
+                writer.write([0.0, 1.0], [1, 2], [0, 1])
+                raise RuntimeError("conversion failed")
+
+        self.assertEqual(os.listdir(self.directory.name), [])
+
+    def test_invalid_direction(self):
+        """Неизвестное направление вызывает ошибку"""
+        with open(self.csv_file, 'w') as f:
+            f.write("header\n0,1,invalid_direction\n")
+
+        with self.assertRaises(ValueError):
+            convert_csv(self.csv_file, self.binary_file)
+        self.assertFalse(os.path.exists(self.binary_file))
+
+if __name__ == '__main__':
+    unittest.main()
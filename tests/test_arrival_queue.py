@@ -0,0 +1,45 @@
+import unittest
+from src.models.arrival_queue import ArrivalQueue
+
+class TestArrivalQueue(unittest.TestCase):
+    def test_fifo_across_wraparound_and_growth(self):
+        """Порядок сохраняется, когда буфер переходит через край и удваивается"""
+        queue = ArrivalQueue(capacity=4)
+        for car_id in range(3):
+            queue.append(float(car_id), car_id, 1.0)
+        self.assertEqual(queue.popleft(), (0.0, 0, 1.0))
+        self.assertEqual(queue.popleft(), (1.0, 1, 1.0))
+        # Голова в конце буфера, новые элементы пишутся в начало, затем рост
+        for car_id in range(3, 9):
+            queue.append(float(car_id), car_id, 0.5)
+
+        self.assertEqual(queue.capacity, 8)
+        self.assertEqual(len(queue), 7)
+        self.assertEqual(queue.head_arrival(), 2.0)
+        self.assertEqual([car_id for _, car_id, _ in queue], list(range(2, 9)))
+        self.assertEqual([queue.popleft()[1] for _ in range(7)], list(range(2, 9)))
+        self.assertIsNone(queue.head_arrival())
+        with self.assertRaises(IndexError):
+            queue.popleft()
+
+    def test_copy_is_independent(self):
+        queue = ArrivalQueue(capacity=2)
+        queue.append(0.0, 1, 1.0)
+        queue.append(0.5, 2, 1.5)
+        copy = queue.copy()
+        copy.popleft()
+        copy.append(2.0, 3, 1.0)
+
+        self.assertEqual(list(queue), [(0.0, 1, 1.0), (0.5, 2, 1.5)])
+        self.assertEqual(list(copy), [(0.5, 2, 1.5), (2.0, 3, 1.0)])
+
+    def test_memory_is_fixed_per_car(self):
+        """Память очереди определяется емкостью, а не объектами на машину"""
+        queue = ArrivalQueue(capacity=1000)
+        self.assertEqual(queue.nbytes, 1000 * ArrivalQueue.ITEM_SIZE)
+        for car_id in range(1000):
+            queue.append(car_id * 0.1, car_id, 1.0)
+        self.assertEqual(queue.capacity, 1000)
+
+if __name__ == '__main__':
+    unittest.main()
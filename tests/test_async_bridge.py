@@ -0,0 +1,90 @@
+import unittest
+import numpy as np
+from src.models.async_bridge import AsyncBridge
+from src.models.direction import Direction
+from src.simulation.async_scheduler import AsyncCarScheduler
+from src.simulation.event_driven import EventDrivenBridge
+from src.utils.clock import VirtualEventLoop
+from src.utils.trace import TraceEvent, TraceRecorder
+
+class TestAsyncBridge(unittest.TestCase):
+    def setUp(self):
+        self.loop = VirtualEventLoop()
+
+    def tearDown(self):
+        self.loop.close()
+
+    def simulate(self, cars_data, priority_direction=None):
+        bridge = AsyncBridge(priority_direction)
+        scheduler = AsyncCarScheduler(cars_data, bridge)
+        self.loop.run_until_complete(scheduler.run())
+        return bridge, scheduler
+
+    def test_single_car_crossing(self):
+        """Тест проезда одной машины"""
+        bridge, scheduler = self.simulate([(0, 1, Direction.LEFT_TO_RIGHT)])
+
+        self.assertEqual(bridge.total_crossed, 1)
+        self.assertEqual(bridge.cars_on_bridge, 0)
+        self.assertEqual(scheduler.results[0].crossing_time, 1.0)
+        self.assertEqual(self.loop.time(), 1.0)
+
+    def test_max_consecutive_cars(self):
+        """После MAX_CONSECUTIVE машин проезжает встречная"""
+        cars_data = [(0, i, Direction.LEFT_TO_RIGHT) for i in range(4)]
+        cars_data.append((0, 4, Direction.RIGHT_TO_LEFT))
+
+        _, scheduler = self.simulate(cars_data)
+
+        waits = {result.car_id: result.waiting_time for result in scheduler.results}
+        self.assertEqual(waits[4], 3.0)
+        self.assertEqual(waits[3], 4.0)
+
+    def test_priority_direction(self):
+        """Тест приоритетного направления"""
+        cars_data = [
+            (0, 1, Direction.RIGHT_TO_LEFT),
+            (0.5, 2, Direction.RIGHT_TO_LEFT),
+            (0.5, 3, Direction.LEFT_TO_RIGHT),
+        ]
+
+        bridge, _ = self.simulate(cars_data, Direction.LEFT_TO_RIGHT)
+
+        stats = bridge.get_statistics()['direction_stats']
+        self.assertEqual(stats['left_to_right']['avg_waiting_time'], 0.5)
+
+    def test_simultaneous_arrivals_from_both_directions(self):
+        """Решение принимается после всех прибытий одного момента, как в событийном движке"""
+        cars_data = [
+            (0, 0, Direction.LEFT_TO_RIGHT),
+            (0, 1, Direction.RIGHT_TO_LEFT),
+            (0, 2, Direction.RIGHT_TO_LEFT),
+            (1, 3, Direction.LEFT_TO_RIGHT),
+            (2, 4, Direction.RIGHT_TO_LEFT),
+        ]
+
+        trace = TraceRecorder()
+        bridge = AsyncBridge(Direction.RIGHT_TO_LEFT, trace=trace)
+        self.loop.run_until_complete(AsyncCarScheduler(cars_data, bridge).run())
+        expected = TraceRecorder()
+        EventDrivenBridge(Direction.RIGHT_TO_LEFT, trace=expected).simulate(cars_data)
+
+        events, expected_events = trace.events(), expected.events()
+        admitted = events[events['kind'] == TraceEvent.ADMIT]
+        self.assertEqual(list(admitted['car_id'][:2]), [1, 2])
+        np.testing.assert_array_equal(admitted, expected_events[expected_events['kind'] == TraceEvent.ADMIT])
+
+    def test_many_waiting_cars(self):
+        """Множество одновременно ожидающих машин дает ту же статистику"""
+        cars_data = [(i * 0.01, i, Direction.LEFT_TO_RIGHT if i % 3 else Direction.RIGHT_TO_LEFT)
+                     for i in range(2000)]
+
+        bridge, scheduler = self.simulate(cars_data)
+
+        self.assertEqual(scheduler.get_completed_cars(), len(cars_data))
+        expected = EventDrivenBridge().simulate(cars_data)
+        self.assertAlmostEqual(bridge.get_statistics()['avg_waiting_time'],
+                               expected['avg_waiting_time'])
+
+if __name__ == '__main__':
+    unittest.main()
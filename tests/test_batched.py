@@ -0,0 +1,85 @@
+import random
+import unittest
+import numpy as np
+from src.models.direction import Direction
+from src.simulation.batched import BatchedBridgeSimulator, scenarios_to_arrays, simulate_scenarios
+from src.simulation.event_driven import EventDrivenBridge
+
+class TestBatchedBridgeSimulator(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(3)
+        self.scenarios = []
+        for _ in range(200):
+            count = rng.randint(0, 30)
+            self.scenarios.append([
+                (rng.randint(0, 40) / rng.choice([1, 2, 4]), car_id, rng.choice(list(Direction)))
+                for car_id in range(count)
+            ])
+
+    def assert_matches_event_driven(self, priority_direction):
+        stats = simulate_scenarios(self.scenarios, priority_direction)
+
+        for index, cars_data in enumerate(self.scenarios):
+            expected = EventDrivenBridge(priority_direction).simulate(list(cars_data))
+            self.assertEqual(stats['total_crossed'][index], expected['total_crossed'])
+            for key in ('avg_waiting_time', 'max_waiting_time', 'std_waiting_time'):
+                self.assertAlmostEqual(stats[key][index], expected[key], msg=f"scenario {index}: {key}")
+            for direction in Direction:
+                batched = stats['direction_stats'][direction.value]
+                reference = expected['direction_stats'][direction.value]
+                self.assertEqual(batched['total_crossed'][index], reference['total_crossed'])
+                self.assertAlmostEqual(batched['avg_waiting_time'][index], reference['avg_waiting_time'])
+
+    def test_matches_event_driven(self):
+        """Каждый сценарий пакета совпадает с EventDrivenBridge"""
+        self.assert_matches_event_driven(None)
+
+    def test_matches_event_driven_with_priority(self):
+        """Приоритетное направление учитывается так же"""
+        self.assert_matches_event_driven(Direction.LEFT_TO_RIGHT)
+        self.assert_matches_event_driven(Direction.RIGHT_TO_LEFT)
+
+    def test_per_car_crossing_times(self):
+        """Время проезда каждой машины из четвертого элемента"""
+        rng = random.Random(4)
+        self.scenarios = [
+            [car + (rng.choice([0.5, 1.0, 2.5]),) for car in cars_data] for cars_data in self.scenarios
+        ]
+        self.assert_matches_event_driven(None)
+
+        stats = simulate_scenarios(self.scenarios)
+        expected = EventDrivenBridge().simulate(self.scenarios[1])
+        self.assertAlmostEqual(stats['avg_crossing_time'][1], expected['avg_crossing_time'])
+
+    def test_exact_percentiles(self):
+        """Перцентили считаются точно по правилу ближайшего ранга"""
+        cars_data = [(0, car_id, Direction.LEFT_TO_RIGHT) for car_id in range(10)]
+
+        stats = simulate_scenarios([cars_data])
+
+        # Машины ждут 0, 1, ..., 9 секунд
+        self.assertEqual(stats['p50_waiting_time'][0], 4)
+        self.assertEqual(stats['p95_waiting_time'][0], 9)
+        self.assertEqual(stats['max_waiting_time'][0], 9)
+
+    def test_padding_and_empty_scenarios(self):
+        """Сценарии разной длины и пустые сценарии"""
+        arrival_times, directions, _ = scenarios_to_arrays([
+            [(0, 1, Direction.LEFT_TO_RIGHT), (0, 2, Direction.RIGHT_TO_LEFT)],
+            [],
+        ])
+        arrival_times[0, 0] = np.nan
+
+        stats = BatchedBridgeSimulator().simulate(arrival_times, directions)
+
+        self.assertEqual(stats['total_crossed'].tolist(), [1, 0])
+        self.assertEqual(stats['avg_crossing_time'].tolist(), [1.0, 0.0])
+        self.assertEqual(stats['max_waiting_time'].tolist(), [0.0, 0.0])
+
+    def test_shape_mismatch(self):
+        """Массивы разной формы отклоняются"""
+        with self.assertRaises(ValueError):
+            BatchedBridgeSimulator().simulate(np.zeros((2, 3)), np.zeros((2, 2), dtype=np.uint8))
+
+if __name__ == '__main__':
+    unittest.main()
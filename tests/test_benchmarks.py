@@ -0,0 +1,33 @@
+import unittest
+from benchmarks.run import compare, measure
+
+class TestBenchmarks(unittest.TestCase):
+    def test_compare_detects_regressions(self):
+        """Регрессией считается ухудшение больше порога в нужную сторону"""
+        baseline = {'single:100': {'cars_per_second': 1000.0, 'peak_rss_mb': 50.0, 'handoff_us': 10.0}}
+
+        faster = {'single:100': {'cars_per_second': 2000.0, 'peak_rss_mb': 40.0, 'handoff_us': 5.0}}
+        self.assertEqual(compare(faster, baseline, 0.25), [])
+
+        within = {'single:100': {'cars_per_second': 800.0, 'peak_rss_mb': 60.0, 'handoff_us': 12.0}}
+        self.assertEqual(compare(within, baseline, 0.25), [])
+
+        slower = {'single:100': {'cars_per_second': 700.0, 'peak_rss_mb': 70.0, 'handoff_us': 20.0}}
+        regressions = compare(slower, baseline, 0.25)
+        self.assertEqual(len(regressions), 3)
+        self.assertIn('cars_per_second', regressions[0])
+
+    def test_new_cases_are_not_regressions(self):
+        """Случаи, которых нет в базе, не сравниваются"""
+        results = {'event:100': {'cars_per_second': 1.0, 'peak_rss_mb': 1000.0}}
+        self.assertEqual(compare(results, {}, 0.25), [])
+
+    def test_measure(self):
+        """Измерение возвращает все метрики случая"""
+        result = measure('event', 100, repeat=1)
+        self.assertEqual(result['cars'], 100)
+        self.assertGreater(result['cars_per_second'], 0)
+        self.assertGreater(result['peak_rss_mb'], 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,6 +2,13 @@ import unittest
 from src.models.bridge import Bridge
 from src.models.direction import Direction
 from src.models.car import Car
+from src.simulation.event_driven import EventDrivenBridge
+from src.simulation.pool_scheduler import PooledCarScheduler
+from src.simulation.scheduler import CarScheduler
+from src.simulation.single_threaded import SingleThreadedBridge
+from src.utils.clock import VirtualClock
+from src.utils.trace import TraceEvent, TraceRecorder
+import random
 import threading
 import time
 import src.utils.logger as logger
@@ -22,6 +29,15 @@ class TestBridge(unittest.TestCase):
         self.assertEqual(self.bridge.cars_on_bridge, 0)
         self.assertGreaterEqual(car.crossing_time, 1.0)
         
+    def test_car_crossing_time_is_keyword(self):
+        """Время проезда передается только по имени"""
+        with self.assertRaises(TypeError):
+            Car(1, Direction.LEFT_TO_RIGHT, self.bridge, True)
+        car = Car(1, Direction.LEFT_TO_RIGHT, Bridge(clock=VirtualClock()), crossing_time=2.5)
+        car.start()
+        car.join()
+        self.assertEqual(car.crossing_time, 2.5)
+
     def test_opposite_direction_blocking(self):
         """Тест блокировки встречного движения"""
         car1 = Car(1, Direction.LEFT_TO_RIGHT, self.bridge)
@@ -163,5 +179,133 @@ class TestBridge(unittest.TestCase):
             2.0
         )
 
+    def test_handoff_follows_arrival_order(self):
+        """Мост передается машине, подъехавшей раньше"""
+        bridge = Bridge(clock=VirtualClock())
+        cars_data = [
+            (0, 1, Direction.LEFT_TO_RIGHT),
+            (0.2, 2, Direction.RIGHT_TO_LEFT),
+            (0.4, 3, Direction.LEFT_TO_RIGHT),
+        ]
+        scheduler = CarScheduler(cars_data, bridge)
+        scheduler.run()
+        self.assertTrue(scheduler.wait_completion(timeout=5.0))
+
+        waits = {car.car_id: car.waiting_time for car in scheduler.cars}
+        self.assertAlmostEqual(waits[2], 0.8)
+        self.assertAlmostEqual(waits[3], 1.6)
+        self.assertEqual(bridge.turns, {})
+
+    def test_synchronization_counters(self):
+        """Счетчики синхронизации попадают в статистику и отключаются при создании"""
+        cars_data = [(0, car_id, Direction.LEFT_TO_RIGHT if car_id % 2 else Direction.RIGHT_TO_LEFT)
+                     for car_id in range(10)]
+        bridge = Bridge(clock=VirtualClock())
+        scheduler = CarScheduler(cars_data, bridge)
+        scheduler.run()
+        self.assertTrue(scheduler.wait_completion(timeout=5.0))
+
+        sync = bridge.get_statistics()['synchronization']
+        # Каждая машина захватывает блокировку при въезде, при съезде
+        # и, если ждала, еще раз после пробуждения
+        self.assertGreaterEqual(sync['lock_acquisitions'], 20)
+        # Эстафета будит только ту машину, которой передан мост
+        self.assertEqual(sync['spurious_wakeups'], 0)
+        self.assertEqual(sync['wakeups'], 10 - 1)
+        self.assertEqual(sync['can_cross_evaluations'], 10)
+        # Мост передается после всех прибытий в момент 0: при въезде первой
+        # машины в очереди остаются девять
+        self.assertEqual(sync['max_queue_depth'], 9)
+
+        bridge = Bridge(clock=VirtualClock(), instrument=False)
+        scheduler = CarScheduler(cars_data[:2], bridge)
+        scheduler.run()
+        self.assertTrue(scheduler.wait_completion(timeout=5.0))
+        self.assertNotIn('synchronization', bridge.get_statistics())
+
+    def test_capacity_and_headway(self):
+        """Попутные машины делят мост, встречные ждут, пока он опустеет"""
+        cars_data = [(car_id * 0.3, car_id, Direction.LEFT_TO_RIGHT if car_id % 4 else Direction.RIGHT_TO_LEFT)
+                     for car_id in range(16)]
+        expected = SingleThreadedBridge(capacity=3, headway=0.2).simulate(cars_data)
+
+        bridge = Bridge(clock=VirtualClock(), capacity=3, headway=0.2)
+        scheduler = CarScheduler(cars_data, bridge)
+        scheduler.run()
+        self.assertTrue(scheduler.wait_completion(timeout=5.0))
+
+        stats = bridge.get_statistics()
+        self.assertEqual(stats['total_crossed'], 16)
+        self.assertAlmostEqual(stats['avg_waiting_time'], expected['avg_waiting_time'])
+        self.assertAlmostEqual(stats['throughput']['throughput_gain'], expected['throughput']['throughput_gain'])
+        self.assertGreater(stats['throughput']['throughput_gain'], 1.0)
+        self.assertEqual(bridge.cars_on_bridge, 0)
+
+        with self.assertRaises(ValueError):
+            Bridge(capacity=2, platoon_size=3)
+
+    def test_same_time_events_match_event_engine(self):
+        """Прибытия и съезды в один момент решаются как в событийном движке"""
+        def admissions(trace):
+            events = trace.events()
+            admits = events[events['kind'] == TraceEvent.ADMIT]
+            return list(zip(admits['time'].round(9).tolist(), admits['car_id'].tolist()))
+
+        def threaded(cars_data, scheduler_cls, **kwargs):
+            trace = TraceRecorder()
+            bridge = Bridge(Direction.RIGHT_TO_LEFT, clock=VirtualClock(), trace=trace, **kwargs)
+            scheduler = scheduler_cls(cars_data, bridge)
+            scheduler.run()
+            self.assertTrue(scheduler.wait_completion(timeout=10.0))
+            return admissions(trace)
+
+        # Машина приоритетного направления подъезжает ровно в момент съезда
+        cars_data = [
+            (0.0, 0, Direction.LEFT_TO_RIGHT, 1.0),
+            (0.5, 1, Direction.LEFT_TO_RIGHT, 1.0),
+            (1.0, 2, Direction.RIGHT_TO_LEFT, 1.0),
+        ]
+        self.assertEqual(threaded(cars_data, CarScheduler), [(0.0, 0), (1.0, 2), (2.0, 1)])
+
+        rng = random.Random(7)
+        for _ in range(5):
+            cars_data = sorted((rng.randint(0, 30) / 2, car_id, rng.choice(list(Direction)), rng.randint(1, 4) / 2)
+                               for car_id in range(30))
+            for capacity, headway in ((1, 0.0), (2, 0.5)):
+                trace = TraceRecorder()
+                EventDrivenBridge(Direction.RIGHT_TO_LEFT, trace=trace, capacity=capacity,
+                                  headway=headway).simulate(cars_data)
+                expected = admissions(trace)
+                for scheduler_cls in (CarScheduler, PooledCarScheduler):
+                    self.assertEqual(threaded(cars_data, scheduler_cls, capacity=capacity, headway=headway),
+                                     expected, (scheduler_cls.__name__, capacity, headway))
+
+    def test_platoon_admission(self):
+        """Колонна решает о направлении один раз и не превышает MAX_CONSECUTIVE"""
+        cars_data = [(0, car_id, Direction.LEFT_TO_RIGHT if car_id % 2 else Direction.RIGHT_TO_LEFT)
+                     for car_id in range(12)]
+        trace = TraceRecorder()
+        bridge = Bridge(clock=VirtualClock(), trace=trace, platoon_size=3)
+        scheduler = CarScheduler(cars_data, bridge)
+        scheduler.run()
+        self.assertTrue(scheduler.wait_completion(timeout=5.0))
+
+        stats = bridge.get_statistics()
+        self.assertEqual(stats['total_crossed'], 12)
+        self.assertLess(stats['synchronization']['can_cross_per_crossing'], 1.0)
+
+        events = trace.events()
+        admits = events[events['kind'] == TraceEvent.ADMIT]
+        departs = events[events['kind'] == TraceEvent.DEPART]
+        # Машины въезжают по одной, каждая следующая — после съезда предыдущей
+        self.assertTrue((admits['time'][1:] >= departs['time'][:-1]).all())
+        run = 1
+        for previous, current in zip(admits['direction'], admits['direction'][1:]):
+            run = run + 1 if current == previous else 1
+            self.assertLessEqual(run, bridge.MAX_CONSECUTIVE)
+
+        with self.assertRaises(ValueError):
+            Bridge(platoon_size=0)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
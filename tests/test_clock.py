@@ -0,0 +1,107 @@
+import threading
+import time
+import unittest
+from src.models.bridge import Bridge
+from src.models.car import Car
+from src.models.direction import Direction
+from src.simulation.scheduler import CarScheduler
+from src.utils.clock import VirtualClock
+
+class TestVirtualClock(unittest.TestCase):
+    def test_sleep_advances_time_instantly(self):
+        """Тест мгновенного сдвига виртуального времени"""
+        clock = VirtualClock()
+        clock.register()
+        started = time.time()
+        clock.sleep(100.0)
+        clock.unregister()
+
+        self.assertEqual(clock.now(), 100.0)
+        self.assertLess(time.time() - started, 1.0)
+
+    def test_time_waits_for_active_threads(self):
+        """Время не сдвигается, пока есть активный поток"""
+        clock = VirtualClock()
+        woke_at = []
+
+        def worker():
+            clock.sleep(5.0)
+            woke_at.append(clock.now())
+            clock.unregister()
+
+        # Регистрируем рабочий поток и основной до запуска
+        clock.register()
+        clock.register()
+        thread = threading.Thread(target=worker)
+        thread.start()
+
+        time.sleep(0.1)
+        # Основной поток еще активен, поэтому время стоит на месте
+        self.assertEqual(clock.now(), 0.0)
+        clock.sleep(1.0)
+        self.assertEqual(clock.now(), 1.0)
+        clock.unregister()
+        thread.join()
+
+        self.assertEqual(woke_at, [5.0])
+
+    def test_settle_runs_after_same_time_sleepers(self):
+        """settle() возвращается только после всех, кто спит до того же момента"""
+        clock = VirtualClock()
+        order = []
+
+        def settler():
+            clock.sleep(1.0)
+            clock.settle()
+            order.append(('settled', clock.now()))
+            clock.unregister()
+
+        def sleeper():
+            clock.sleep(1.0)
+            clock.sleep(0.0)
+            order.append(('slept', clock.now()))
+            clock.unregister()
+
+        clock.register()
+        clock.register()
+        threads = [threading.Thread(target=settler), threading.Thread(target=sleeper)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(order, [('slept', 1.0), ('settled', 1.0)])
+
+    def test_bridge_with_virtual_clock(self):
+        """Тест многопоточного моста на виртуальных часах"""
+        bridge = Bridge(clock=VirtualClock())
+        car = Car(1, Direction.LEFT_TO_RIGHT, bridge)
+        car.start()
+        car.join()
+
+        self.assertTrue(car.crossed)
+        self.assertEqual(car.crossing_time, 1.0)
+        self.assertEqual(car.waiting_time, 0.0)
+
+    def test_scheduler_replay_is_exact(self):
+        """Планировщик на виртуальных часах дает точное время ожидания"""
+        cars_data = [
+            (0, 1, Direction.LEFT_TO_RIGHT),
+            (0, 2, Direction.LEFT_TO_RIGHT),
+            (5, 3, Direction.RIGHT_TO_LEFT),
+            (5.5, 4, Direction.RIGHT_TO_LEFT),
+        ]
+        bridge = Bridge(clock=VirtualClock())
+        scheduler = CarScheduler(cars_data, bridge)
+
+        started = time.time()
+        scheduler.run()
+        self.assertTrue(scheduler.wait_completion(timeout=5.0))
+
+        waits = {car.car_id: car.waiting_time for car in scheduler.cars}
+        self.assertEqual(waits, {1: 0.0, 2: 1.0, 3: 0.0, 4: 0.5})
+        self.assertEqual(bridge.get_statistics()['total_crossed'], 4)
+        self.assertLess(time.time() - started, 2.0)
+
+if __name__ == '__main__':
+    unittest.main()
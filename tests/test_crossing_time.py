@@ -0,0 +1,94 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+from src.models.bridge import Bridge
+from src.models.direction import Direction
+from src.simulation.event_driven import EventDrivenBridge
+from src.simulation.scheduler import CarScheduler
+from src.simulation.single_threaded import SingleThreadedBridge
+from src.utils.clock import VirtualClock
+from src.utils.crossing_time import (
+    CrossingTimeSampler, Deterministic, Empirical, Exponential, LogNormal,
+    assign_crossing_times, parse_distribution
+)
+from src.utils.input_reader import InputReader
+
+class TestCrossingTime(unittest.TestCase):
+    def test_distribution_means(self):
+        """Средние значения распределений совпадают с заданными"""
+        rng = np.random.default_rng(1)
+        self.assertTrue(np.all(Deterministic(1.5).sample(rng, 10) == 1.5))
+        self.assertAlmostEqual(Exponential(2.0).sample(rng, 200_000).mean(), 2.0, places=1)
+        self.assertAlmostEqual(LogNormal(2.0, 0.5).sample(rng, 200_000).mean(), 2.0, places=1)
+        self.assertTrue(set(Empirical([1.0, 3.0]).sample(rng, 100)) <= {1.0, 3.0})
+
+    def test_parse_distribution(self):
+        """Разбор описания распределения из командной строки"""
+        self.assertEqual(parse_distribution('deterministic:2').value, 2.0)
+        lognormal = parse_distribution('lognormal:1.5,0.25')
+        self.assertEqual((lognormal.mean, lognormal.sigma), (1.5, 0.25))
+
+        with tempfile.NamedTemporaryFile('w', suffix='.txt', delete=False) as f:
+            f.write("crossing_time\n0.5\n1.5\n\n")
+        try:
+            self.assertEqual(parse_distribution(f'empirical:{f.name}').values.tolist(), [0.5, 1.5])
+        finally:
+            os.unlink(f.name)
+
+        with self.assertRaises(ValueError):
+            parse_distribution('uniform:1')
+        with self.assertRaises(ValueError):
+            parse_distribution('exponential:-1')
+
+    def test_sampler_is_reproducible(self):
+        """Одинаковое зерно дает одинаковые значения, пачки идут подряд"""
+        first = CrossingTimeSampler(Exponential(), seed=42, batch_size=16)
+        second = CrossingTimeSampler(Exponential(), seed=42, batch_size=16)
+        values = [next(first) for _ in range(40)]
+
+        self.assertEqual(values, [next(second) for _ in range(40)])
+        self.assertEqual(len(set(values)), 40)
+
+    def test_input_column_overrides_sampler(self):
+        """Время из входных данных сохраняется, остальным машинам оно генерируется"""
+        cars_data = [(0.0, 1, Direction.LEFT_TO_RIGHT, 3.0), (1.0, 2, Direction.RIGHT_TO_LEFT)]
+
+        assigned = list(assign_crossing_times(cars_data, CrossingTimeSampler(Deterministic(2.0))))
+
+        self.assertEqual([car[3] for car in assigned], [3.0, 2.0])
+
+    def test_input_reader_crossing_column(self):
+        """Необязательная четвертая колонка входного файла"""
+        with tempfile.NamedTemporaryFile('w', suffix='.csv', delete=False) as f:
+            f.write("arrival_time,car_id,direction,crossing_time\n")
+            f.write("0,1,left_to_right,2.5\n1,2,right_to_left,\n")
+        try:
+            cars_data = InputReader.read_cars_data(f.name)
+        finally:
+            os.unlink(f.name)
+
+        self.assertEqual(cars_data, [(0.0, 1, Direction.LEFT_TO_RIGHT, 2.5), (1.0, 2, Direction.RIGHT_TO_LEFT)])
+
+    def test_engines_use_per_car_crossing_time(self):
+        """Все движки учитывают время проезда каждой машины"""
+        cars_data = [
+            (0.0, 1, Direction.LEFT_TO_RIGHT, 3.0),
+            (0.0, 2, Direction.LEFT_TO_RIGHT, 1.0),
+            (0.0, 3, Direction.RIGHT_TO_LEFT),
+        ]
+
+        bridge = Bridge(clock=VirtualClock())
+        scheduler = CarScheduler(cars_data, bridge)
+        scheduler.run()
+        self.assertTrue(scheduler.wait_completion(timeout=10.0))
+
+        for stats in (SingleThreadedBridge().simulate(cars_data),
+                      EventDrivenBridge().simulate(cars_data),
+                      bridge.get_statistics()):
+            self.assertAlmostEqual(stats['avg_crossing_time'], 5.0 / 3)
+            # Машины ждут 0, 3 и 4 секунды
+            self.assertAlmostEqual(stats['avg_waiting_time'], 7.0 / 3)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,135 @@
+import unittest
+from src.models.policy import POLICIES
+from src.simulation.event_driven import EventDrivenBridge
+from src.simulation.single_threaded import SingleThreadedBridge
+from src.models.direction import Direction
+
+class TestEventDrivenBridge(unittest.TestCase):
+    def setUp(self):
+        self.bridge = EventDrivenBridge()
+
+    def test_basic_simulation(self):
+        """Тест базового сценария"""
+        cars_data = [
+            (0, 1, Direction.LEFT_TO_RIGHT),
+            (0, 2, Direction.RIGHT_TO_LEFT),
+            (2, 3, Direction.LEFT_TO_RIGHT)
+        ]
+
+        stats = self.bridge.simulate(cars_data)
+
+        self.assertEqual(stats['total_crossed'], 3)
+        self.assertEqual(stats['avg_crossing_time'], 1.0)
+        self.assertEqual(stats['max_waiting_time'], 1.0)
+
+    def test_future_arrivals_are_not_chosen(self):
+        """Машина, которая еще не подъехала, не может занять мост"""
+        cars_data = [
+            (0, 1, Direction.LEFT_TO_RIGHT),
+            (0.5, 2, Direction.RIGHT_TO_LEFT),
+            (10, 3, Direction.LEFT_TO_RIGHT)
+        ]
+
+        stats = self.bridge.simulate(cars_data)
+
+        # Машина 2 ждет только окончания проезда машины 1,
+        # машина 3 приезжает на пустой мост
+        self.assertAlmostEqual(stats['avg_waiting_time'], 0.5 / 3)
+        self.assertEqual(self.bridge.current_time, 11)
+
+    def test_lazy_iterator_input(self):
+        """Тест чтения машин из ленивого итератора"""
+        cars_data = ((float(i), i, Direction.LEFT_TO_RIGHT) for i in range(1000))
+
+        stats = self.bridge.simulate(cars_data)
+
+        self.assertEqual(stats['total_crossed'], 1000)
+        self.assertEqual(stats['max_waiting_time'], 0)
+
+    def test_unsorted_input(self):
+        """Неотсортированный список сортируется, итератор отклоняется"""
+        cars_data = [
+            (5, 1, Direction.LEFT_TO_RIGHT),
+            (0, 2, Direction.RIGHT_TO_LEFT)
+        ]
+
+        stats = self.bridge.simulate(cars_data)
+        self.assertEqual(stats['max_waiting_time'], 0)
+
+        with self.assertRaises(ValueError):
+            EventDrivenBridge().simulate(iter(cars_data))
+
+    def test_empty_input(self):
+        """Тест пустых входных данных"""
+        stats = self.bridge.simulate([])
+
+        self.assertEqual(stats['total_crossed'], 0)
+        self.assertEqual(stats['avg_waiting_time'], 0)
+
+    def test_online_feed_matches_simulate(self):
+        """Прибытия, поданные по одному, дают ту же статистику, что и simulate"""
+        cars_data = [(i * 0.4 - i % 3 * 0.1, i, Direction.LEFT_TO_RIGHT if i % 3 else Direction.RIGHT_TO_LEFT,
+                      0.5 + i % 2) for i in range(300)]
+        cars_data.sort()
+        for name, policy_cls in POLICIES.items():
+            expected = EventDrivenBridge(Direction.LEFT_TO_RIGHT, policy=policy_cls()).simulate(cars_data)
+
+            bridge = EventDrivenBridge(Direction.LEFT_TO_RIGHT, policy=policy_cls())
+            for car in cars_data:
+                bridge.submit(*car)
+                bridge.advance_to(car[0])
+            bridge.advance_to(float('inf'))
+            self.assertEqual(bridge.get_statistics(), expected, name)
+
+    def test_snapshot_projects_queued_waits(self):
+        """Прогноз ожидания совпадает с фактическим, если новых машин нет"""
+        for car_id in range(6):
+            self.bridge.submit(0.0, car_id, Direction.LEFT_TO_RIGHT if car_id % 2 else Direction.RIGHT_TO_LEFT)
+        self.assertEqual(self.bridge.advance_to(1.5), 7)
+
+        snapshot = self.bridge.snapshot_stats()
+        self.assertEqual(snapshot['total_crossed'], 1)
+        self.assertTrue(snapshot['bridge_busy'])
+        self.assertEqual(sum(snapshot['queue_lengths'].values()), 4)
+        self.assertEqual(snapshot['projected_max_waiting_time'], 5.0)
+
+        self.bridge.advance_to(10.0)
+        self.assertEqual(self.bridge.get_statistics()['max_waiting_time'], 5.0)
+        self.assertEqual(self.bridge.snapshot_stats()['projected_waits'], {})
+
+        with self.assertRaises(ValueError):
+            self.bridge.submit(5.0, 6, Direction.LEFT_TO_RIGHT)
+
+    def test_submit_at_decided_time_is_rejected(self):
+        """После advance_to(t) решения в момент t окончательны"""
+        self.bridge.submit(0.0, 0, Direction.LEFT_TO_RIGHT)
+        self.bridge.advance_to(0.0)
+        with self.assertRaises(ValueError):
+            self.bridge.submit(0.0, 1, Direction.RIGHT_TO_LEFT)
+
+        self.bridge.advance_to(2.0)
+        with self.assertRaises(ValueError):
+            self.bridge.submit(2.0, 1, Direction.RIGHT_TO_LEFT)
+        self.bridge.submit(2.5, 1, Direction.RIGHT_TO_LEFT)
+        self.bridge.advance_to(float('inf'))
+        self.assertEqual(self.bridge.get_statistics()['total_crossed'], 2)
+
+    def test_capacity_matches_single_threaded(self):
+        """С емкостью и headway решения совпадают с однопоточным движком"""
+        cars_data = [(i * 0.4 - i % 3 * 0.1, i, Direction.LEFT_TO_RIGHT if i % 3 else Direction.RIGHT_TO_LEFT,
+                      0.5 + i % 2) for i in range(300)]
+        cars_data.sort()
+        for capacity, headway in ((3, 0.0), (3, 0.3), (2, 1.5)):
+            for name, policy_cls in POLICIES.items():
+                expected = SingleThreadedBridge(policy=policy_cls(), capacity=capacity,
+                                                headway=headway).simulate(cars_data)
+                stats = EventDrivenBridge(policy=policy_cls(), capacity=capacity,
+                                          headway=headway).simulate(cars_data)
+                # Проезды учитываются в другом порядке, поэтому суммы сравниваются приближенно
+                for key in ('avg_waiting_time', 'max_waiting_time', 'p95_waiting_time'):
+                    self.assertAlmostEqual(stats[key], expected[key], msg=(capacity, headway, name))
+                self.assertAlmostEqual(stats['throughput']['busy_time'], expected['throughput']['busy_time'])
+                self.assertGreaterEqual(stats['throughput']['throughput_gain'], 1.0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+import os
+import random
+import tempfile
+import unittest
+from src.models.direction import Direction
+from src.utils.input_reader import InputReader, ensure_sorted
+
+class TestInputReader(unittest.TestCase):
+    def setUp(self):
+        self.test_file = tempfile.NamedTemporaryFile(delete=False)
+        self.test_file.close()
+
+    def tearDown(self):
+        os.unlink(self.test_file.name)
+
+    def create_test_input(self, data):
+        """Создает тестовый входной файл с заголовком"""
+        with open(self.test_file.name, 'w') as f:
+            f.write("arrival_time,car_id,direction\n")
+            for arrival_time, car_id, direction in data:
+                f.write(f"{arrival_time},{car_id},{direction.value}\n")
+
+    def test_sorted_file_is_streamed(self):
+        """Отсортированный файл читается потоком"""
+        data = [(float(i), i, Direction.LEFT_TO_RIGHT) for i in range(10)]
+        self.create_test_input(data)
+
+        self.assertTrue(InputReader.is_sorted(self.test_file.name))
+        self.assertEqual(list(InputReader.iter_cars_data(self.test_file.name)), data)
+
+        # При равном времени порядок задает номер машины
+        self.create_test_input([(1.0, 2, Direction.LEFT_TO_RIGHT), (1.0, 1, Direction.RIGHT_TO_LEFT)])
+        self.assertFalse(InputReader.is_sorted(self.test_file.name))
+
+    def test_external_sort(self):
+        """Неотсортированный файл сортируется кусками и сливается"""
+        random.seed(42)
+        data = [(round(random.uniform(0, 100), 3), i, random.choice(list(Direction)))
+                for i in range(500)]
+        self.create_test_input(data)
+        temp_dir = tempfile.gettempdir()
+        files_before = set(os.listdir(temp_dir))
+
+        self.assertFalse(InputReader.is_sorted(self.test_file.name))
+        result = list(InputReader.iter_cars_data(self.test_file.name, chunk_size=64))
+
+        self.assertEqual(result, sorted(data, key=lambda car: (car[0], car[1])))
+        # Временные куски удалены после чтения
+        self.assertEqual(set(os.listdir(temp_dir)) - files_before, set())
+
+    def test_ensure_sorted(self):
+        """Отсортированная последовательность возвращается без копирования"""
+        data = [(0, 1, Direction.LEFT_TO_RIGHT), (1, 2, Direction.RIGHT_TO_LEFT)]
+
+        self.assertIs(ensure_sorted(data), data)
+        self.assertEqual(ensure_sorted(data[::-1]), data)
+        with self.assertRaises(ValueError):
+            list(ensure_sorted(iter(data[::-1])))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+import io
+import logging
+import queue
+import unittest
+from src.utils.logger import (
+    LazyQueueHandler, car_log_enabled, configure_logging, get_car_logger, get_logger, shutdown_logging
+)
+
+class TestLogger(unittest.TestCase):
+    def setUp(self):
+        self.stream = io.StringIO()
+        self.logger = get_logger('tests.logger')
+        self.car_logger = get_car_logger('tests.logger')
+
+    def tearDown(self):
+        configure_logging()
+
+    def test_queue_mode_writes_everything_in_order(self):
+        """Фоновый поток пишет все записи в порядке поступления"""
+        configure_logging(use_queue=True, stream=self.stream, batch_size=7)
+        for car_id in range(100):
+            self.car_logger.info("Car %d approaching bridge", car_id)
+        shutdown_logging()
+
+        lines = self.stream.getvalue().splitlines()
+        self.assertEqual(len(lines), 100)
+        self.assertTrue(lines[42].endswith("Car 42 approaching bridge"))
+
+    def test_records_are_formatted_by_listener(self):
+        """В очередь попадает запись с аргументами, а не готовая строка"""
+        records = queue.SimpleQueue()
+        handler = LazyQueueHandler(records)
+        record = handler.prepare(self.logger.makeRecord('x', logging.INFO, __file__, 1, "Car %d", (7,), None))
+        self.assertEqual(record.args, (7,))
+        self.assertEqual(record.getMessage(), "Car 7")
+
+    def test_car_sampling_and_level(self):
+        """Сообщения о машинах фильтруются по выборке и по своему уровню"""
+        configure_logging(car_sample_every=10, stream=self.stream)
+        self.assertTrue(car_log_enabled(self.car_logger, 20))
+        self.assertFalse(car_log_enabled(self.car_logger, 21))
+
+        configure_logging(car_level=logging.WARNING, stream=self.stream)
+        self.assertFalse(car_log_enabled(self.car_logger, 20))
+        # Остальные сообщения уровнем сообщений о машинах не затрагиваются
+        self.logger.info("Simulation started")
+        self.assertIn("Simulation started", self.stream.getvalue())
+
+    def test_invalid_sampling(self):
+        with self.assertRaises(ValueError):
+            configure_logging(car_sample_every=0)
+
+if __name__ == '__main__':
+    unittest.main()
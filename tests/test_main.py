@@ -0,0 +1,57 @@
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+import main
+from src.models.direction import Direction
+from src.simulation.pool_scheduler import PooledCarScheduler
+from src.simulation.scheduler import CarScheduler
+from src.utils.logger import configure_logging
+
+class TestMain(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache_dir = os.path.join(self.temp_dir.name, 'cache')
+        self.input_file = os.path.join(self.temp_dir.name, 'input.csv')
+        with open(self.input_file, 'w') as f:
+            f.write("arrival_time,car_id,direction\n")
+            for car_id in range(6):
+                direction = Direction.LEFT_TO_RIGHT if car_id % 2 else Direction.RIGHT_TO_LEFT
+                f.write(f"{car_id * 0.5},{car_id},{direction.value}\n")
+        # main() настраивает логирование под себя
+        self.addCleanup(configure_logging)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def run_main(self, mode):
+        argv = ['main.py', '--input-file', self.input_file, '--mode', mode, '--clock', 'virtual',
+                '--cache-dir', self.cache_dir, '--car-log-level', 'warning']
+        with mock.patch.object(sys, 'argv', argv):
+            main.main()
+
+    def cached_entries(self):
+        return os.listdir(self.cache_dir) if os.path.isdir(self.cache_dir) else []
+
+    def test_timed_out_run_is_not_cached(self):
+        """Неполная статистика после таймаута не попадает в кэш"""
+        for scheduler_cls, mode in ((CarScheduler, 'multi'), (PooledCarScheduler, 'pool')):
+            wait_completion = scheduler_cls.wait_completion
+
+            def timed_out(scheduler, timeout=None):
+                wait_completion(scheduler, timeout)
+                return False
+
+            with mock.patch.object(scheduler_cls, 'wait_completion', timed_out):
+                self.run_main(mode)
+            self.assertEqual(self.cached_entries(), [], mode)
+
+            # Следующий прогон с теми же параметрами считается заново и кэшируется
+            self.run_main(mode)
+            self.assertEqual(len(self.cached_entries()), 1, mode)
+            for entry in self.cached_entries():
+                os.unlink(os.path.join(self.cache_dir, entry))
+
+if __name__ == '__main__':
+    unittest.main()
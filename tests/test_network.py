@@ -0,0 +1,77 @@
+import random
+import unittest
+from src.models.direction import Direction
+from src.models.network import BridgeNetwork, chain_route
+from src.simulation.event_driven import EventDrivenBridge
+from src.simulation.network import NetworkEventSimulator
+from src.simulation.scheduler import CarScheduler
+from src.utils.clock import VirtualClock
+
+class TestNetwork(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(5)
+        arrival_time = 0.0
+        self.cars_data = []
+        for car_id in range(200):
+            arrival_time += rng.expovariate(1.2)
+            self.cars_data.append((arrival_time, car_id, rng.choice(list(Direction))))
+
+    def test_chain_route(self):
+        """Цепочка проходится в порядке направления движения"""
+        self.assertEqual(chain_route(['A', 'B', 'C'], Direction.LEFT_TO_RIGHT), ['A', 'B', 'C'])
+        self.assertEqual(chain_route(['A', 'B', 'C'], Direction.RIGHT_TO_LEFT), ['C', 'B', 'A'])
+
+    def test_single_bridge_matches_event_driven(self):
+        """Сеть из одного моста ведет себя как EventDrivenBridge"""
+        expected = EventDrivenBridge().simulate(self.cars_data)
+
+        stats = NetworkEventSimulator(['A']).simulate(self.cars_data)
+
+        self.assertEqual(stats['total_trips'], 200)
+        self.assertAlmostEqual(stats['bridges']['A']['avg_waiting_time'], expected['avg_waiting_time'])
+        self.assertAlmostEqual(stats['avg_trip_waiting_time'], expected['avg_waiting_time'])
+
+    def test_chain_without_contention(self):
+        """Без встречных машин время в пути — проезды плюс переезды между мостами"""
+        cars_data = [(car_id * 10.0, car_id, Direction.LEFT_TO_RIGHT) for car_id in range(5)]
+
+        stats = NetworkEventSimulator(['A', 'B', 'C'], travel_time=2.0).simulate(cars_data)
+
+        self.assertEqual(stats['total_trips'], 5)
+        self.assertEqual(stats['avg_trip_time'], 3 * 1.0 + 2 * 2.0)
+        self.assertEqual(stats['max_trip_waiting_time'], 0)
+        for bridge_stats in stats['bridges'].values():
+            self.assertEqual(bridge_stats['total_crossed'], 5)
+
+    def test_custom_routes(self):
+        """Маршруты из входных данных и из routes"""
+        cars_data = [
+            (0.0, 1, Direction.LEFT_TO_RIGHT, ['B']),
+            (0.0, 2, Direction.LEFT_TO_RIGHT),
+            (0.0, 3, Direction.RIGHT_TO_LEFT),
+        ]
+        simulator = NetworkEventSimulator(['A', 'B', 'C'], routes={2: ['A', 'C']})
+
+        stats = simulator.simulate(cars_data)
+
+        self.assertEqual(stats['total_trips'], 3)
+        crossed = {bridge_id: bridge_stats['total_crossed'] for bridge_id, bridge_stats in stats['bridges'].items()}
+        self.assertEqual(crossed, {'A': 2, 'B': 2, 'C': 2})
+
+    def test_threaded_network(self):
+        """Машины-потоки проезжают цепочку мостов, у каждого моста своя блокировка"""
+        network = BridgeNetwork(['A', 'B'], clock=VirtualClock(), travel_time=1.0)
+        scheduler = CarScheduler(self.cars_data[:50], network)
+
+        scheduler.run()
+        self.assertTrue(scheduler.wait_completion(timeout=30.0))
+
+        stats = network.get_statistics()
+        self.assertEqual(stats['total_trips'], 50)
+        self.assertGreaterEqual(stats['avg_trip_time'], 3.0)
+        self.assertEqual(stats['bridges']['A']['total_crossed'], 50)
+        self.assertEqual(stats['bridges']['B']['total_crossed'], 50)
+        self.assertIsNot(network.bridges['A'].lock, network.bridges['B'].lock)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+import json
+import os
+import tempfile
+import threading
+import unittest
+from src.utils.performance import Profiler
+
+class TestProfiler(unittest.TestCase):
+    def setUp(self):
+        self.profiler = Profiler(enabled=True)
+
+    def test_nested_spans_build_call_tree(self):
+        """Вложенные участки образуют дерево, декоратор не меняет результат"""
+        @self.profiler.profiled('inner')
+        def inner(value):
+            return value * 2
+
+        with self.profiler.span('outer'):
+            results = [inner(value) for value in range(3)]
+
+        self.assertEqual(results, [0, 2, 4])
+        [root] = self.profiler.call_tree()
+        self.assertEqual(root['name'], 'outer')
+        self.assertEqual(root['count'], 1)
+        [child] = root['children']
+        self.assertEqual((child['name'], child['count']), ('inner', 3))
+        self.assertEqual(root['self_ns'], root['total_ns'] - child['total_ns'])
+
+    def test_threads_have_separate_stacks(self):
+        """Участки разных потоков не вкладываются друг в друга"""
+        barrier = threading.Barrier(4)
+
+        def work():
+            with self.profiler.span('car'):
+                barrier.wait()
+                with self.profiler.span('cross'):
+                    pass
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(self.profiler.collect().keys(), {('car',), ('car', 'cross')})
+        self.assertEqual(self.profiler.collect()[('car', 'cross')][0], 4)
+
+    def test_sampling_and_disabled(self):
+        """В выборку попадает каждый N-й корневой участок вместе с вложенными"""
+        profiler = Profiler(enabled=True, sample_every=5)
+        for _ in range(20):
+            with profiler.span('car'):
+                with profiler.span('cross'):
+                    pass
+        stats = profiler.collect()
+        self.assertEqual(stats[('car',)][0], 4)
+        self.assertEqual(stats[('car', 'cross')][0], 4)
+
+        profiler.disable()
+        func = lambda: 1
+        self.assertIs(profiler.wrap(func), func)
+        with profiler.span('car'):
+            pass
+        self.assertEqual(profiler.collect()[('car',)][0], 4)
+
+    def test_export(self):
+        """Свернутые стеки и профиль speedscope"""
+        with self.profiler.span('simulate'):
+            with self.profiler.span('choose'):
+                pass
+        self.assertTrue(self.profiler.folded()[-1].startswith('simulate;choose '))
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'profile.json')
+            self.profiler.export(path)
+            with open(path) as file:
+                profile = json.load(file)
+        names = [frame['name'] for frame in profile['shared']['frames']]
+        self.assertEqual(names, ['simulate', 'choose'])
+        self.assertIn([0, 1], profile['profiles'][0]['samples'])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+import random
+import unittest
+from src.models.bridge import Bridge
+from src.models.direction import Direction
+from src.models.policy import (
+    POLICIES, FIFOPolicy, LongestQueueFirstPolicy, StrictPriorityPolicy, get_policy
+)
+from src.simulation.batched import simulate_scenarios
+from src.simulation.event_driven import EventDrivenBridge
+from src.simulation.scheduler import CarScheduler
+from src.simulation.single_threaded import SingleThreadedBridge
+from src.utils.clock import VirtualClock
+
+LEFT = Direction.LEFT_TO_RIGHT
+RIGHT = Direction.RIGHT_TO_LEFT
+
+class TestSchedulingPolicies(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(5)
+        self.scenarios = []
+        for _ in range(50):
+            count = rng.randint(0, 25)
+            self.scenarios.append([
+                (rng.randint(0, 30) / rng.choice([1, 2]), car_id, rng.choice(list(Direction)))
+                for car_id in range(count)
+            ])
+
+    def assert_same_stats(self, actual, expected, msg):
+        self.assertEqual(actual['total_crossed'], expected['total_crossed'], msg)
+        for key in ('avg_waiting_time', 'max_waiting_time'):
+            self.assertAlmostEqual(actual[key], expected[key], msg=f"{msg}: {key}")
+        for direction in Direction:
+            self.assertAlmostEqual(actual['direction_stats'][direction.value]['avg_waiting_time'],
+                                   expected['direction_stats'][direction.value]['avg_waiting_time'], msg=msg)
+
+    def test_engines_agree(self):
+        """Однопоточный, событийный и пакетный движки дают одно и то же при любой политике"""
+        for name in POLICIES:
+            for priority in (None, LEFT):
+                batched = simulate_scenarios(self.scenarios, priority, policy=get_policy(name))
+                for index, cars_data in enumerate(self.scenarios):
+                    msg = f"{name}, priority {priority}, scenario {index}"
+                    expected = EventDrivenBridge(priority, policy=get_policy(name)).simulate(cars_data)
+                    single = SingleThreadedBridge(priority, policy=get_policy(name)).simulate(cars_data)
+                    self.assert_same_stats(single, expected, msg)
+                    self.assertEqual(batched['total_crossed'][index], expected['total_crossed'], msg)
+                    self.assertAlmostEqual(batched['avg_waiting_time'][index], expected['avg_waiting_time'], msg=msg)
+                    self.assertAlmostEqual(batched['max_waiting_time'][index], expected['max_waiting_time'], msg=msg)
+
+    def test_threaded_bridge_matches_event_driven(self):
+        """Многопоточный мост на виртуальных часах принимает те же решения"""
+        rng = random.Random(11)
+        # Разные нецелые моменты прибытия: ни одна машина не подъезжает
+        # одновременно с другой или с освобождением моста
+        times = sorted(rng.sample(range(1, 4000), 40))
+        cars_data = [(t / 97, car_id, rng.choice(list(Direction))) for car_id, t in enumerate(times)]
+        for name in POLICIES:
+            bridge = Bridge(RIGHT, clock=VirtualClock(), policy=get_policy(name))
+            scheduler = CarScheduler(cars_data, bridge)
+            scheduler.run()
+            self.assertTrue(scheduler.wait_completion(timeout=30.0))
+
+            expected = EventDrivenBridge(RIGHT, policy=get_policy(name)).simulate(cars_data)
+            self.assert_same_stats(bridge.get_statistics(), expected, name)
+
+    def test_fifo_ignores_max_consecutive(self):
+        """FIFO пропускает машины строго в порядке прибытия"""
+        cars_data = [(0.0, 0, LEFT), (0.1, 1, LEFT), (0.2, 2, LEFT), (0.3, 3, LEFT), (0.4, 4, RIGHT)]
+        stats = SingleThreadedBridge(policy=FIFOPolicy()).simulate(cars_data)
+        # Встречная машина пропускает всех четырех, хотя лимит равен трем
+        self.assertAlmostEqual(stats['direction_stats'][RIGHT.value]['max_waiting_time'], 3.6)
+
+    def test_strict_priority_never_yields(self):
+        """При строгом приоритете встречные ждут, пока приоритетная очередь не опустеет"""
+        cars_data = [(0.0, 0, RIGHT)] + [(0.0, car_id, LEFT) for car_id in range(1, 6)]
+        stats = EventDrivenBridge(LEFT, policy=StrictPriorityPolicy()).simulate(cars_data)
+        self.assertAlmostEqual(stats['direction_stats'][RIGHT.value]['max_waiting_time'], 5.0)
+
+    def test_longest_queue_first(self):
+        """Мост получает более длинная очередь, даже если ее машины подъехали позже"""
+        cars_data = [(0.0, 0, LEFT), (0.0, 1, RIGHT), (0.5, 2, RIGHT), (0.5, 3, LEFT), (0.6, 4, RIGHT)]
+        stats = EventDrivenBridge(policy=LongestQueueFirstPolicy()).simulate(cars_data)
+        # После первой машины справа ждут двое, слева один — едут правые
+        self.assertAlmostEqual(stats['direction_stats'][LEFT.value]['max_waiting_time'], 2.5)
+
+    def test_unknown_policy(self):
+        with self.assertRaises(ValueError):
+            get_policy('round_robin')
+
+if __name__ == '__main__':
+    unittest.main()
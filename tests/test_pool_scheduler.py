@@ -0,0 +1,68 @@
+import unittest
+from src.models.bridge import Bridge
+from src.models.direction import Direction
+from src.simulation.pool_scheduler import PooledCarScheduler
+from src.simulation.scheduler import CarScheduler
+from src.utils.clock import VirtualClock
+
+class TestPooledCarScheduler(unittest.TestCase):
+    def test_all_cars_cross_with_small_pool(self):
+        """Все машины проезжают даже при двух обработчиках"""
+        cars_data = [(i * 0.1, i, Direction(d)) for i, d in
+                     enumerate(['left_to_right', 'right_to_left'] * 10)]
+        bridge = Bridge(clock=VirtualClock())
+        scheduler = PooledCarScheduler(cars_data, bridge, max_workers=2)
+
+        scheduler.run()
+
+        self.assertTrue(scheduler.wait_completion(timeout=10.0))
+        self.assertEqual(scheduler.get_completed_cars(), len(cars_data))
+        self.assertEqual(bridge.get_statistics()['total_crossed'], len(cars_data))
+        self.assertLessEqual(len(scheduler.executor._threads), 2)
+
+    def test_waiting_time_counts_from_arrival(self):
+        """Время ожидания в очереди пула входит в статистику"""
+        cars_data = [
+            (0, 1, Direction.LEFT_TO_RIGHT),
+            (0, 2, Direction.LEFT_TO_RIGHT),
+            (0, 3, Direction.LEFT_TO_RIGHT),
+        ]
+        bridge = Bridge(clock=VirtualClock())
+        scheduler = PooledCarScheduler(cars_data, bridge, max_workers=1)
+
+        scheduler.run()
+        self.assertTrue(scheduler.wait_completion(timeout=10.0))
+
+        waits = {result.car_id: result.waiting_time for result in scheduler.results}
+        self.assertEqual(waits, {1: 0.0, 2: 1.0, 3: 2.0})
+
+    def test_policy_sees_cars_without_worker(self):
+        """Машины ждут в очереди моста, поэтому приоритет работает и при малом пуле"""
+        cars_data = ([(0.0, i, Direction.LEFT_TO_RIGHT) for i in range(6)] +
+                     [(0.5, i, Direction.RIGHT_TO_LEFT) for i in range(6, 12)])
+
+        def direction_waits(bridge):
+            return {direction: stats['avg_waiting_time']
+                    for direction, stats in bridge.get_statistics()['direction_stats'].items()}
+
+        bridge = Bridge(Direction.RIGHT_TO_LEFT, clock=VirtualClock())
+        scheduler = CarScheduler(cars_data, bridge)
+        scheduler.run()
+        self.assertTrue(scheduler.wait_completion(timeout=10.0))
+        expected = direction_waits(bridge)
+
+        for workers in (1, 2):
+            bridge = Bridge(Direction.RIGHT_TO_LEFT, clock=VirtualClock())
+            scheduler = PooledCarScheduler(cars_data, bridge, max_workers=workers)
+            scheduler.run()
+            self.assertTrue(scheduler.wait_completion(timeout=10.0))
+            self.assertEqual(direction_waits(bridge), expected, workers)
+        self.assertEqual(expected['right_to_left'], 3.5)
+
+    def test_invalid_pool_size(self):
+        """Пул без обработчиков недопустим"""
+        with self.assertRaises(ValueError):
+            PooledCarScheduler([], Bridge(), max_workers=0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+import os
+import tempfile
+import time
+import unittest
+import numpy as np
+from src.models.direction import Direction
+from src.simulation.event_driven import EventDrivenBridge
+from src.utils.arrival_format import ArrivalColumns
+from src.utils.result_cache import ResultCache, cache_key, hash_arrivals
+
+class TestResultCache(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.cache = ResultCache(self.directory.name)
+        self.cars_data = [(float(i), i, Direction.LEFT_TO_RIGHT if i % 2 else Direction.RIGHT_TO_LEFT)
+                          for i in range(10)]
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_key_depends_on_data_and_params(self):
+        """Другие данные или параметры дают другой ключ"""
+        data_hash = hash_arrivals(self.cars_data)
+        key = cache_key(data_hash, {'mode': 'event', 'max_consecutive': 3})
+        self.assertEqual(key, cache_key(hash_arrivals(list(self.cars_data)), {'max_consecutive': 3, 'mode': 'event'}))
+        self.assertNotEqual(key, cache_key(data_hash, {'mode': 'event', 'max_consecutive': 5}))
+
+        changed = self.cars_data[:-1] + [(9.5, 9, Direction.LEFT_TO_RIGHT)]
+        self.assertNotEqual(data_hash, hash_arrivals(changed))
+        with_crossing = [car + (2.0,) for car in self.cars_data]
+        self.assertNotEqual(data_hash, hash_arrivals(with_crossing))
+
+        columns = ArrivalColumns(np.arange(3.0), np.arange(3), np.zeros(3, dtype=np.uint8))
+        self.assertEqual(hash_arrivals(columns), hash_arrivals(columns[:]))
+
+    def test_roundtrip(self):
+        """Статистика и результаты по машинам возвращаются без изменений"""
+        stats = EventDrivenBridge().simulate(self.cars_data)
+        cars = [[1, 'left_to_right', 0.0, 1.0]]
+        self.assertIsNone(self.cache.get('missing'))
+
+        self.cache.put('run', stats, cars=cars, params={'mode': 'event'})
+        entry = self.cache.get('run')
+        self.assertEqual(entry['stats'], stats)
+        self.assertEqual(entry['cars'], cars)
+        self.assertEqual(entry['params'], {'mode': 'event'})
+
+    def test_lru_eviction(self):
+        """При переполнении удаляются записи, к которым дольше всего не обращались"""
+        stats = {'total_crossed': 1, 'padding': 'x' * 1000}
+        self.cache.put('first', stats)
+        entry_size = self.cache.size()
+        cache = ResultCache(self.directory.name, max_bytes=int(entry_size * 2.5))
+        cache.put('second', stats)
+        # Обращение делает первую запись самой свежей
+        past = time.time() - 10
+        os.utime(os.path.join(self.directory.name, 'second.json'), (past, past))
+        os.utime(os.path.join(self.directory.name, 'first.json'), (past - 10, past - 10))
+        self.assertIsNotNone(cache.get('first'))
+
+        cache.put('third', stats)
+        self.assertIsNone(cache.get('second'))
+        self.assertIsNotNone(cache.get('first'))
+        self.assertIsNotNone(cache.get('third'))
+        self.assertLessEqual(cache.size(), cache.max_bytes)
+
+    def test_corrupted_entry_is_dropped(self):
+        with open(os.path.join(self.directory.name, 'broken.json'), 'w') as file:
+            file.write('{"stats": ')
+        self.assertIsNone(self.cache.get('broken'))
+        self.assertEqual(self.cache.entries(), [])
+
+if __name__ == '__main__':
+    unittest.main()
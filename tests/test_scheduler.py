@@ -0,0 +1,54 @@
+import threading
+import time
+import unittest
+from src.models.bridge import Bridge
+from src.models.direction import Direction
+from src.simulation.scheduler import CarScheduler
+from src.utils.clock import VirtualClock
+from src.utils.latch import CountDownLatch
+
+class TestCountDownLatch(unittest.TestCase):
+    def test_wait_returns_when_count_reaches_zero(self):
+        latch = CountDownLatch(2)
+        self.assertFalse(latch.wait(timeout=0.01))
+
+        threading.Timer(0.05, latch.count_down).start()
+        threading.Timer(0.05, latch.count_down).start()
+        self.assertTrue(latch.wait(timeout=5.0))
+        with self.assertRaises(ValueError):
+            latch.count_down()
+
+class TestCarScheduler(unittest.TestCase):
+    def setUp(self):
+        self.cars_data = [(i * 0.5, i, Direction.LEFT_TO_RIGHT if i % 2 else Direction.RIGHT_TO_LEFT)
+                          for i in range(20)]
+
+    def test_completion_and_progress(self):
+        """Завершение замечается без опроса, прогресс приходит по каждой машине"""
+        progress = []
+        scheduler = CarScheduler(self.cars_data, Bridge(clock=VirtualClock()),
+                                 on_progress=lambda crossed, total: progress.append((crossed, total)))
+        scheduler.run()
+
+        start = time.perf_counter()
+        self.assertTrue(scheduler.wait_completion(timeout=10.0))
+        self.assertLess(time.perf_counter() - start, 1.0)
+        self.assertEqual(scheduler.get_completed_cars(), 20)
+        self.assertEqual(sorted(progress), [(crossed, 20) for crossed in range(1, 21)])
+
+    def test_wait_for_subset(self):
+        """Можно дождаться отдельных машин, не дожидаясь остальных"""
+        scheduler = CarScheduler(self.cars_data[:3], Bridge())
+        runner = threading.Thread(target=scheduler.run)
+        runner.start()
+
+        self.assertFalse(scheduler.wait_for([2], timeout=0.1))
+        self.assertTrue(scheduler.wait_for([0], timeout=5.0))
+        self.assertLess(scheduler.get_completed_cars(), 3)
+        self.assertTrue(scheduler.wait_for([1, 2], timeout=10.0))
+        self.assertTrue(scheduler.wait_completion(timeout=5.0))
+        runner.join()
+        self.assertEqual(scheduler._subset_latches, {})
+
+if __name__ == '__main__':
+    unittest.main()
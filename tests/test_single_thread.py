@@ -92,6 +92,29 @@ class TestSingleThreadedBridge(unittest.TestCase):
         self.assertLess(stats['max_waiting_time'], 
                        len(cars_data) * 1.1)  # Не больше чем время проезда всех машин
 
+    def test_capacity_and_headway(self):
+        """Попутные машины едут одновременно через headway, встречная ждет пустого моста"""
+        cars_data = [
+            (0, 1, Direction.LEFT_TO_RIGHT),
+            (0, 2, Direction.LEFT_TO_RIGHT),
+            (0, 3, Direction.LEFT_TO_RIGHT),
+            (0.1, 4, Direction.RIGHT_TO_LEFT),
+        ]
+        bridge = SingleThreadedBridge(capacity=3, headway=0.5)
+        stats = bridge.simulate(cars_data)
+
+        # Въезды в 0, 0.5 и 1.0; мост пустеет в 2.0
+        self.assertEqual(stats['direction_stats']['left_to_right']['max_waiting_time'], 1.0)
+        self.assertAlmostEqual(stats['direction_stats']['right_to_left']['max_waiting_time'], 1.9)
+        throughput = stats['throughput']
+        self.assertEqual(throughput['busy_time'], 3.0)
+        self.assertEqual(throughput['serial_busy_time'], 4.0)
+        self.assertAlmostEqual(throughput['throughput_gain'], 4 / 3)
+
+        self.assertEqual(self.bridge.simulate(cars_data)['throughput']['throughput_gain'], 1.0)
+        with self.assertRaises(ValueError):
+            SingleThreadedBridge(capacity=0)
+
     def test_empty_input(self):
         """Тест пустых входных данных"""
         stats = self.bridge.simulate([])
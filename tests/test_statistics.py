@@ -0,0 +1,79 @@
+import math
+import random
+import statistics
+import unittest
+from src.models.direction import Direction
+from src.utils.statistics import CrossingStatistics, LogHistogram, RunningStats
+
+class TestStatistics(unittest.TestCase):
+    def setUp(self):
+        random.seed(7)
+        self.values = [random.expovariate(0.5) for _ in range(10000)]
+
+    def test_running_stats(self):
+        """Онлайн-моменты совпадают с точным расчетом"""
+        stats = RunningStats()
+        for value in self.values:
+            stats.add(value)
+
+        self.assertEqual(stats.count, len(self.values))
+        self.assertAlmostEqual(stats.mean, statistics.fmean(self.values))
+        self.assertAlmostEqual(stats.std, statistics.pstdev(self.values))
+        self.assertEqual(stats.max, max(self.values))
+
+    def test_running_stats_merge(self):
+        """Объединение частичных статистик равно общей"""
+        left, right = RunningStats(), RunningStats()
+        for index, value in enumerate(self.values):
+            (left if index % 3 else right).add(value)
+        left.merge(right)
+
+        self.assertEqual(left.count, len(self.values))
+        self.assertAlmostEqual(left.mean, statistics.fmean(self.values))
+        self.assertAlmostEqual(left.variance, statistics.pvariance(self.values))
+
+    def test_histogram_quantiles(self):
+        """Квантили гистограммы в пределах относительной погрешности"""
+        histogram = LogHistogram()
+        for value in self.values:
+            histogram.add(value)
+        histogram.add(0.0)
+
+        ordered = sorted(self.values + [0.0])
+        result = histogram.quantiles([0.5, 0.95, 0.99])
+        for fraction, value in result.items():
+            exact = ordered[max(1, math.ceil(fraction * len(ordered))) - 1]
+            self.assertLess(abs(value - exact) / exact, 1 / LogHistogram.SUB_BUCKETS)
+
+    def test_crossing_statistics_keys(self):
+        """Ключи статистики совместимы с прежним форматом"""
+        crossing_stats = CrossingStatistics()
+        for index, value in enumerate(self.values[:100]):
+            direction = Direction.LEFT_TO_RIGHT if index % 2 else Direction.RIGHT_TO_LEFT
+            crossing_stats.record_wait(direction, value)
+            crossing_stats.record_crossing(direction, 1.0)
+
+        stats = crossing_stats.get_statistics()
+
+        self.assertEqual(stats['total_crossed'], 100)
+        self.assertEqual(stats['avg_crossing_time'], 1.0)
+        self.assertAlmostEqual(stats['avg_waiting_time'], statistics.fmean(self.values[:100]))
+        self.assertEqual(stats['max_waiting_time'], max(self.values[:100]))
+        self.assertLessEqual(stats['p50_waiting_time'], stats['p99_waiting_time'])
+        for direction in Direction:
+            dir_stats = stats['direction_stats'][direction.value]
+            self.assertEqual(dir_stats['total_crossed'], 50)
+            self.assertIn('avg_waiting_time', dir_stats)
+            self.assertIn('p95_waiting_time', dir_stats)
+
+    def test_empty_statistics(self):
+        """Пустая статистика дает нули"""
+        stats = CrossingStatistics().get_statistics()
+
+        self.assertEqual(stats['total_crossed'], 0)
+        self.assertEqual(stats['avg_waiting_time'], 0)
+        self.assertEqual(stats['max_waiting_time'], 0)
+        self.assertEqual(stats['p99_waiting_time'], 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+import csv
+import json
+import os
+import tempfile
+import unittest
+from src.models.direction import Direction
+from src.simulation.sweep import ResultTable, SweepCase, build_grid, run_case, run_sweep
+
+class TestSweep(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.input_file = os.path.join(self.temp_dir.name, 'input.csv')
+        with open(self.input_file, 'w') as f:
+            f.write("arrival_time,car_id,direction\n")
+            for car_id in range(20):
+                direction = Direction.LEFT_TO_RIGHT if car_id % 3 else Direction.RIGHT_TO_LEFT
+                f.write(f"{car_id * 0.5},{car_id},{direction.value}\n")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def output(self, name):
+        return os.path.join(self.temp_dir.name, name)
+
+    def test_build_grid(self):
+        """Сетка — декартово произведение параметров"""
+        cases = build_grid([self.input_file], ['single', 'event'], [1, 3, 5], ['none', 'left_to_right'])
+        self.assertEqual(len(cases), 12)
+        self.assertEqual(len({case.key for case in cases}), 12)
+
+    def test_parameters_change_result(self):
+        """Параметры прогона доходят до движка"""
+        base = run_case(SweepCase(self.input_file))
+        faster = run_case(SweepCase(self.input_file, arrival_rate=2.0))
+        slower = run_case(SweepCase(self.input_file, crossing_time=2.0))
+
+        self.assertEqual(base['total_crossed'], 20)
+        self.assertGreater(faster['avg_waiting_time'], base['avg_waiting_time'])
+        self.assertGreater(slower['avg_waiting_time'], base['avg_waiting_time'])
+
+    def test_sweep_is_resumable(self):
+        """Повторный запуск выполняет только недостающие прогоны"""
+        output = self.output('results.csv')
+        cases = build_grid([self.input_file], max_consecutive=[1, 2, 3])
+
+        self.assertEqual(run_sweep(cases[:2], output, workers=2), 2)
+
+        # Прерванная запись последней строки
+        with open(output, 'a') as f:
+            f.write('partial')
+
+        self.assertEqual(run_sweep(cases, output, workers=2), 1)
+        self.assertEqual(run_sweep(cases, output, workers=2), 0)
+
+        with open(output, newline='') as f:
+            rows = list(csv.DictReader(f))
+        self.assertEqual(sorted(row['max_consecutive'] for row in rows), ['1', '2', '3'])
+
+    def test_jsonl_output(self):
+        """Результаты в формате JSON Lines"""
+        output = self.output('results.jsonl')
+        run_sweep(build_grid([self.input_file], priority_directions=['none', 'right_to_left']), output, workers=1)
+
+        with open(output) as f:
+            rows = [json.loads(line) for line in f]
+        self.assertEqual(len(rows), 2)
+        self.assertEqual(ResultTable(output).completed_keys(), {row['key'] for row in rows})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+import os
+import random
+import tempfile
+import unittest
+import numpy as np
+from src.models.bridge import Bridge
+from src.models.direction import Direction
+from src.simulation.event_driven import EventDrivenBridge
+from src.simulation.replay import cars_from_trace, compare_decisions, replay
+from src.simulation.scheduler import CarScheduler
+from src.simulation.single_threaded import SingleThreadedBridge
+from src.utils.clock import VirtualClock
+from src.utils.trace import TRACE_DTYPE, Trace, TraceEvent, TraceRecorder, load_trace
+
+class TestTrace(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(2)
+        # Разные нецелые моменты прибытия, чтобы и потоки не встречались в один момент
+        times = sorted(rng.sample(range(1, 3000), 60))
+        self.cars_data = [
+            (t / 89, car_id, rng.choice(list(Direction)), rng.choice([0.7, 1.0, 1.3]))
+            for car_id, t in enumerate(times)
+        ]
+        self.metadata = {'policy': 'alternating', 'priority_direction': 'right_to_left', 'max_consecutive': 2}
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, 'trace.bin')
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def record(self, engine_cls=EventDrivenBridge):
+        with TraceRecorder(self.path, self.metadata, chunk_size=16) as recorder:
+            engine_cls(Direction.RIGHT_TO_LEFT, 2, trace=recorder).simulate(self.cars_data)
+        return load_trace(self.path)
+
+    def test_file_round_trip(self):
+        """Трасса пишется кусками и читается через memmap вместе с метаданными"""
+        trace = self.record()
+        self.assertIsInstance(trace.events, np.memmap)
+        self.assertEqual(trace.events.dtype, TRACE_DTYPE)
+        self.assertEqual(TRACE_DTYPE.itemsize, 18)
+        self.assertEqual(trace.metadata, self.metadata)
+        for kind in (TraceEvent.ARRIVE, TraceEvent.ADMIT, TraceEvent.DEPART):
+            self.assertEqual(len(trace.of_kind(kind)), len(self.cars_data))
+
+        # Смена направления записывается перед въездом машины
+        directions = trace.of_kind(TraceEvent.ADMIT)['direction']
+        switches = 1 + int(np.count_nonzero(directions[1:] != directions[:-1]))
+        self.assertEqual(len(trace.of_kind(TraceEvent.SWITCH)), switches)
+
+    def test_cars_from_trace(self):
+        """Прибытия и время проезда восстанавливаются из трассы"""
+        cars = cars_from_trace(self.record())
+        for (arrival, car_id, direction, crossing), expected in zip(cars, self.cars_data):
+            self.assertEqual((arrival, car_id, direction), expected[:3])
+            self.assertAlmostEqual(crossing, expected[3])
+
+    def test_replay_reproduces_decisions(self):
+        """Все движки повторяют решения по трассе"""
+        for recorded_by in (EventDrivenBridge, SingleThreadedBridge):
+            trace = self.record(recorded_by)
+            for engine in ('single', 'event', 'threaded'):
+                self.assertIsNone(compare_decisions(trace.events, replay(trace, engine)), engine)
+
+    def test_platoon_trace_is_replayed_with_platoons(self):
+        """Трасса колонн воспроизводится многопоточным мостом с тем же platoon_size"""
+        metadata = dict(self.metadata, platoon_size=3)
+        with TraceRecorder(self.path, metadata) as recorder:
+            bridge = Bridge(Direction.RIGHT_TO_LEFT, clock=VirtualClock(), trace=recorder, platoon_size=3)
+            bridge.MAX_CONSECUTIVE = 2
+            scheduler = CarScheduler(self.cars_data, bridge)
+            scheduler.run()
+            self.assertTrue(scheduler.wait_completion(60))
+        trace = load_trace(self.path)
+
+        self.assertIsNone(compare_decisions(trace.events, replay(trace, 'threaded')))
+        for engine in ('single', 'event'):
+            with self.assertRaises(ValueError):
+                replay(trace, engine)
+
+    def test_divergence_is_reported(self):
+        """Другая политика дает расхождение с номером первого решения"""
+        trace = self.record()
+        other = Trace(trace.events, dict(self.metadata, policy='fifo', priority_direction=None))
+        mismatch = compare_decisions(trace.events, replay(other))
+        self.assertIsNotNone(mismatch)
+        self.assertTrue(mismatch.startswith("Decision"))
+
+    def test_in_memory_recorder(self):
+        recorder = TraceRecorder(chunk_size=5)
+        SingleThreadedBridge(trace=recorder).simulate(self.cars_data[:10])
+        events = recorder.events()
+        self.assertGreaterEqual(len(events), 30)
+        self.assertTrue(np.all(np.diff(events[events['kind'] == TraceEvent.ADMIT]['time']) > 0))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+from src.models.direction import Direction
+from src.utils.arrival_format import load_arrivals
+from src.utils.input_reader import InputReader
+from src.utils.workload import (MMPP, NonHomogeneousPoisson, Poisson, WorkloadGenerator,
+                                parse_process, write_binary, write_csv)
+
+class TestWorkloadGenerator(unittest.TestCase):
+    def test_chunks_are_sorted_and_reproducible(self):
+        """Куски стыкуются по времени и номерам, одинаковое зерно дает те же данные"""
+        for spec in ('poisson:2.0', 'rush:0.5,3.0,240', 'nhpp:10,1,0.2,4', 'mmpp:0.1,5,20,5'):
+            generator = WorkloadGenerator(parse_process(spec), seed=7, chunk_size=1000)
+            columns = generator.generate(5500)
+            self.assertEqual(len(columns), 5500, spec)
+            self.assertTrue(columns.is_sorted(), spec)
+            self.assertTrue(np.all(np.diff(columns.arrival_times) >= 0), spec)
+            np.testing.assert_array_equal(columns.car_ids, np.arange(5500))
+            again = WorkloadGenerator(parse_process(spec), seed=7, chunk_size=1000).generate(5500)
+            np.testing.assert_array_equal(columns.arrival_times, again.arrival_times)
+
+        with self.assertRaises(ValueError):
+            parse_process('uniform:1')
+
+    def test_rates_and_imbalance(self):
+        """Средняя интенсивность, часы пик, пачки и доля направлений"""
+        columns = WorkloadGenerator(Poisson(4.0), left_share=0.8, seed=1).generate(200_000)
+        self.assertAlmostEqual(len(columns) / columns.arrival_times[-1], 4.0, delta=0.05)
+        self.assertAlmostEqual(np.mean(columns.directions == 0), 0.8, delta=0.01)
+
+        # В часы пик (7-9 и 17-19 из 24) интенсивность вдесятеро выше
+        rush = NonHomogeneousPoisson.rush_hours(1.0, 10.0, period=24.0)
+        times = WorkloadGenerator(rush, seed=2).generate(100_000).arrival_times
+        hours = np.bincount((times % 24).astype(int), minlength=24)
+        self.assertAlmostEqual(hours[[7, 8, 17, 18]].mean() / hours[:6].mean(), 10.0, delta=0.5)
+
+        # Пачечный поток: дисперсия числа прибытий за интервал больше среднего
+        times = WorkloadGenerator(MMPP(0.5, 10.0, 50.0, 5.0), seed=3).generate(100_000).arrival_times
+        counts = np.bincount(times.astype(int))
+        self.assertGreater(counts.var() / counts.mean(), 5.0)
+
+    def test_written_files_are_readable(self):
+        """CSV и бинарный файл читаются как обычные входные данные"""
+        generator = WorkloadGenerator(Poisson(1.0), seed=4, chunk_size=300)
+        expected = generator.generate(1000)
+        with tempfile.TemporaryDirectory() as directory:
+            csv_path = os.path.join(directory, 'cars.csv')
+            binary_path = os.path.join(directory, 'cars.arr')
+            self.assertEqual(write_csv(csv_path, generator.chunks(1000)), 1000)
+            self.assertEqual(write_binary(binary_path, generator.chunks(1000)), 1000)
+
+            cars = InputReader.read_cars_data(csv_path)
+            self.assertEqual(cars, list(expected))
+            self.assertIsInstance(cars[0][2], Direction)
+            np.testing.assert_array_equal(load_arrivals(binary_path).arrival_times, expected.arrival_times)
+
+if __name__ == '__main__':
+    unittest.main()